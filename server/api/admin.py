@@ -0,0 +1,29 @@
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from core.config import ADMIN_TOKEN
+from core.words import reload_dictionary
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+def require_admin(token: Optional[str]):
+    if not ADMIN_TOKEN or not token or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
+@router.post("/reload_dictionary")
+async def reload_dictionary_endpoint(x_admin_token: Optional[str] = Header(None)):
+    """
+    사전을 다시 로드하고 새 버전으로 교체합니다.
+    진행 중인 게임은 시작 시점의 버전을 계속 사용합니다.
+    """
+    require_admin(x_admin_token)
+    logger.info("Dictionary reload requested")
+    try:
+        report = await reload_dictionary()
+    except Exception as e:
+        logger.error(f"Dictionary reload failed: {e}")
+        raise HTTPException(status_code=500, detail="사전 로드에 실패했습니다.")
+    return {"status": "success", **report}
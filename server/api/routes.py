@@ -1,16 +1,22 @@
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
-from core.words import get_word_in_cache
+import json
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from core.config import PATTERN_SEARCH_MAX_RESULTS, PATTERN_SEARCH_TIME_BUDGET
+from core.korean_utils import compose_word
+from core.words import get_word_in_cache, pattern_search
 from .auth import router as auth_router
 from core.database import get_user_by_uuid
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
 from .rooms import router as rooms_router
+from .admin import router as admin_router, require_admin
 
 router = APIRouter()
 router.include_router(auth_router)
 router.include_router(rooms_router)
+router.include_router(admin_router)
 
 @router.get("/loginTest")
 async def loginTest():
@@ -39,3 +45,31 @@ async def get_user(user_uuid: str):
 async def get_word(word: str):
     return get_word_in_cache(word)
 
+@router.get("/search_words")
+async def search_words(pattern: str, lang: str = "en", after: Optional[str] = None, limit: int = 100,
+                       x_admin_token: Optional[str] = Header(None)):
+    """
+    와일드카드 패턴으로 단어를 검색합니다 (? = 한 글자, * = 0글자 이상).
+    결과는 NDJSON으로 찾는 즉시 전송되며, 마지막 줄의 next를 after로 넘기면 다음 페이지를 받습니다.
+    """
+    require_admin(x_admin_token)
+    if not pattern or len(pattern) > 64:
+        raise HTTPException(status_code=400, detail="패턴은 1~64자여야 합니다.")
+    search = pattern_search(pattern, lang, after)
+    if search is None:
+        raise HTTPException(status_code=503, detail="사전이 아직 준비되지 않았습니다.")
+    limit = max(1, min(limit, PATTERN_SEARCH_MAX_RESULTS))
+
+    async def lines():
+        async for word in search.stream(limit, PATTERN_SEARCH_TIME_BUDGET):
+            item = {"word": word}
+            if lang == "ko":
+                item["display"] = compose_word(word)
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+        yield json.dumps({
+            "done": search.stopped is None,
+            "stopped": search.stopped,
+            "next": search.cursor if search.stopped else None,
+        }, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -0,0 +1,122 @@
+"""
+Anagram Signature Index
+
+Which words can a rack of tiles spell? Order does not matter on a rack,
+so every word is reduced to its signature: its letters (jamo for Korean)
+sorted, e.g. CARE -> ACER. A rack can spell a word iff the word's
+signature is a sub-multiset of the rack.
+
+The index keeps the distinct signatures of words that fit on a rack in
+one sorted list. A query walks the sub-multisets of the sorted rack
+depth-first, one letter at a time in sorted order, and bisects the list
+to check that some signature still starts with the letters picked so
+far; dead prefixes are cut at once, so the walk visits far fewer than
+the 2^10 subsets of a full rack. Blanks (and free slots the caller may
+still fill) extend a prefix with any letter that keeps it alive.
+
+Every query stops after max_nodes prefixes, so its cost is bounded no
+matter the rack.
+"""
+
+import random
+import sys
+from bisect import bisect_left
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def signature(word: str) -> str:
+    """Sorted letters of word: equal for all anagrams."""
+    return ''.join(sorted(word))
+
+
+class SignatureIndex:
+    """
+    Sorted distinct signatures of the words of min_length..max_length letters.
+
+    Attributes:
+        source: The word collection the index was built from (for staleness checks)
+        alphabet: Sorted letters that occur in any signature
+    """
+
+    def __init__(self, words: Iterable[str], min_length: int = 2, max_length: int = 10, source=None):
+        self.source = source
+        self.min_length = min_length
+        self.max_length = max_length
+        self.signatures: List[str] = sorted({signature(w) for w in words if min_length <= len(w) <= max_length})
+        self.alphabet: List[str] = sorted({char for sig in self.signatures for char in sig})
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _alive(self, prefix: str) -> bool:
+        """True if some signature starts with prefix."""
+        signatures = self.signatures
+        i = bisect_left(signatures, prefix)
+        return i < len(signatures) and signatures[i].startswith(prefix)
+
+    def _is_signature(self, sig: str) -> bool:
+        signatures = self.signatures
+        i = bisect_left(signatures, sig)
+        return i < len(signatures) and signatures[i] == sig
+
+    def find(self, tiles: Iterable[str], blank: str = None, free: int = 0, max_nodes: int = 2000,
+             rng: random.Random = None) -> Optional[Tuple[str, str]]:
+        """
+        A signature the tiles can spell, with up to free extra tiles of any letter.
+
+        Args:
+            tiles: Rack letters; None entries are skipped, blank entries act as any letter
+            free: Empty slots the caller can still fill with any letter
+            max_nodes: Prefixes to try before giving up
+            rng: If given, wildcard letters are tried in random order (else alphabetical)
+
+        Returns:
+            (signature, wildcard letters) - the letters the blanks and free slots
+            stand for - or None if nothing was found within max_nodes.
+        """
+        counts = Counter(t for t in tiles if t is not None)
+        wild = free + (counts.pop(blank, 0) if blank is not None else 0)
+        letters = sorted(counts)
+        alphabet = self.alphabet
+        if rng is not None:
+            alphabet = alphabet[:]
+            rng.shuffle(alphabet)
+        budget = [max_nodes]
+
+        def walk(prefix: str, start: str, wild: int, filled: str) -> Optional[Tuple[str, str]]:
+            if len(prefix) >= self.min_length and self._is_signature(prefix):
+                return prefix, filled
+            if len(prefix) >= self.max_length:
+                return None
+            # Rack letters first, then wildcards; letters stay >= start to keep prefixes sorted
+            options = [(char, False) for char in letters if char >= start and counts[char]]
+            if wild:
+                options += [(char, True) for char in alphabet if char >= start]
+            for char, is_wild in options:
+                if budget[0] <= 0:
+                    return None
+                budget[0] -= 1
+                nxt = prefix + char
+                if not self._alive(nxt):
+                    continue
+                if is_wild:
+                    found = walk(nxt, char, wild - 1, filled + char)
+                else:
+                    counts[char] -= 1
+                    found = walk(nxt, char, wild, filled)
+                    counts[char] += 1
+                if found:
+                    return found
+            return None
+
+        found = walk('', '', wild, '')
+        logger.debug(f"SignatureIndex.find: {found} ({max_nodes - budget[0]} prefixes)")
+        return found
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the signature list and its strings."""
+        return sys.getsizeof(self.signatures) + sum(sys.getsizeof(s) for s in self.signatures)
@@ -0,0 +1,357 @@
+"""
+Board Index (coordinate lookups over confirmed and pending tiles)
+
+GameRoom keeps confirmed tiles in a dict keyed by (x, y) but pending tiles
+in a list, in placement order (clients receive the list as is). Lookups by
+coordinate used to scan that list, or copy the board and the pending tiles
+into a fresh dict for every word read.
+
+PendingTiles is that list with a coordinate index that every mutation keeps
+up to date, and BoardView reads the board and a layer of pending tiles as
+one (x, y) -> letter mapping without copying either.
+
+Board is the confirmed-tile dict with a RunIndex per axis: the maximal runs
+of occupied cells of every row and column, as sorted interval lists kept up
+to date on every placement and removal. Finding the word through a cell is
+then one bisect per board run instead of one dict lookup per letter.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Position = Tuple[int, int]
+
+_MISSING = object()
+
+
+def _position(tile: Dict) -> Position:
+    return (tile['x'], tile['y'])
+
+
+class PendingTiles(list):
+    """
+    List of pending tile dicts ({'x', 'y', 'letter', ...}), indexed by coordinate.
+
+    Attributes:
+        by_position: (x, y) -> the pending tile there (the first one, should two share it)
+    """
+
+    def __init__(self, tiles: Iterable[Dict] = ()):
+        super().__init__(tiles)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        # Built in reverse so the first tile at a position wins
+        self.by_position: Dict[Position, Dict] = {(tile['x'], tile['y']): tile for tile in reversed(self)}
+        self._shadowed = len(self) - len(self.by_position)  # tiles hidden behind another at their position
+
+    def _index(self, tile: Dict) -> None:
+        if self.by_position.setdefault(_position(tile), tile) is not tile:
+            self._shadowed += 1
+
+    def _forget(self, tile: Dict) -> None:
+        pos = _position(tile)
+        if self.by_position.get(pos) is not tile:
+            self._shadowed -= 1
+            return
+        del self.by_position[pos]
+        if self._shadowed:
+            # Rare: a hidden tile at the same position takes over
+            for other in self:
+                if _position(other) == pos:
+                    self.by_position[pos] = other
+                    self._shadowed -= 1
+                    break
+
+    def tile_at(self, x: int, y: int) -> Optional[Dict]:
+        return self.by_position.get((x, y))
+
+    def append(self, tile: Dict) -> None:
+        super().append(tile)
+        self._index(tile)
+
+    def extend(self, tiles: Iterable[Dict]) -> None:
+        for tile in tiles:
+            self.append(tile)
+
+    def insert(self, index: int, tile: Dict) -> None:
+        super().insert(index, tile)
+        self._reindex()
+
+    def remove(self, tile: Dict) -> None:
+        super().remove(tile)
+        self._forget(tile)
+
+    def pop(self, index: int = -1) -> Dict:
+        tile = super().pop(index)
+        self._forget(tile)
+        return tile
+
+    def clear(self) -> None:
+        super().clear()
+        self.by_position.clear()
+        self._shadowed = 0
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    def __iadd__(self, tiles: Iterable[Dict]) -> 'PendingTiles':
+        self.extend(tiles)
+        return self
+
+
+class RunIndex:
+    """
+    Maximal runs of occupied cells along one axis, per line, with their letters.
+
+    For rows (horizontal runs) a line is a y and positions along it are x;
+    for columns the other way round. Each line keeps its runs as sorted
+    lists of start and end coordinates (inclusive) and the run's text, so
+    finding a run is one bisect and reading it is one slice.
+    """
+
+    def __init__(self, horizontal: bool):
+        self.horizontal = horizontal
+        self._lines: Dict[int, Tuple[List[int], List[int], List[str]]] = {}
+
+    def _split(self, pos: Position) -> Tuple[int, int]:
+        """(line, coordinate along the line) of pos."""
+        return (pos[1], pos[0]) if self.horizontal else (pos[0], pos[1])
+
+    def _find(self, line: int, coord: int):
+        """(runs of line, index of the run covering coord or -1)."""
+        runs = self._lines.get(line)
+        if runs is None:
+            return None, -1
+        i = bisect_right(runs[0], coord) - 1
+        return runs, (i if i >= 0 and runs[1][i] >= coord else -1)
+
+    def run(self, line: int, coord: int) -> Optional[Tuple[int, int]]:
+        """(start, end) of the run on line that covers coord, or None."""
+        runs, i = self._find(line, coord)
+        return None if i < 0 else (runs[0][i], runs[1][i])
+
+    def text(self, line: int, start: int, end: int) -> str:
+        """Letters from start to end (inclusive), which must lie in one run."""
+        runs, i = self._find(line, start)
+        offset = start - runs[0][i]
+        return runs[2][i][offset:offset + end - start + 1]
+
+    def add(self, pos: Position, letter: str) -> None:
+        """Mark pos occupied by letter (or replace its letter)."""
+        line, c = self._split(pos)
+        starts, ends, texts = self._lines.setdefault(line, ([], [], []))
+        i = bisect_right(starts, c) - 1
+        if i >= 0 and ends[i] >= c:
+            k = c - starts[i]
+            texts[i] = texts[i][:k] + letter + texts[i][k + 1:]
+            return
+        joins_left = i >= 0 and ends[i] == c - 1
+        joins_right = i + 1 < len(starts) and starts[i + 1] == c + 1
+        if joins_left and joins_right:
+            ends[i] = ends[i + 1]
+            texts[i] = texts[i] + letter + texts[i + 1]
+            del starts[i + 1], ends[i + 1], texts[i + 1]
+        elif joins_left:
+            ends[i] = c
+            texts[i] += letter
+        elif joins_right:
+            starts[i + 1] = c
+            texts[i + 1] = letter + texts[i + 1]
+        else:
+            starts.insert(i + 1, c)
+            ends.insert(i + 1, c)
+            texts.insert(i + 1, letter)
+
+    def remove(self, pos: Position) -> None:
+        line, c = self._split(pos)
+        runs, i = self._find(line, c)
+        if i < 0:
+            return
+        starts, ends, texts = runs
+        start, end, text = starts[i], ends[i], texts[i]
+        k = c - start
+        if start == end:
+            del starts[i], ends[i], texts[i]
+            if not starts:
+                del self._lines[line]
+        elif c == start:
+            starts[i] = c + 1
+            texts[i] = text[1:]
+        elif c == end:
+            ends[i] = c - 1
+            texts[i] = text[:-1]
+        else:
+            ends[i] = c - 1
+            texts[i] = text[:k]
+            starts.insert(i + 1, c + 1)
+            ends.insert(i + 1, end)
+            texts.insert(i + 1, text[k + 1:])
+
+    def clear(self) -> None:
+        self._lines.clear()
+
+
+class Board(dict):
+    """
+    Confirmed tiles, (x, y) -> tile dict, with row and column RunIndexes.
+
+    Tiles are indexed by the letter they had when stored: replace a tile
+    (board[pos] = tile) rather than editing its 'letter' in place.
+
+    Attributes:
+        rows: Horizontal runs, per y
+        columns: Vertical runs, per x
+    """
+
+    def __init__(self, tiles=()):
+        super().__init__(tiles)
+        self.rows = RunIndex(horizontal=True)
+        self.columns = RunIndex(horizontal=False)
+        for pos, tile in self.items():
+            self._index(pos, tile)
+
+    def _index(self, pos: Position, tile: Dict) -> None:
+        self.rows.add(pos, tile['letter'])
+        self.columns.add(pos, tile['letter'])
+
+    def _forget(self, pos: Position) -> None:
+        self.rows.remove(pos)
+        self.columns.remove(pos)
+
+    def runs(self, dx: int) -> RunIndex:
+        return self.rows if dx else self.columns
+
+    def __setitem__(self, pos: Position, tile: Dict) -> None:
+        super().__setitem__(pos, tile)
+        self._index(pos, tile)
+
+    def __delitem__(self, pos: Position) -> None:
+        super().__delitem__(pos)
+        self._forget(pos)
+
+    def pop(self, pos: Position, default=_MISSING):
+        if pos in self:
+            self._forget(pos)
+            return super().pop(pos)
+        if default is _MISSING:
+            raise KeyError(pos)
+        return default
+
+    def popitem(self) -> Tuple[Position, Dict]:
+        pos, tile = super().popitem()
+        self._forget(pos)
+        return pos, tile
+
+    def setdefault(self, pos: Position, tile: Dict) -> Dict:
+        if pos not in self:
+            self[pos] = tile
+        return self[pos]
+
+    def update(self, *args, **kwargs) -> None:
+        for pos, tile in dict(*args, **kwargs).items():
+            self[pos] = tile
+
+    def clear(self) -> None:
+        super().clear()
+        self.rows.clear()
+        self.columns.clear()
+
+
+class BoardView:
+    """
+    A board and a layer of pending tiles read as one (x, y) -> letter mapping.
+
+    Both are referenced, not copied, so the view always shows their current
+    tiles; board tiles shadow pending ones at the same position. Letters
+    assigned to the view (e.g. resolved blanks) go to its own overlay, which
+    shadows both, and never touch the tiles.
+    """
+
+    __slots__ = ('board', 'pending', 'letters')
+
+    def __init__(self, board: Dict[Position, Dict], pending: Dict[Position, Dict]):
+        self.board = board
+        self.pending = pending
+        self.letters: Dict[Position, str] = {}
+
+    def __contains__(self, pos: Position) -> bool:
+        return pos in self.letters or pos in self.pending or pos in self.board
+
+    def __getitem__(self, pos: Position) -> str:
+        letter = self.letters.get(pos)
+        if letter is not None:
+            return letter
+        tile = self.board.get(pos)
+        if tile is None:
+            tile = self.pending[pos]
+        return tile['letter']
+
+    def __setitem__(self, pos: Position, letter: str) -> None:
+        self.letters[pos] = letter
+
+    def get(self, pos: Position, default: Optional[str] = None) -> Optional[str]:
+        return self[pos] if pos in self else default
+
+    def run_through(self, x: int, y: int, dx: int, dy: int) -> Tuple[Position, Position]:
+        """
+        (first, last) cell of the occupied run through (x, y) along (dx, dy).
+
+        Board runs are skipped whole with one RunIndex lookup; only the
+        pending cells in between are stepped over one at a time. A plain
+        dict board (no index) is stepped cell by cell.
+        """
+        board = self.board
+        runs = board.runs(dx) if isinstance(board, Board) else None
+        if dx:
+            line, lo = y, x
+        else:
+            line, lo = x, y
+        hi = lo
+        while True:
+            run = runs.run(line, lo - 1) if runs is not None else None
+            if run is not None:
+                lo = run[0]
+            elif ((lo - 1, line) if dx else (line, lo - 1)) in self:
+                lo -= 1
+            else:
+                break
+        while True:
+            run = runs.run(line, hi + 1) if runs is not None else None
+            if run is not None:
+                hi = run[1]
+            elif ((hi + 1, line) if dx else (line, hi + 1)) in self:
+                hi += 1
+            else:
+                break
+        if dx:
+            return (lo, line), (hi, line)
+        return (line, lo), (line, hi)
+
+    def letters_between(self, first: Position, last: Position) -> str:
+        """Letters of the cells from first to last (inclusive, same row or column)."""
+        horizontal = first[1] == last[1] and (first[0] != last[0] or first == last)
+        if horizontal:
+            line, lo, hi = first[1], first[0], last[0]
+        else:
+            line, lo, hi = first[0], first[1], last[1]
+        board = self.board
+        runs = board.runs(horizontal) if isinstance(board, Board) and not self.letters else None
+        parts = []
+        c = lo
+        while c <= hi:
+            run = runs.run(line, c) if runs is not None else None
+            if run is not None:
+                # A whole stretch of board tiles: one slice of the run's text
+                end = min(run[1], hi)
+                parts.append(runs.text(line, c, end))
+                c = end + 1
+            else:
+                parts.append(self[(c, line) if horizontal else (line, c)])
+                c += 1
+        return ''.join(parts)
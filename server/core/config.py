@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from core.logging_config import get_logger
 
@@ -10,6 +11,38 @@ DATA_DIR = BASE_DIR / "data"
 WORDS_JSON_PATH = DATA_DIR / "words.json"
 KOREAN_WORDS_JSON_PATH = DATA_DIR / "korean_words.json"
 
+# Dictionary
+# Compiled artifact written by utils/compile_dictionary.py, mmap'd at startup
+DICTIONARY_ARTIFACT_PATH = Path(os.getenv("DICTIONARY_ARTIFACT_PATH", DATA_DIR / "dictionary.bin"))
+# Trie engine per language: 'dict' (nested dicts), 'double_array' (packed arrays)
+# or 'dawg' (minimised word graph, smallest)
+TRIE_ENGINES = {
+    "en": os.getenv("TRIE_ENGINE_EN", "double_array"),
+    "ko": os.getenv("TRIE_ENGINE_KO", "double_array"),
+}
+# Where background dictionary builds run: 'process' (worker process, hands back an
+# mmap'd artifact) or 'thread' (shares the GIL with the event loop)
+DICTIONARY_BUILD_MODE = os.getenv("DICTIONARY_BUILD_MODE", "process")
+# Per-language artifacts built from the DB are published here so every worker on the host
+# maps the same pages; tmpfs (/dev/shm) keeps them in shared memory
+SHARED_DICTIONARY_DIR = Path(os.getenv(
+    "SHARED_DICTIONARY_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()))
+# Wildcard word search (/search_words): page size cap and time budget per query (seconds)
+PATTERN_SEARCH_MAX_RESULTS = int(os.getenv("PATTERN_SEARCH_MAX_RESULTS", 1000))
+PATTERN_SEARCH_TIME_BUDGET = float(os.getenv("PATTERN_SEARCH_TIME_BUDGET", 0.5))
+# "Did you mean" suggestions for rejected words: max edit distance, count and time budget (seconds)
+SUGGESTION_MAX_DISTANCE = int(os.getenv("SUGGESTION_MAX_DISTANCE", 2))
+SUGGESTION_LIMIT = int(os.getenv("SUGGESTION_LIMIT", 3))
+SUGGESTION_TIME_BUDGET = float(os.getenv("SUGGESTION_TIME_BUDGET", 0.0008))
+# Solvable racks: redraws before a drawn hand that spells no word is completed from the
+# signature index, and prefixes one rack query may try (bounds the time per draw)
+RACK_DRAW_ATTEMPTS = int(os.getenv("RACK_DRAW_ATTEMPTS", 3))
+RACK_SEARCH_MAX_NODES = int(os.getenv("RACK_SEARCH_MAX_NODES", 2000))
+# Largest per-room allow/deny word list accepted through UPDATE_SETTINGS
+WORD_LIST_MAX_WORDS = int(os.getenv("WORD_LIST_MAX_WORDS", 100000))
+# Token for /admin endpoints (dictionary reload); admin endpoints are disabled when unset
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
 # Server
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 8000))
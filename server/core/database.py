@@ -74,6 +74,44 @@ async def init_db():
     finally:
         await conn.close()
 
+async def get_dictionary_fingerprint():
+    """
+    언어별 사전 지문 {lang: [단어 수, 내용 해시]}을 반환합니다.
+    컴파일된 사전 아티팩트가 현재 DB와 일치하는지 확인하는 데 사용합니다 (행 전송 없이 집계 한 번).
+    """
+    conn = await get_db_connection()
+    try:
+        rows = await conn.fetch("""
+            SELECT lang, COUNT(*) AS words,
+                   SUM(hashtext(word || ':' || length || ':' || score)::bigint) AS digest
+            FROM dictionary GROUP BY lang
+        """)
+        return {row['lang']: [row['words'], int(row['digest'])] for row in rows}
+    except Exception as e:
+        logger.error(f"Database error in get_dictionary_fingerprint: {e}")
+        return None
+    finally:
+        await conn.close()
+
+async def iter_dictionary_rows(lang: str = None, batch_size: int = 5000):
+    """
+    사전 테이블을 서버 측 커서로 스트리밍합니다 (word, lang, length, score).
+    conn.fetch()와 달리 전체 Record 목록을 메모리에 올리지 않고 batch_size 행씩 가져옵니다.
+    """
+    conn = await get_db_connection()
+    try:
+        # 커서는 트랜잭션 안에서만 사용할 수 있음
+        async with conn.transaction():
+            if lang is None:
+                cursor = conn.cursor("SELECT word, lang, length, score FROM dictionary", prefetch=batch_size)
+            else:
+                cursor = conn.cursor("SELECT word, lang, length, score FROM dictionary WHERE lang = $1",
+                                     lang, prefetch=batch_size)
+            async for row in cursor:
+                yield row['word'], row['lang'], row['length'], row['score']
+    finally:
+        await conn.close()
+
 async def get_or_create_user(user_info: dict):
     conn = await get_db_connection()
     try:
@@ -0,0 +1,277 @@
+"""
+Minimal DAWG (Directed Acyclic Word Graph)
+
+A trie whose equivalent subtrees are merged, so common suffixes
+("-ING", "-ㅇㅛ") are stored once instead of once per word. Same
+search/has_prefix interface as the engines in double_array_trie.
+
+Built incrementally over sorted input (Daciuk et al. 2000): only the
+path of the previous word is ever unminimised, and each node leaving
+that path is replaced by an equivalent registered node or registered
+itself. The result is the minimal automaton for the word set.
+
+After build the graph is frozen into flat arrays (CSR layout):
+    first[s] .. first[s + 1]   edge range of state s
+    labels[e], targets[e]      edge code and target state, codes sorted
+    final[s]                   1 if a word ends in state s
+    count[s]                   number of words completing from state s
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class MinimalDawg:
+    """
+    Minimal acyclic automaton over a word list, stored in flat arrays.
+
+    Characters are mapped to codes 1..K (most frequent first) by a
+    per-graph alphabet; a state's outgoing edges are found by binary
+    search over its slice of ``labels``.
+    """
+
+    ROOT = 0
+    BUFFERS = ('first', 'labels', 'targets', 'final', 'count')
+
+    def __init__(self):
+        self.first = array('i')
+        self.labels = array('H')
+        self.targets = array('i')
+        self.final = bytearray()
+        self.count = array('i')
+        self.alphabet: Dict[str, int] = {}
+        self._chars = None  # code -> char, built on first children() call
+        self._word_count = 0
+        self._built = False
+
+    def build(self, words: List[str]) -> None:
+        """
+        Build the minimal DAWG from a list of words.
+
+        Args:
+            words: List of words to add to the graph
+        """
+        keys = sorted(set(words))
+
+        freq = Counter(char for word in keys for char in word)
+        self.alphabet = {char: i + 1 for i, (char, _) in enumerate(freq.most_common())}
+        self._chars = None
+        encode = self.alphabet.__getitem__
+
+        # Construction graph: dict transitions per state, ids recycled on merge
+        trans: List[Dict[int, int]] = [{}]
+        final = [False]
+        count = [0]  # set when a state is registered; its children already are
+        free: List[int] = []
+        register: Dict[tuple, int] = {}
+        unchecked = []  # (parent, code, child) along the previous word's path
+
+        def new_state() -> int:
+            if free:
+                state = free.pop()
+                trans[state] = {}
+                final[state] = False
+                return state
+            trans.append({})
+            final.append(False)
+            count.append(0)
+            return len(trans) - 1
+
+        def minimize(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, code, child = unchecked.pop()
+                key = (final[child], tuple(sorted(trans[child].items())))
+                existing = register.get(key)
+                if existing is None:
+                    register[key] = child
+                    count[child] = final[child] + sum(count[t] for t in trans[child].values())
+                else:
+                    trans[parent][code] = existing
+                    trans[child] = None
+                    free.append(child)
+
+        previous = ()
+        for word in keys:
+            codes = tuple(map(encode, word))
+            common = 0
+            limit = min(len(codes), len(previous))
+            while common < limit and codes[common] == previous[common]:
+                common += 1
+
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else self.ROOT
+            for code in codes[common:]:
+                child = new_state()
+                trans[node][code] = child
+                unchecked.append((node, code, child))
+                node = child
+            final[node] = True
+            previous = codes
+        minimize(0)
+        del register
+        count[self.ROOT] = final[self.ROOT] + sum(count[t] for t in trans[self.ROOT].values())
+
+        # Renumber reachable states breadth-first and pack the edges
+        order = [self.ROOT]
+        ids = {self.ROOT: 0}
+        first = array('i', [0])
+        labels = array('H')
+        targets = array('i')
+        i = 0
+        while i < len(order):
+            edges = trans[order[i]]
+            for code in sorted(edges):
+                target = edges[code]
+                if target not in ids:
+                    ids[target] = len(order)
+                    order.append(target)
+                labels.append(code)
+                targets.append(ids[target])
+            first.append(len(labels))
+            i += 1
+
+        self.first = first
+        self.labels = labels
+        self.targets = targets
+        self.final = bytearray(final[state] for state in order)
+        self.count = array('i', (count[state] for state in order))
+        self._word_count = len(keys)
+        self._built = True
+        logger.info(f"Built MinimalDawg with {self._word_count} words, "
+                    f"{len(order)} states, {len(labels)} edges")
+
+    def to_buffers(self):
+        """Return (meta, buffers) for serialization; see from_buffers."""
+        meta = {'engine': 'dawg', 'alphabet': self.alphabet, 'word_count': self._word_count}
+        return meta, {'first': self.first, 'labels': self.labels,
+                      'targets': self.targets, 'final': self.final, 'count': self.count}
+
+    @classmethod
+    def from_buffers(cls, meta: dict, buffers: dict) -> 'MinimalDawg':
+        """
+        Rebuild a graph around existing buffers without copying them.
+
+        Any indexable int sequence works (array, or a memoryview over an
+        mmap'd dictionary artifact).
+        """
+        dawg = cls()
+        dawg.alphabet = meta['alphabet']
+        dawg._word_count = meta['word_count']
+        dawg.first = buffers['first']
+        dawg.labels = buffers['labels']
+        dawg.targets = buffers['targets']
+        dawg.final = buffers['final']
+        dawg.count = buffers['count']
+        dawg._built = True
+        return dawg
+
+    def _walk(self, chars: str) -> int:
+        """Follow chars from the root; return the reached state or -1."""
+        first, labels, targets, alphabet = self.first, self.labels, self.targets, self.alphabet
+        state = self.ROOT
+        for char in chars:
+            code = alphabet.get(char)
+            if code is None:
+                return -1
+            hi = first[state + 1]
+            e = bisect_left(labels, code, first[state], hi)
+            if e == hi or labels[e] != code:
+                return -1
+            state = targets[e]
+        return state
+
+    def search(self, word: str) -> bool:
+        """
+        Check if a word exists in the graph.
+
+        Args:
+            word: The word to search for
+
+        Returns:
+            True if the exact word exists, False otherwise
+        """
+        if not self._built:
+            return False
+        state = self._walk(word)
+        return state >= 0 and self.final[state] == 1
+
+    def has_prefix(self, prefix: str) -> bool:
+        """
+        Check if any word in the graph starts with the given prefix.
+
+        Args:
+            prefix: The prefix to check
+
+        Returns:
+            True if at least one word starts with this prefix, False otherwise
+        """
+        if not self._built:
+            return True  # No graph built, be permissive
+        if not prefix:
+            return True  # Empty prefix matches everything
+        if not self._word_count:
+            return True  # Empty graph (no words) - be permissive
+        return self._walk(prefix) >= 0
+
+    def count_with_prefix(self, prefix: str) -> int:
+        """
+        Count the words that start with prefix (the prefix itself included).
+
+        O(len(prefix)): merged states have identical completions, so one
+        count per state is exact.
+        """
+        if not self._built or not self._word_count:
+            return 0
+        state = self._walk(prefix)
+        return self.count[state] if state >= 0 else 0
+
+    # State-level traversal (see core.pattern_search)
+
+    def root_node(self) -> int:
+        return self.ROOT
+
+    def child(self, state: int, char: str):
+        code = self.alphabet.get(char)
+        if code is None:
+            return None
+        hi = self.first[state + 1]
+        e = bisect_left(self.labels, code, self.first[state], hi)
+        return self.targets[e] if e < hi and self.labels[e] == code else None
+
+    def children(self, state: int):
+        """(char, child) pairs of state in character order."""
+        if self._chars is None:
+            self._chars = [''] * (len(self.alphabet) + 1)
+            for char, code in self.alphabet.items():
+                self._chars[code] = char
+        chars = self._chars
+        labels, targets = self.labels, self.targets
+        return sorted((chars[labels[e]], targets[e]) for e in range(self.first[state], self.first[state + 1]))
+
+    def is_terminal(self, state: int) -> bool:
+        return self.final[state] == 1
+
+    def state_count(self) -> int:
+        """Return the number of states after minimisation."""
+        return len(self.final)
+
+    def __len__(self) -> int:
+        """Return the number of words in the graph."""
+        return self._word_count
+
+    def memory_usage(self) -> int:
+        """Return memory usage of the arrays and alphabet in bytes."""
+        import sys
+        return (
+            self.first.itemsize * len(self.first)
+            + self.labels.itemsize * len(self.labels)
+            + self.targets.itemsize * len(self.targets)
+            + len(self.final)
+            + self.count.itemsize * len(self.count)
+            + sys.getsizeof(self.alphabet)
+        )
@@ -0,0 +1,232 @@
+"""
+Compiled Dictionary Artifact
+
+A versioned binary file holding everything load_words_to_memory would
+otherwise build from the `dictionary` table: per language the compact
+lexicon (word -> length, score columns, by-length index and perfect
+hash), the packed forward/reverse tries and the forward/reverse factor
+automata.
+
+The server mmaps the file read-only and wraps the sections in
+memoryviews, so startup does no trie construction and forked workers
+share the same page-cache pages. Written by utils/compile_dictionary.py.
+
+Layout:
+    header   MAGIC, FORMAT_VERSION, manifest size, payload size, sha256
+    manifest JSON: byte order, DB fingerprint, per-language metadata and
+             section table {name: [offset, nbytes, format]}
+    payload  raw array sections, 8-byte aligned
+The sha256 covers manifest + payload.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from core.double_array_trie import TRIE_ENGINES, BidirectionalTrie
+from core.factor_automaton import FactorAutomaton
+from core.lexicon import CompactLexicon
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"YEETDICT"
+FORMAT_VERSION = 4  # 4: per-node completion counts in the trie sections
+_HEADER = struct.Struct("<8sIQQ32s")  # magic, version, manifest size, payload size, sha256
+_ALIGN = 8
+
+# Trie engines with a to_buffers/from_buffers form
+SERIALIZABLE_ENGINES = ('double_array', 'dawg')
+
+# Formats must round-trip with the same item sizes on the reading host
+_ITEMSIZES = {code: array(code).itemsize for code in ('B', 'H', 'I', 'i')}
+
+
+def write_artifact(path: Path, languages: Dict[str, dict], fingerprint: Optional[dict] = None) -> int:
+    """
+    Write a dictionary artifact atomically.
+
+    Args:
+        path: Destination file
+        languages: lang -> {'words': {word: (length, score)} or CompactLexicon,
+                            'trie': BidirectionalTrie (double_array or dawg engine),
+                            'factors': FactorAutomaton,
+                            'reverse_factors': FactorAutomaton over reversed words}
+        fingerprint: DB fingerprint the artifact was compiled from
+
+    Returns:
+        Size of the written file in bytes
+    """
+    manifest = {
+        'byteorder': sys.byteorder,
+        'itemsizes': _ITEMSIZES,
+        'fingerprint': fingerprint,
+        'languages': {},
+    }
+    chunks = []
+    offset = 0
+
+    def add_section(sections: dict, name: str, buffer) -> None:
+        nonlocal offset
+        view = memoryview(buffer)
+        sections[name] = [offset, view.nbytes, view.format]
+        chunks.append(view.cast('B'))
+        padding = -view.nbytes % _ALIGN
+        if padding:
+            chunks.append(bytes(padding))
+        offset += view.nbytes + padding
+
+    for lang, data in languages.items():
+        trie = data['trie']
+        if trie.engine not in SERIALIZABLE_ENGINES:
+            raise ValueError(f"{lang}: the {trie.engine} trie engine cannot be compiled")
+
+        lexicon = data['words']
+        if not isinstance(lexicon, CompactLexicon):
+            lexicon = CompactLexicon.build(lexicon)
+
+        sections = {}
+        structures = {}
+        for prefix, structure in (('words', lexicon),
+                                  ('forward', trie.forward_trie),
+                                  ('reverse', trie.reverse_trie),
+                                  ('factors', data['factors']),
+                                  ('reverse_factors', data['reverse_factors'])):
+            meta, buffers = structure.to_buffers()
+            structures[prefix] = meta
+            for name, buffer in buffers.items():
+                add_section(sections, f"{prefix}.{name}", buffer)
+
+        manifest['languages'][lang] = {
+            'word_count': len(lexicon),
+            'structures': structures,
+            'sections': sections,
+        }
+
+    manifest_bytes = json.dumps(manifest, ensure_ascii=False).encode('utf-8')
+    manifest_bytes += b' ' * (-(_HEADER.size + len(manifest_bytes)) % _ALIGN)
+
+    digest = hashlib.sha256(manifest_bytes)
+    for chunk in chunks:
+        digest.update(chunk)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(manifest_bytes), offset, digest.digest())
+
+    # Write next to the target and rename, so running servers keep their old mapping
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(manifest_bytes)
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    size = _HEADER.size + len(manifest_bytes) + offset
+    logger.info(f"Wrote dictionary artifact {path} ({size} bytes, {len(languages)} languages)")
+    return size
+
+
+class DictionaryArtifact:
+    """Read-only view over an mmap'd dictionary artifact."""
+
+    def __init__(self, path: Path, mapping: mmap.mmap, manifest: dict, payload_start: int):
+        self.path = path
+        self._mmap = mapping
+        self._view = memoryview(mapping)
+        self.manifest = manifest
+        self._payload_start = payload_start
+
+    @property
+    def languages(self):
+        return list(self.manifest['languages'].keys())
+
+    @property
+    def fingerprint(self) -> Optional[dict]:
+        return self.manifest.get('fingerprint')
+
+    def section(self, lang: str, name: str) -> memoryview:
+        """Zero-copy typed view of one section."""
+        offset, nbytes, fmt = self.manifest['languages'][lang]['sections'][name]
+        start = self._payload_start + offset
+        return self._view[start:start + nbytes].cast(fmt)
+
+    def lexicon(self, lang: str) -> CompactLexicon:
+        """Zero-copy word -> (length, score) mapping."""
+        names = ('blob', 'offsets', 'length', 'score', 'by_length', 'mph_disp', 'mph_slots')
+        return CompactLexicon.from_buffers(*self._structure_buffers(lang, 'words', names))
+
+    def word_table(self, lang: str):
+        """
+        The word cache formats, as views over the mapped sections.
+
+        Returns:
+            (word -> (length, score), length -> sequence of words)
+        """
+        lexicon = self.lexicon(lang)
+        return lexicon, lexicon.by_length()
+
+    def _structure_buffers(self, lang: str, prefix: str, names) -> Tuple[dict, dict]:
+        meta = self.manifest['languages'][lang]['structures'][prefix]
+        return meta, {name: self.section(lang, f"{prefix}.{name}") for name in names}
+
+    def bidirectional_trie(self, lang: str) -> BidirectionalTrie:
+        # Artifacts written before the dawg engine carry no engine name
+        engine = self.manifest['languages'][lang]['structures']['forward'].get('engine', 'double_array')
+        cls = TRIE_ENGINES[engine]
+        forward = cls.from_buffers(*self._structure_buffers(lang, 'forward', cls.BUFFERS))
+        reverse = cls.from_buffers(*self._structure_buffers(lang, 'reverse', cls.BUFFERS))
+        return BidirectionalTrie.from_tries(forward, reverse, engine=engine)
+
+    def factor_automaton(self, lang: str, reverse: bool = False) -> FactorAutomaton:
+        names = ('base', 'check', 'target')
+        prefix = 'reverse_factors' if reverse else 'factors'
+        return FactorAutomaton.from_buffers(*self._structure_buffers(lang, prefix, names))
+
+
+def open_artifact(path: Path) -> Optional[DictionaryArtifact]:
+    """
+    Map and verify an artifact.
+
+    Returns:
+        DictionaryArtifact, or None if the file is missing, from another
+        format version or host layout, or fails its checksum.
+    """
+    path = Path(path)
+    if not path.exists():
+        logger.info(f"No dictionary artifact at {path}")
+        return None
+
+    with open(path, 'rb') as f:
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            logger.warning(f"Dictionary artifact {path} is empty")
+            return None
+
+    try:
+        if len(mapping) < _HEADER.size:
+            raise ValueError("truncated header")
+        magic, version, manifest_size, payload_size, checksum = _HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC:
+            raise ValueError("bad magic")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"format version {version}, expected {FORMAT_VERSION}")
+        payload_start = _HEADER.size + manifest_size
+        if len(mapping) != payload_start + payload_size:
+            raise ValueError("size mismatch")
+        with memoryview(mapping) as view:
+            if hashlib.sha256(view[_HEADER.size:]).digest() != checksum:
+                raise ValueError("checksum mismatch")
+        manifest = json.loads(mapping[_HEADER.size:payload_start])
+        if manifest['byteorder'] != sys.byteorder or manifest['itemsizes'] != _ITEMSIZES:
+            raise ValueError("built on a host with a different array layout")
+    except (ValueError, KeyError, struct.error) as e:
+        logger.warning(f"Ignoring dictionary artifact {path}: {e}")
+        mapping.close()
+        return None
+
+    return DictionaryArtifact(path, mapping, manifest, payload_start)
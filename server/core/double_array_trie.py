@@ -1,13 +1,23 @@
 """
-Simple Trie Implementation (Dict-based)
+Trie Implementations
 
-A fast, memory-efficient Trie using nested dictionaries.
-Much faster to build than Double Array Trie while maintaining
-the same O(m) lookup time.
+Interchangeable engines with the same search/has_prefix interface:
+
+- DoubleArrayTrie: nested-dict Trie. Fastest to build, but every node
+  is a Python dict.
+- CompactDoubleArrayTrie: true BASE/CHECK double-array stored in flat
+  ``array`` buffers. Slower to build, an order of magnitude smaller.
+- MinimalDawg (core/dawg.py): minimised word graph in flat arrays;
+  shared suffixes are stored once, so it is the smallest of the three.
+
+BidirectionalTrie picks the engine by name (see TRIE_ENGINES).
 """
 
+from array import array
+from collections import Counter
 from typing import List, Dict
 from core.logging_config import get_logger
+from core.dawg import MinimalDawg
 
 logger = get_logger(__name__)
 
@@ -22,6 +32,8 @@ class DoubleArrayTrie:
     
     # Special marker for end of word
     END_MARKER = '\x00'
+    # Number of words at or below a node
+    COUNT_MARKER = '\x01'
     
     def __init__(self):
         self.root: Dict = {}
@@ -47,10 +59,15 @@ class DoubleArrayTrie:
     def _insert(self, word: str) -> None:
         """Insert a single word into the trie."""
         node = self.root
+        path = [node]
         for char in word:
             if char not in node:
                 node[char] = {}
             node = node[char]
+            path.append(node)
+        if self.END_MARKER not in node:
+            for visited in path:
+                visited[self.COUNT_MARKER] = visited.get(self.COUNT_MARKER, 0) + 1
         node[self.END_MARKER] = True
         self._word_count += 1
     
@@ -103,6 +120,37 @@ class DoubleArrayTrie:
         
         return True  # Found all chars in prefix
     
+    def count_with_prefix(self, prefix: str) -> int:
+        """
+        Count the words that start with prefix (the prefix itself included).
+        
+        O(len(prefix)): the counts are stored on the nodes at build time.
+        """
+        if not self._built:
+            return 0
+        node = self.root
+        for char in prefix:
+            if char not in node:
+                return 0
+            node = node[char]
+        return node.get(self.COUNT_MARKER, 0)
+    
+    # Node-level traversal (see core.pattern_search); nodes are the dicts themselves
+    
+    def root_node(self):
+        return self.root
+    
+    def child(self, node, char: str):
+        return node.get(char) if char not in (self.END_MARKER, self.COUNT_MARKER) else None
+    
+    def children(self, node):
+        """(char, child) pairs of node in character order."""
+        return sorted((char, child) for char, child in node.items()
+                      if char not in (self.END_MARKER, self.COUNT_MARKER))
+    
+    def is_terminal(self, node) -> bool:
+        return self.END_MARKER in node
+    
     def __len__(self) -> int:
         """Return the number of words in the trie."""
         return self._word_count
@@ -113,6 +161,299 @@ class DoubleArrayTrie:
         return sys.getsizeof(self.root)
 
 
+class SlotAllocator:
+    """
+    Finds BASE offsets in a growing double array.
+
+    place() returns the lowest base ``b`` such that slot ``b + code`` is
+    free for every given code, and marks those slots used. Slot 0 is
+    reserved for the root. ``end`` keeps ``max_code`` slots of slack past
+    the last used slot, so ``base[s] + code`` never indexes past it.
+    """
+
+    # Failed candidates tolerated before the multi-code search start moves on
+    MAX_FAILED_PROBES = 32
+
+    def __init__(self, max_code: int):
+        self.max_code = max_code
+        self.used = bytearray(1024 + max_code)
+        self.used[0] = 1
+        self.end = 1 + max_code
+        self._next_free = 1
+        self._multi_start = 1
+
+    def __len__(self) -> int:
+        return len(self.used)
+
+    def place(self, codes: List[int]) -> int:
+        used = self.used
+        first = codes[0]
+        rest = codes[1:]
+        # Single codes fit the first hole; multi-code sets start past the
+        # dense region so they don't re-probe the same holes every time.
+        start = self._next_free if not rest else max(self._next_free, self._multi_start)
+        pos = used.find(0, max(start, first + 1))
+        failed = 0
+        while True:
+            if pos == -1 or pos + self.max_code >= len(used):
+                size = len(used)
+                used.extend(bytearray(size))
+                if pos == -1:
+                    pos = size
+            b = pos - first
+            if all(not used[b + code] for code in rest):
+                break
+            failed += 1
+            if failed > self.MAX_FAILED_PROBES:
+                self._multi_start = pos
+            pos = used.find(0, pos + 1)
+
+        for code in codes:
+            used[b + code] = 1
+        self.end = max(self.end, b + self.max_code + 1)
+        self._next_free = used.find(0, self._next_free)
+        return b
+
+
+class CompactDoubleArrayTrie:
+    """
+    Double-Array Trie stored in flat int32 arrays.
+
+    Characters are mapped to small integer codes (1..K, most frequent
+    first) by a per-trie alphabet. The child of node ``s`` on code ``c``
+    is slot ``t = base[s] + c``, which is valid only if ``check[t] == s``.
+    Terminal nodes are flagged in a parallel bytearray, and ``count[s]``
+    holds the number of words at or below node ``s``.
+    """
+
+    ROOT = 0
+    BUFFERS = ('base', 'check', 'terminal', 'count')
+
+    def __init__(self):
+        self.base = array('i')
+        self.check = array('i')
+        self.terminal = bytearray()
+        self.count = array('i')
+        self.alphabet: Dict[str, int] = {}
+        self._by_char = None  # code -> char, built on first children() call
+        self._word_count = 0
+        self._built = False
+
+    def build(self, words: List[str]) -> None:
+        """
+        Build the double array from a list of words.
+
+        Words are sorted first so that every node's children form
+        contiguous ranges; nodes are then placed depth-first into the
+        first free slots that fit all of their children.
+
+        Args:
+            words: List of words to add to the trie
+        """
+        keys = sorted(set(words))
+
+        freq = Counter(char for word in keys for char in word)
+        self.alphabet = {char: i + 1 for i, (char, _) in enumerate(freq.most_common())}
+        self._by_char = None
+        encode = self.alphabet.__getitem__
+        encoded = [tuple(map(encode, word)) for word in keys]
+
+        slots = SlotAllocator(len(self.alphabet))
+        # Sized like the allocator, so every slot below slots.end exists (the root even with no words)
+        base = array('i', [0]) * len(slots)
+        check = array('i', [-1]) * len(slots)
+        terminal = bytearray(len(slots))
+        count = array('i', [0]) * len(slots)
+
+        stack = [(self.ROOT, 0, 0, len(encoded))] if encoded else []
+        while stack:
+            node, depth, lo, hi = stack.pop()
+            # Keys below a node are exactly its sorted range
+            count[node] = hi - lo
+
+            # The word equal to this node's prefix sorts first in its range
+            if len(encoded[lo]) == depth:
+                terminal[node] = 1
+                lo += 1
+            if lo == hi:
+                continue
+
+            children = []
+            i = lo
+            while i < hi:
+                code = encoded[i][depth]
+                j = i + 1
+                while j < hi and encoded[j][depth] == code:
+                    j += 1
+                children.append((code, i, j))
+                i = j
+
+            b = slots.place([code for code, _, _ in children])
+            if len(check) < len(slots):
+                grow = len(slots) - len(check)
+                base.extend(array('i', [0]) * grow)
+                check.extend(array('i', [-1]) * grow)
+                terminal.extend(bytearray(grow))
+                count.extend(array('i', [0]) * grow)
+
+            base[node] = b
+            for code, child_lo, child_hi in children:
+                t = b + code
+                check[t] = node
+                stack.append((t, depth + 1, child_lo, child_hi))
+
+        end = slots.end
+        self.base = base[:end]
+        self.check = check[:end]
+        self.terminal = terminal[:end]
+        self.count = count[:end]
+        self._word_count = len(keys)
+        self._built = True
+        logger.info(f"Built CompactDoubleArrayTrie with {self._word_count} words, {end} slots")
+
+    def to_buffers(self):
+        """Return (meta, buffers) for serialization; see from_buffers."""
+        meta = {'alphabet': self.alphabet, 'word_count': self._word_count}
+        return meta, {'base': self.base, 'check': self.check, 'terminal': self.terminal,
+                      'count': self.count}
+
+    @classmethod
+    def from_buffers(cls, meta: dict, buffers: dict) -> 'CompactDoubleArrayTrie':
+        """
+        Rebuild a trie around existing buffers without copying them.
+
+        Any indexable int sequence works (array, or a memoryview over an
+        mmap'd dictionary artifact).
+        """
+        trie = cls()
+        trie.alphabet = meta['alphabet']
+        trie._word_count = meta['word_count']
+        trie.base = buffers['base']
+        trie.check = buffers['check']
+        trie.terminal = buffers['terminal']
+        trie.count = buffers['count']
+        trie._built = True
+        return trie
+
+    def _walk(self, chars: str) -> int:
+        """Follow chars from the root; return the reached node or -1."""
+        base, check, alphabet = self.base, self.check, self.alphabet
+        node = self.ROOT
+        for char in chars:
+            code = alphabet.get(char)
+            if code is None:
+                return -1
+            t = base[node] + code
+            if check[t] != node:
+                return -1
+            node = t
+        return node
+
+    def search(self, word: str) -> bool:
+        """
+        Check if a word exists in the trie.
+
+        Args:
+            word: The word to search for
+
+        Returns:
+            True if the exact word exists, False otherwise
+        """
+        if not self._built:
+            return False
+        node = self._walk(word)
+        return node >= 0 and self.terminal[node] == 1
+
+    def has_prefix(self, prefix: str) -> bool:
+        """
+        Check if any word in the trie starts with the given prefix.
+
+        Args:
+            prefix: The prefix to check
+
+        Returns:
+            True if at least one word starts with this prefix, False otherwise
+        """
+        if not self._built:
+            return True  # No trie built, be permissive
+        if not prefix:
+            return True  # Empty prefix matches everything
+        if not self._word_count:
+            return True  # Empty trie (no words) - be permissive
+        return self._walk(prefix) >= 0
+
+    def count_with_prefix(self, prefix: str) -> int:
+        """
+        Count the words that start with prefix (the prefix itself included).
+
+        O(len(prefix)): one walk plus a lookup in the count array.
+        """
+        if not self._built or not self._word_count:
+            return 0
+        node = self._walk(prefix)
+        return self.count[node] if node >= 0 else 0
+
+    # Node-level traversal (see core.pattern_search); nodes are slot indexes
+
+    def root_node(self) -> int:
+        return self.ROOT
+
+    def child(self, node: int, char: str):
+        code = self.alphabet.get(char)
+        if code is None:
+            return None
+        t = self.base[node] + code
+        return t if t < len(self.check) and self.check[t] == node else None
+
+    def children(self, node: int):
+        """(char, child) pairs of node in character order."""
+        if self.count[node] == self.terminal[node]:
+            return []  # leaf: every word below is the node itself
+        if self._by_char is None:
+            self._by_char = [''] * (len(self.alphabet) + 1)
+            for char, code in self.alphabet.items():
+                self._by_char[code] = char
+        # Slots base+1 .. base+K are the only candidates; find the ones owned by node
+        base = self.base[node]
+        window = self.check[base + 1:base + len(self._by_char)].tolist()
+        found = []
+        i = -1
+        while True:
+            try:
+                i = window.index(node, i + 1)
+            except ValueError:
+                break
+            found.append((self._by_char[i + 1], base + i + 1))
+        found.sort()
+        return found
+
+    def is_terminal(self, node: int) -> bool:
+        return self.terminal[node] == 1
+
+    def __len__(self) -> int:
+        """Return the number of words in the trie."""
+        return self._word_count
+
+    def memory_usage(self) -> int:
+        """Return memory usage of the arrays and alphabet in bytes."""
+        import sys
+        return (
+            self.base.itemsize * len(self.base)
+            + self.check.itemsize * len(self.check)
+            + len(self.terminal)
+            + self.count.itemsize * len(self.count)
+            + sys.getsizeof(self.alphabet)
+        )
+
+
+# Engine name -> Trie class, selectable per language (see config.TRIE_ENGINES)
+TRIE_ENGINES = {
+    'dict': DoubleArrayTrie,
+    'double_array': CompactDoubleArrayTrie,
+    'dawg': MinimalDawg,
+}
+
+
 class BidirectionalTrie:
     """
     Bidirectional Trie for both prefix and suffix validation.
@@ -123,14 +464,30 @@ class BidirectionalTrie:
     
     This allows validation of words that are being built from
     either direction (left-to-right or right-to-left).
+    
+    Args:
+        engine: Key of TRIE_ENGINES used for both internal Tries
     """
     
-    def __init__(self):
-        self.forward_trie = DoubleArrayTrie()
-        self.reverse_trie = DoubleArrayTrie()
+    def __init__(self, engine: str = 'dict'):
+        if engine not in TRIE_ENGINES:
+            raise ValueError(f"Unknown trie engine: {engine}")
+        self.engine = engine
+        self.forward_trie = TRIE_ENGINES[engine]()
+        self.reverse_trie = TRIE_ENGINES[engine]()
         self._word_count = 0
         self._built = False
     
+    @classmethod
+    def from_tries(cls, forward_trie, reverse_trie, engine: str = 'double_array') -> 'BidirectionalTrie':
+        """Wrap already built forward and reverse Tries."""
+        trie = cls(engine=engine)
+        trie.forward_trie = forward_trie
+        trie.reverse_trie = reverse_trie
+        trie._word_count = len(forward_trie)
+        trie._built = True
+        return trie
+    
     def build(self, words: List[str]) -> None:
         """
         Build both forward and reverse Tries from a list of words.
@@ -176,6 +533,14 @@ class BidirectionalTrie:
         # Check reversed suffix in reverse trie
         return self.reverse_trie.has_prefix(suffix[::-1])
     
+    def count_with_prefix(self, prefix: str) -> int:
+        """Number of words starting with prefix, in O(len(prefix))."""
+        return self.forward_trie.count_with_prefix(prefix)
+    
+    def count_with_suffix(self, suffix: str) -> int:
+        """Number of words ending with suffix, in O(len(suffix))."""
+        return self.reverse_trie.count_with_prefix(suffix[::-1])
+    
     def has_substring(self, substring: str) -> bool:
         """
         Check if the substring could be part of a valid word.
@@ -184,7 +549,8 @@ class BidirectionalTrie:
         - The substring could be a prefix of some word, OR
         - The substring could be a suffix of some word
         
-        Note: This doesn't check for middle substrings (use GADDAG for that).
+        Note: This doesn't check for middle substrings (use
+        core.factor_automaton.FactorAutomaton for that).
         """
         if not self._built:
             return True
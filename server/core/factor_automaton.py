@@ -0,0 +1,230 @@
+"""
+Factor Automaton (Suffix Automaton / DAWG of all factors)
+
+Answers "is this string a contiguous substring of some dictionary word"
+in O(len) with a single walk, including middle substrings that neither
+the forward nor the reverse Trie of BidirectionalTrie can see.
+
+Memory bound: a suffix automaton over words with n characters in total
+has at most 2n states and 3n transitions. After build the transitions
+are packed into a double array (int32 BASE per state, int32 CHECK/TARGET
+per slot), which measures at or below the size of the two packed tries
+of a BidirectionalTrie on the real word lists.
+"""
+
+from array import array
+from collections import Counter
+from typing import Dict, FrozenSet, List
+from core.double_array_trie import SlotAllocator
+from core.pattern_search import WILDCARD_ONE
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class FactorAutomaton:
+    """
+    Generalized suffix automaton over a word list, frozen into arrays.
+
+    The transition of state ``s`` on code ``c`` lives in slot
+    ``t = base[s] + c`` and is valid only if ``check[t] == s``; the next
+    state is ``target[t]``. Every state is accepting for factor queries.
+    """
+
+    ROOT = 0
+    DEAD = -1
+
+    def __init__(self):
+        self.base = array('i')
+        self.check = array('i')
+        self.target = array('i')
+        self.alphabet: Dict[str, int] = {}
+        self._word_count = 0
+        self._built = False
+
+    def build(self, words: List[str]) -> None:
+        """
+        Build the automaton from a list of words.
+
+        Args:
+            words: List of words whose factors should be accepted
+        """
+        keys = sorted(set(words))
+
+        # Online construction with dict transitions, packed afterwards
+        trans: List[Dict[str, int]] = [{}]
+        link = [-1]
+        length = [0]
+
+        def clone_state(p: int, q: int, char: str) -> int:
+            clone = len(trans)
+            trans.append(dict(trans[q]))
+            length.append(length[p] + 1)
+            link.append(link[q])
+            while p != -1 and trans[p].get(char) == q:
+                trans[p][char] = clone
+                p = link[p]
+            link[q] = clone
+            return clone
+
+        for word in keys:
+            last = 0
+            for char in word:
+                q = trans[last].get(char)
+                if q is not None:
+                    # Factor already known: reuse it (or split it off) without a new state
+                    last = q if length[q] == length[last] + 1 else clone_state(last, q, char)
+                    continue
+
+                cur = len(trans)
+                trans.append({})
+                length.append(length[last] + 1)
+                link.append(0)
+                p = last
+                while p != -1 and char not in trans[p]:
+                    trans[p][char] = cur
+                    p = link[p]
+                if p != -1:
+                    q = trans[p][char]
+                    link[cur] = q if length[p] + 1 == length[q] else clone_state(p, q, char)
+                last = cur
+
+        del link, length
+
+        freq = Counter(char for word in keys for char in word)
+        self.alphabet = {char: i + 1 for i, (char, _) in enumerate(freq.most_common())}
+
+        slots = SlotAllocator(len(self.alphabet))
+        base = array('i', [0]) * len(trans)
+        check = array('i')
+        target = array('i')
+        for state, edges in enumerate(trans):
+            if not edges:
+                continue
+            coded = sorted((self.alphabet[char], nxt) for char, nxt in edges.items())
+            b = slots.place([code for code, _ in coded])
+            if len(check) < len(slots):
+                grow = len(slots) - len(check)
+                check.extend(array('i', [-1]) * grow)
+                target.extend(array('i', [0]) * grow)
+            base[state] = b
+            for code, nxt in coded:
+                check[b + code] = state
+                target[b + code] = nxt
+            trans[state] = None  # Release dicts as we go to cap peak memory
+
+        self.base = base
+        self.check = check[:slots.end]
+        self.target = target[:slots.end]
+        self._word_count = len(keys)
+        self._built = True
+        logger.info(f"Built FactorAutomaton with {self._word_count} words, "
+                    f"{len(self.base)} states, {len(self.check)} slots")
+
+    def to_buffers(self):
+        """Return (meta, buffers) for serialization; see from_buffers."""
+        meta = {'alphabet': self.alphabet, 'word_count': self._word_count}
+        return meta, {'base': self.base, 'check': self.check, 'target': self.target}
+
+    @classmethod
+    def from_buffers(cls, meta: dict, buffers: dict) -> 'FactorAutomaton':
+        """Rebuild an automaton around existing buffers without copying them."""
+        fa = cls()
+        fa.alphabet = meta['alphabet']
+        fa._word_count = meta['word_count']
+        fa.base = buffers['base']
+        fa.check = buffers['check']
+        fa.target = buffers['target']
+        fa._built = True
+        return fa
+
+    def step(self, state: int, char: str) -> int:
+        """Follow one character from state; return the next state or DEAD."""
+        code = self.alphabet.get(char)
+        if code is None or state < 0:
+            return self.DEAD
+        t = self.base[state] + code
+        if self.check[t] != state:
+            return self.DEAD
+        return self.target[t]
+
+    def walk(self, chars: str, state: int = ROOT) -> int:
+        """Follow chars from state (root by default); return the state or DEAD."""
+        base, check, target, alphabet = self.base, self.check, self.target, self.alphabet
+        if state < 0:
+            return self.DEAD
+        for char in chars:
+            code = alphabet.get(char)
+            if code is None:
+                return self.DEAD
+            t = base[state] + code
+            if check[t] != state:
+                return self.DEAD
+            state = target[t]
+        return state
+
+    def step_states(self, states: FrozenSet[int], char: str) -> FrozenSet[int]:
+        """
+        step() over a set of states; WILDCARD_ONE (a blank tile) follows every edge.
+
+        The set holds each distinct factor state once, so a run of blanks
+        grows it at most to the number of distinct factors of that shape.
+        """
+        base, check, target = self.base, self.check, self.target
+        if char != WILDCARD_ONE:
+            code = self.alphabet.get(char)
+            if code is None:
+                return frozenset()
+            return frozenset(target[base[s] + code] for s in states if check[base[s] + code] == s)
+        codes = self.alphabet.values()
+        return frozenset(target[base[s] + code] for s in states for code in codes
+                         if check[base[s] + code] == s)
+
+    def walk_states(self, chars: str, states: FrozenSet[int] = None) -> FrozenSet[int]:
+        """walk() for text that may contain blanks; returns the set of reachable states."""
+        states = frozenset((self.ROOT,)) if states is None else states
+        for char in chars:
+            if not states:
+                break
+            states = self.step_states(states, char)
+        return states
+
+    def is_factor(self, substring: str) -> bool:
+        """
+        Check if substring occurs anywhere inside some word.
+
+        Args:
+            substring: The string to check; WILDCARD_ONE stands for any character
+
+        Returns:
+            True if some word contains it (as prefix, suffix or middle)
+        """
+        if WILDCARD_ONE in substring:
+            return self.accepts_states(self.walk_states(substring))
+        return self.accepts(self.walk(substring))
+
+    def accepts(self, state: int) -> bool:
+        """Check a state reached by step()/walk(); permissive if nothing is built."""
+        if not self._built or not self._word_count:
+            return True
+        return state != self.DEAD
+
+    def accepts_states(self, states: FrozenSet[int]) -> bool:
+        """accepts() for a set reached by step_states()/walk_states()."""
+        if not self._built or not self._word_count:
+            return True
+        return bool(states)
+
+    def __len__(self) -> int:
+        """Return the number of words the automaton was built from."""
+        return self._word_count
+
+    def memory_usage(self) -> int:
+        """Return memory usage of the arrays and alphabet in bytes."""
+        import sys
+        return (
+            self.base.itemsize * len(self.base)
+            + self.check.itemsize * len(self.check)
+            + self.target.itemsize * len(self.target)
+            + sys.getsizeof(self.alphabet)
+        )
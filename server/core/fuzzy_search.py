@@ -0,0 +1,192 @@
+"""
+Fuzzy ("did you mean") Search over a Trie
+
+Finds dictionary words within a small edit distance (insert, delete,
+substitute) of a rejected word by running a Levenshtein automaton in
+lock-step with a depth-first walk of a trie engine: a child is entered
+only while some automaton state is still alive, so the walk touches the
+few trie paths near the word instead of comparing against every word.
+
+The automaton is the bit-parallel NFA of Wu & Manber: for each error
+count k, one int whose bit i means "the first i characters of the word
+are matched with at most k errors". A step is a few shifts and ors per
+error level. When no error is left to spend, only the word's next
+characters can keep a state alive, so the walk follows just those edges.
+
+Errors near the root are what make a plain walk expensive: with spare
+errors every child of the first levels stays alive. suggest() therefore
+splits the word in two (the forward-backward method of Mihov & Schulz):
+an alignment with at most d errors has at most d - 1 of them in one half,
+so a forward walk that allows only d - 1 errors in the first half plus a
+reverse-trie walk that allows only d - 1 in the second half find every
+word, each walk pruning hard before the split.
+
+Distance 1 is searched first and widened only while nothing was found,
+so the suggestions are the nearest words; all under a hard time budget.
+"""
+
+import time
+from typing import Iterator, List, Optional, Tuple
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Nodes visited between time checks
+CHECK_EVERY = 16
+
+
+class LevenshteinSearch:
+    """
+    Words of a trie engine within max_distance edits of word.
+
+    Attributes:
+        visited: Trie nodes entered so far
+
+    With split=h, states that have matched at most h characters of word
+    may hold at most max_distance - 1 errors (see the module docstring).
+    """
+
+    def __init__(self, trie, word: str, max_distance: int, split: Optional[int] = None):
+        self.trie = trie
+        self.word = word
+        self.max_distance = max_distance
+        self.visited = 0
+        self._fanout = {}
+        self._steps = {}
+
+        # Bit i + 1 of masks[c] is set where word[i] == c
+        self._masks = {}
+        for i, char in enumerate(word):
+            self._masks[char] = self._masks.get(char, 0) | (1 << (i + 1))
+        self._full = (1 << (len(word) + 1)) - 1
+        self._accept = 1 << len(word)
+        if split is None:
+            self._guard = self._full  # top-level states allowed anywhere
+            self._spare = self._full  # states whose next error stays allowed
+        else:
+            split = max(split, -1)
+            self._guard = self._full & ~((1 << (split + 1)) - 1)
+            self._spare = self._full & ~((1 << max(split, 0)) - 1)
+
+    def _start(self) -> tuple:
+        # k errors may be spent deleting the word's first k characters
+        states = [(1 << (k + 1)) - 1 & self._full for k in range(self.max_distance + 1)]
+        states[-1] &= self._guard
+        return tuple(states)
+
+    def _step(self, states: tuple, char: str) -> tuple:
+        mask = self._masks.get(char, 0)
+        full = self._full
+        prev_old = states[0]
+        prev_new = (prev_old << 1) & mask
+        result = [prev_new]
+        for old in states[1:]:
+            # match | insert char | substitute char | delete a word character
+            new = (((old << 1) & mask) | prev_old | (prev_old << 1) | (prev_new << 1)) & full
+            result.append(new)
+            prev_old, prev_new = old, new
+        result[-1] &= self._guard
+        return tuple(result)
+
+    def _literals(self, states: tuple) -> Optional[List[str]]:
+        """Characters that can keep states alive, or None if any character can (memoized)."""
+        if states in self._fanout:
+            return self._fanout[states]
+        result = None
+        if len(states) == 1 or not (any(states[:-2]) or states[-2] & self._spare):
+            live = states[-1] | (states[-2] if len(states) > 1 else 0)
+            word = self.word
+            result = sorted({word[i] for i in range(len(word)) if live >> i & 1})
+        self._fanout[states] = result
+        return result
+
+    def distance(self, states: tuple) -> Optional[int]:
+        """Edit distance of the walked prefix to word, if within max_distance."""
+        for k, bits in enumerate(states):
+            if bits & self._accept:
+                return k
+        return None
+
+    def iter_matches(self) -> Iterator[Optional[Tuple[str, int]]]:
+        """
+        Yield (word, distance) in character order, plus None every CHECK_EVERY nodes.
+
+        As in PatternSearch.iter_words, the None ticks let the caller
+        enforce a time budget.
+        """
+        trie = self.trie
+        stack = [(trie.root_node(), '', self._start())]
+        while stack:
+            if self.visited and not self.visited % CHECK_EVERY:
+                yield None
+            node, prefix, states = stack.pop()
+            self.visited += 1
+
+            if trie.is_terminal(node):
+                dist = self.distance(states)
+                if dist is not None:
+                    yield prefix, dist
+
+            literals = self._literals(states)
+            if literals is None:
+                edges = trie.children(node)
+            else:
+                edges = []
+                for char in literals:
+                    child = trie.child(node, char)
+                    if child is not None:
+                        edges.append((char, child))
+
+            steps = self._steps
+            for char, child in reversed(edges):
+                key = (states, char)
+                nxt = steps.get(key)
+                if nxt is None:
+                    nxt = steps[key] = self._step(states, char)
+                if any(nxt):
+                    stack.append((child, prefix + char, nxt))
+
+
+def suggest(trie, word: str, max_distance: int, limit: int,
+            time_budget: float) -> List[Tuple[str, int]]:
+    """
+    Up to limit (word, distance) pairs at the smallest distance that has any.
+
+    Words shorter than 4 characters are searched at distance 1 only.
+
+    trie is a BidirectionalTrie (both directions are walked). Distance 0
+    (word itself) is never suggested. The walks stop when time_budget
+    seconds have passed; whatever was found by then is kept.
+    """
+    deadline = time.perf_counter() + time_budget
+    found = {}
+    visited = 0
+    half = len(word) // 2
+    # Two edits of a two- or three-letter word reach almost every short word
+    max_distance = min(max_distance, max(1, half))
+    for distance in range(1, max_distance + 1):
+        # Forward: first half nearly exact; reverse: second half nearly exact
+        searches = [(LevenshteinSearch(trie.forward_trie, word, distance, split=half), False),
+                    (LevenshteinSearch(trie.reverse_trie, word[::-1], distance,
+                                       split=len(word) - half - 1), True)]
+        out_of_time = False
+        for search, reverse in searches:
+            for match in search.iter_matches():
+                if match is None:
+                    if time.perf_counter() >= deadline:
+                        out_of_time = True
+                        break
+                    continue
+                candidate, dist = match
+                if reverse:
+                    candidate = candidate[::-1]
+                if dist and dist < found.get(candidate, dist + 1):
+                    found[candidate] = dist
+            visited += search.visited
+            if out_of_time:
+                break
+        if out_of_time or found:
+            break
+    result = sorted(found.items(), key=lambda item: (item[1], item[0]))[:limit]
+    logger.debug(f"suggest '{word}': {result} ({visited} nodes)")
+    return result
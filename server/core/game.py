@@ -4,14 +4,21 @@ import time
 import asyncio
 import uuid
 import random
-from core.words import get_word_in_cache, get_random_word, has_valid_prefix
-from core.tiles import generate_weighted_tiles, TileBag
+from core.words import validate_words, get_random_word, has_valid_prefix, FactorCursor, current_snapshot, wait_for_language, \
+    resolve_blanks, blank_choices, suggest_words, find_rack_word
+from core.tiles import generate_weighted_tiles, TileBag, BLANK_TILE
 from core.database import save_game_result
 from core.logging_config import get_logger
-from core.korean_utils import compose_word, is_valid_syllable_pattern, count_syllables
+from core.korean_utils import compose_word, analyze_jamos, SyllableParse, ALL_CHOSUNG, ALL_JUNGSUNG, ALL_JONGSUNG
+from core.board_index import Board, PendingTiles, BoardView
+from core.word_overlay import WordOverlay
+from core.config import WORD_LIST_MAX_WORDS, RACK_DRAW_ATTEMPTS
 
 logger = get_logger(__name__)
 
+# 한국어 빈 타일이 될 수 있는 자모
+KOREAN_JAMOS = frozenset(ALL_CHOSUNG | ALL_JUNGSUNG | ALL_JONGSUNG)
+
 class Player:
     def __init__(self, player_id: str, name: str, websocket):
         self.player_id = player_id
@@ -49,18 +56,22 @@ class GameRoom:
         self.total_round_time = 0
         self.timer_task = None
 
-        self.board: Dict[tuple, Dict] = {} # (x, y) -> {'x': x, 'y': y, 'letter': letter, 'color': color}
-        self.pending_tiles: List[Dict] = []
+        self.board = Board() # (x, y) -> {'x': x, 'y': y, 'letter': letter, 'color': color}
+        self.pending_tiles = PendingTiles()
         self.players: Dict[str, Player] = {}
         self.status = "LOBBY" # LOBBY, INGAME, FINISHED
         self.created_at = time.time()
         self.group_timers: Dict[str, asyncio.Task] = {} # "h:{id}" or "v:{id}" -> timer_task
+        self.group_cursors: Dict[str, Dict] = {} # "h:{id}" or "v:{id}" -> {'start', 'end', 'cursor': FactorCursor, 'parse': SyllableParse (ko)}
         self.room_timer_task: Optional[asyncio.Task] = None
         self.duration: int = 0
         self.start_time: Optional[float] = None
         self.lock = asyncio.Lock()
         self.tile_bag: Optional[TileBag] = None  # Initialized on game start
         self.penalty_cooldowns: Dict[str, float] = {}  # player_id -> last_penalty_time
+        self.dictionary = None  # DictionarySnapshot pinned at match start; survives dictionary reloads
+        self.word_overlay: Optional[WordOverlay] = None  # 방 전용 허용/금지 단어 목록 (공유 사전 위에 덧씌움)
+        self.word_list_build: Optional[asyncio.Future] = None  # 스레드에서 진행 중인 델타 오토마톤 빌드
 
     def update_settings(self, settings: dict):
         if "mode" in settings:
@@ -84,28 +95,71 @@ class GameRoom:
             return []
         
         player = self.players[player_id]
+        slots = []
         
-        # Use TileBag for consistent distribution, fallback to weighted random
-        if self.tile_bag:
-            new_tiles = self.tile_bag.draw(count)
-        else:
-            new_tiles = generate_weighted_tiles(count, lang=self.settings.get("lang", "en"))
-        
-        drawn = []
-        
-        for tile in new_tiles:
+        for tile in self._draw_from_bag(count):
             # Find first available None slot
             try:
                 empty_idx = player.hand.index(None)
                 player.hand[empty_idx] = tile
-                drawn.append(tile)
+                slots.append(empty_idx)
             except ValueError:
                 # Hand is full
                 break
+        
+        if slots:
+            self._ensure_solvable_hand(player, slots)
+        drawn = [player.hand[i] for i in slots]
                 
         logger.debug(f"Player {player.name} drew {len(drawn)} tiles: {drawn}")
         return drawn
     
+    def _draw_from_bag(self, count: int) -> List[str]:
+        # Use TileBag for consistent distribution, fallback to weighted random
+        if self.tile_bag:
+            return self.tile_bag.draw(count)
+        return generate_weighted_tiles(count, lang=self.settings.get("lang", "en"))
+    
+    def _ensure_solvable_hand(self, player: Player, slots: List[int]):
+        """
+        손패로 길이 2 이상의 단어를 하나 이상 만들 수 있도록 보장합니다.
+        
+        방금 채운 slots의 타일을 가방에 돌려놓고 최대 RACK_DRAW_ATTEMPTS번 다시 뽑은 뒤,
+        그래도 안 되면 서명 인덱스가 찾은 단어의 모자란 글자로 채웁니다.
+        질의마다 탐색 노드 수가 제한되므로 드로우 한 번의 시간도 제한됩니다.
+        """
+        lang = self.settings.get("lang", "en")
+        if find_rack_word(player.hand, lang, self.dictionary) is not None:
+            return
+        
+        def put_back():
+            returned = [player.hand[i] for i in slots]
+            for i in slots:
+                player.hand[i] = None
+            if self.tile_bag:
+                self.tile_bag.add_tiles(returned)
+        
+        for _ in range(RACK_DRAW_ATTEMPTS):
+            put_back()
+            for i, tile in zip(slots, self._draw_from_bag(len(slots))):
+                player.hand[i] = tile
+            if find_rack_word(player.hand, lang, self.dictionary) is not None:
+                return
+        
+        # Fill the drawn slots as wildcards: the word's missing letters, then random tiles
+        # (blanks already in the hand are left out, so every wildcard letter is one of the slots)
+        put_back()
+        kept = [tile for tile in player.hand if tile != BLANK_TILE]
+        found = find_rack_word(kept, lang, self.dictionary, free=len(slots), rng=random)
+        letters = list(found[1]) if found else []
+        letters += self._draw_from_bag(len(slots) - len(letters))
+        for i, tile in zip(slots, letters):
+            player.hand[i] = tile
+        if found:
+            logger.debug(f"Player {player.name} hand completed to spell {found[0]} (sorted)")
+        else:
+            logger.warning(f"No word reachable from {player.name}'s hand with {len(slots)} new tiles")
+    
     def destroy_tile(self, player_id: str, hand_index: int):
         if player_id not in self.players:
             return
@@ -214,8 +268,16 @@ class GameRoom:
     async def broadcast_state(self):
         await self.broadcast({"type": "UPDATE", "state": self.get_state()})
 
+    async def wait_for_dictionary(self):
+        """방 언어의 사전이 아직 로드 중이면 준비될 때까지 기다립니다 (준비된 경우 즉시 반환)."""
+        lang = self.settings.get("lang", "en")
+        if not await wait_for_language(lang):
+            logger.warning(f"Room {self.room_code}: no dictionary for {lang}, starting without it")
+
     def start_match(self):
         self.status = "INGAME"
+        # 진행 중인 게임은 시작 시점의 사전 버전으로 끝까지 검증
+        self.dictionary = current_snapshot()
         
         # Initialize tile bag for this game
         lang = self.settings.get("lang", "en")
@@ -228,7 +290,7 @@ class GameRoom:
         # Give each player a 10-letter word as starting tiles
         for p_id, player in self.players.items():
             player.hand = [None] * 10  # Reset and fix size to 10
-            word = get_random_word(exact_length=10, lang=lang)
+            word = get_random_word(exact_length=10, lang=lang, snapshot=self.dictionary)
             if word:
                 letters = list(word.upper() if lang == 'en' else word)
                 for i, letter in enumerate(letters):
@@ -236,7 +298,7 @@ class GameRoom:
                 logger.debug(f"Player {player.name} starting with 10-letter word: {word}")
             else:
                 # Fallback: try shorter words and fill rest with random
-                fallback_word = get_random_word(min_length=6, max_length=10, lang=lang)
+                fallback_word = get_random_word(min_length=6, max_length=10, lang=lang, snapshot=self.dictionary)
                 if fallback_word:
                     letters = list(fallback_word.upper() if lang == 'en' else fallback_word)
                     for i, letter in enumerate(letters):
@@ -281,9 +343,9 @@ class GameRoom:
         
         for i in range(word_count):
             # Get a 10+ letter word
-            word = get_random_word(min_length=10, lang=lang)
+            word = get_random_word(min_length=10, lang=lang, snapshot=self.dictionary)
             if not word:
-                word = get_random_word(min_length=8, lang=lang)  # Fallback
+                word = get_random_word(min_length=8, lang=lang, snapshot=self.dictionary)  # Fallback
             if not word:
                 logger.warning(f"Could not find starting word {i+1}")
                 continue
@@ -335,6 +397,24 @@ class GameRoom:
         
         logger.info(f"Placed {len(words_placed)} starting words: {words_placed}")
     
+    @property
+    def board(self) -> Board:
+        """확정된 타일 (행/열 구간 인덱스 포함). 일반 dict를 대입해도 인덱싱됩니다."""
+        return self._board
+
+    @board.setter
+    def board(self, tiles: Dict[tuple, Dict]):
+        self._board = tiles if isinstance(tiles, Board) else Board(tiles)
+
+    @property
+    def pending_tiles(self) -> PendingTiles:
+        """대기 중인 타일 목록 (좌표 인덱스 포함). 일반 리스트를 대입해도 인덱싱됩니다."""
+        return self._pending_tiles
+
+    @pending_tiles.setter
+    def pending_tiles(self, tiles: List[Dict]):
+        self._pending_tiles = tiles if isinstance(tiles, PendingTiles) else PendingTiles(tiles)
+
     def get_state(self):
         remaining_time = 0
         if self.start_time and self.duration:
@@ -353,7 +433,8 @@ class GameRoom:
             "remaining_time": remaining_time
         }
 
-    def place_tile(self, x: int, y: int, letter: str, player_id: str, points: int, color: str = None, consume_hand: bool = True):
+    def place_tile(self, x: int, y: int, letter: str, player_id: str, points: int, color: str = None, consume_hand: bool = True,
+                   blank: bool = False):
         # 타일 존재 여부 체크 (보드 및 대기열)
         if (x, y) in self.board:
             return False
@@ -370,33 +451,20 @@ class GameRoom:
                 player.hand.remove(letter.upper())
 
         self.board[(x, y)] = {'x': x, 'y': y, 'letter': letter, 'color': color}
+        if blank:
+            # Blank tile placed as `letter`; it scores and reads as that letter from now on
+            self.board[(x, y)]['blank'] = True
         if player_id in self.players:
             self.players[player_id].score += points
         return True
 
-    def _get_combined_board_dict(self):
-        board_dict = {pos: t['letter'] for pos, t in self.board.items()}
-        for t in self.pending_tiles:
-            board_dict[(t['x'], t['y'])] = t['letter']
-        return board_dict
+    def _get_combined_board_dict(self) -> BoardView:
+        """보드 + 대기 타일을 복사 없이 (x, y) -> 글자로 읽는 뷰"""
+        return BoardView(self.board, self.pending_tiles.by_position)
 
-    def _get_word_at(self, x: int, y: int, direction: str, board_dict: dict = None) -> str:
+    def _get_word_at(self, x: int, y: int, direction: str, board_dict: BoardView = None) -> str:
         """지정된 좌표(x, y)를 포함하는 단어를 추출합니다."""
-        dx, dy = (1, 0) if direction == 'h' else (0, 1)
-        if board_dict is None:
-            board_dict = self._get_combined_board_dict()
-        
-        # 선형적으로 단어의 시작 찾기
-        curr_x, curr_y = x, y
-        while (curr_x - dx, curr_y - dy) in board_dict:
-            curr_x -= dx
-            curr_y -= dy
-        
-        word = ""
-        while (curr_x, curr_y) in board_dict:
-            word += board_dict[(curr_x, curr_y)]
-            curr_x += dx
-            curr_y += dy
+        word = self._get_raw_jamos_at(x, y, direction, board_dict=board_dict)
         
         # For Korean, compose jamos into syllables for display
         lang = self.settings.get("lang", "en")
@@ -405,38 +473,103 @@ class GameRoom:
         
         return word
 
-    def _get_raw_jamos_at(self, x: int, y: int, direction: str, board_dict: dict = None) -> str:
+    def _get_raw_jamos_at(self, x: int, y: int, direction: str, board_dict: BoardView = None) -> str:
         """Get raw jamo string (without composition) for Korean validation."""
         dx, dy = (1, 0) if direction == 'h' else (0, 1)
         if board_dict is None:
             board_dict = self._get_combined_board_dict()
+        if (x, y) not in board_dict:
+            return ""
         
-        # Find start
-        curr_x, curr_y = x, y
-        while (curr_x - dx, curr_y - dy) in board_dict:
-            curr_x -= dx
-            curr_y -= dy
-        
-        # Build raw string
-        raw = ""
-        while (curr_x, curr_y) in board_dict:
-            raw += board_dict[(curr_x, curr_y)]
-            curr_x += dx
-            curr_y += dy
-        return raw
+        # One interval lookup per board run (instead of one step per letter)
+        first, last = board_dict.run_through(x, y, dx, dy)
+        return board_dict.letters_between(first, last)
+
+    def _letter_at(self, x: int, y: int) -> Optional[str]:
+        """보드 또는 대기열에서 (x, y)의 글자를 반환합니다."""
+        tile = self.board.get((x, y)) or self.pending_tiles.by_position.get((x, y))
+        return tile['letter'] if tile else None
+
+    def _run_through(self, x: int, y: int, letter: str, dx: int, dy: int):
+        """Return (start, end, raw text) of the run through (x, y) as if letter were placed there."""
+        view = self._get_combined_board_dict()
+        start = end = (x, y)
+        before = after = ''
+        prev_pos, next_pos = (x - dx, y - dy), (x + dx, y + dy)
+        if prev_pos in view:
+            start, _ = view.run_through(*prev_pos, dx, dy)
+            before = view.letters_between(start, prev_pos)
+        if next_pos in view:
+            _, end = view.run_through(*next_pos, dx, dy)
+            after = view.letters_between(next_pos, end)
+        return start, end, before + letter + after
+
+    def _extend_group_cursor(self, x: int, y: int, letter: str, direction: str) -> Dict:
+        """
+        Cursor entry for the run through (x, y) in direction after placing letter.
+
+        If the tile extends exactly one pending group's run at either end,
+        that group's cached FactorCursor takes a single step; otherwise
+        (new run, bridging two runs, no cached cursor) the run is scanned once.
+        Korean runs also carry a SyllableParse, extended the same way.
+        """
+        lang = self.settings.get("lang", "en")
+        dx, dy = (1, 0) if direction == 'h' else (0, 1)
+        prev_pos = (x - dx, y - dy)
+        next_pos = (x + dx, y + dy)
+        has_prev = self._letter_at(*prev_pos) is not None
+        has_next = self._letter_at(*next_pos) is not None
+
+        if not has_prev and not has_next:
+            cursor = FactorCursor(letter, lang, snapshot=self.dictionary, overlay=self.word_overlay)
+            parse = SyllableParse(letter) if lang == 'ko' else None
+            return {'start': (x, y), 'end': (x, y), 'cursor': cursor, 'parse': parse}
+
+        if has_prev != has_next:
+            found = self._get_connected_directional_group_ids(x, y, dx, dy)
+            if len(found) == 1:
+                entry = self.group_cursors.get(f"{direction}:{next(iter(found))}")
+                if entry and has_prev and entry['end'] == prev_pos and \
+                   self._letter_at(entry['start'][0] - dx, entry['start'][1] - dy) is None:
+                    parse = entry.get('parse') and entry['parse'].appended(letter)
+                    return {'start': entry['start'], 'end': (x, y), 'cursor': entry['cursor'].appended(letter),
+                            'parse': parse}
+                if entry and has_next and entry['start'] == next_pos and \
+                   self._letter_at(entry['end'][0] + dx, entry['end'][1] + dy) is None:
+                    parse = entry.get('parse') and entry['parse'].prepended(letter)
+                    return {'start': (x, y), 'end': entry['end'], 'cursor': entry['cursor'].prepended(letter),
+                            'parse': parse}
+
+        start, end, text = self._run_through(x, y, letter, dx, dy)
+        cursor = FactorCursor(text, lang, snapshot=self.dictionary, overlay=self.word_overlay)
+        parse = SyllableParse(text) if lang == 'ko' else None
+        return {'start': start, 'end': end, 'cursor': cursor, 'parse': parse}
+
+    def _drop_group_cursors(self, tiles: List[Dict] = ()):
+        """Forget cursors of the given tiles' groups and of groups with no pending tiles left."""
+        for t in tiles:
+            self.group_cursors.pop(f"h:{t.get('h_group_id')}", None)
+            self.group_cursors.pop(f"v:{t.get('v_group_id')}", None)
+        live = {f"h:{t.get('h_group_id')}" for t in self.pending_tiles}
+        live |= {f"v:{t.get('v_group_id')}" for t in self.pending_tiles}
+        for key in [k for k in self.group_cursors if k not in live]:
+            del self.group_cursors[key]
 
     def _get_connected_directional_group_ids(self, x: int, y: int, dx: int, dy: int) -> set:
         """지정된 방향(dx, dy)으로 연결된 모든 pending_tile의 group_id를 찾습니다."""
-        pending_map = {(t['x'], t['y']): t for t in self.pending_tiles}
+        pending_map = self.pending_tiles.by_position
         board_tiles = self.board # Dictionary keys are coordinates
         dir_key = 'h_group_id' if dx != 0 else 'v_group_id'
         found_groups = set()
 
+        runs = board_tiles.runs(dx)
+        line, c = (y, x) if dx else (x, y)
+
         def find_in_dir(step):
-            curr_x, curr_y = x + dx * step, y + dy * step
-            while (curr_x, curr_y) in board_tiles:
-                curr_x += dx * step
-                curr_y += dy * step
+            # Skip the board run next to (x, y) in one lookup
+            run = runs.run(line, c + step)
+            beyond = c + step if run is None else (run[1] + 1 if step > 0 else run[0] - 1)
+            curr_x, curr_y = (beyond, line) if dx else (line, beyond)
             if (curr_x, curr_y) in pending_map:
                 gid = pending_map[(curr_x, curr_y)].get(dir_key)
                 if gid: found_groups.add(gid)
@@ -457,8 +590,7 @@ class GameRoom:
             lang = self.settings.get("lang", "en")
             letter_upper = letter.upper() if lang == 'en' else letter
 
-            if (x, y) in self.board or \
-               any(t for t in self.pending_tiles if t['x'] == x and t['y'] == y):
+            if (x, y) in self.board or (x, y) in self.pending_tiles.by_position:
                 return False, "Tile already exists at this position"
 
             # 핸드 체크
@@ -477,39 +609,30 @@ class GameRoom:
                 has_adj = False
                 for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
                     nx, ny = x + dx, y + dy
-                    if (nx, ny) in self.board or any(pt['x'] == nx and pt['y'] == ny for pt in self.pending_tiles):
+                    if (nx, ny) in self.board or (nx, ny) in self.pending_tiles.by_position:
                         has_adj = True
                         break
                 if not has_adj:
                     return False, "Tile must be adjacent to existing or pending tiles"
 
             # Early validation: Check if the tile placement could lead to valid words
-            # Note: has_valid_prefix checks BOTH prefixes and suffixes using BidirectionalTrie
-            # Temporarily add the tile to check substrings
-            temp_tile = {'x': x, 'y': y, 'letter': letter}
-            self.pending_tiles.append(temp_tile)
+            # Note: has_valid_prefix accepts any run that occurs inside a word (FactorAutomaton)
+            # Each pending group caches a FactorCursor, so extending a run costs one step
+            h_entry = self._extend_group_cursor(x, y, letter, 'h')
+            v_entry = self._extend_group_cursor(x, y, letter, 'v')
+            h_substring = h_entry['cursor'].text
+            v_substring = v_entry['cursor'].text
             
             substring_invalid = False
-            try:
-                if lang == 'ko':
-                    h_substring = self._get_raw_jamos_at(x, y, 'h')
-                    v_substring = self._get_raw_jamos_at(x, y, 'v')
-                else:
-                    h_substring = self._get_word_at(x, y, 'h')
-                    v_substring = self._get_word_at(x, y, 'v')
-                
-                # Check horizontal substring
-                if len(h_substring) > 1 and not has_valid_prefix(h_substring, lang):
-                    logger.debug(f"Invalid horizontal substring: {h_substring}")
-                    substring_invalid = True
-                
-                # Check vertical substring
-                if not substring_invalid and len(v_substring) > 1 and not has_valid_prefix(v_substring, lang):
-                    logger.debug(f"Invalid vertical substring: {v_substring}")
-                    substring_invalid = True
-            finally:
-                # Remove temporary tile
-                self.pending_tiles.remove(temp_tile)
+            # Check horizontal substring
+            if len(h_substring) > 1 and not h_entry['cursor'].is_valid:
+                logger.debug(f"Invalid horizontal substring: {h_substring}")
+                substring_invalid = True
+            
+            # Check vertical substring
+            if not substring_invalid and len(v_substring) > 1 and not v_entry['cursor'].is_valid:
+                logger.debug(f"Invalid vertical substring: {v_substring}")
+                substring_invalid = True
 
             # 방향별 그룹 처리
             def process_direction(dx, dy, prefix):
@@ -532,6 +655,8 @@ class GameRoom:
                             if other_key in self.group_timers:
                                 self.group_timers[other_key].cancel()
                                 del self.group_timers[other_key]
+                            # 병합된 그룹의 커서 무효화
+                            self.group_cursors.pop(other_key, None)
                 return gid
 
             h_group_id = process_direction(1, 0, "h")
@@ -556,7 +681,10 @@ class GameRoom:
                 player.hand[idx] = None
 
             # If substring is invalid, immediately explode the tile
-            if substring_invalid:
+            if not substring_invalid:
+                self.group_cursors[f"h:{h_group_id}"] = h_entry
+                self.group_cursors[f"v:{v_group_id}"] = v_entry
+            else:
                 # Apply penalty (1 point for early validation failure)
                 penalty_points = 1
                 player.score = max(0, player.score - penalty_points)
@@ -587,81 +715,37 @@ class GameRoom:
             
             lang = self.settings.get("lang", "en")
             
-            # For Korean, validate using raw jamos
-            if lang == 'ko':
-                h_raw = self._get_raw_jamos_at(x, y, 'h')
-                v_raw = self._get_raw_jamos_at(x, y, 'v')
-                
-                # Validate horizontal word
-                h_result = None
-                v_result = None
-                
-                if len(h_raw) >= 2 and is_valid_syllable_pattern(h_raw):
-                    h_result = get_word_in_cache(h_raw, lang=lang)
-                    h_valid = h_result.get("is_valid")
-                    
-                    # Need v_result for cross-validation check
-                    if len(v_raw) >= 2 and is_valid_syllable_pattern(v_raw):
-                        v_result = get_word_in_cache(v_raw, lang=lang)
-                        v_valid = v_result.get("is_valid")
-                    else:
-                        v_valid = len(v_raw) < 2
-                    
-                    if h_valid and v_valid:
-                        await self.finalize_pending_group(h_group_id, 'h', trigger_tile=placed_tile, pre_result=h_result)
-                        finalized_h = True
-                
-                # Validate vertical word
-                if len(v_raw) >= 2 and is_valid_syllable_pattern(v_raw):
-                    # Reuse v_result if already calculated
-                    if v_result is None:
-                        v_result = get_word_in_cache(v_raw, lang=lang)
-                    
-                    v_valid = v_result.get("is_valid")
-                    
-                    # Reuse h_result if already calculated
-                    if h_result is None and len(h_raw) >= 2 and is_valid_syllable_pattern(h_raw):
-                        h_result = get_word_in_cache(h_raw, lang=lang)
-                    
-                    h_valid = h_result.get("is_valid") if h_result else len(h_raw) < 2
-
-                    if v_valid and h_valid:
-                        await self.finalize_pending_group(v_group_id, 'v', trigger_tile=placed_tile, pre_result=v_result)
-                        finalized_v = True
-            else:
-                # English validation (existing logic)
-                h_word = self._get_word_at(x, y, 'h')
-                v_word = self._get_word_at(x, y, 'v')
-                
-                h_result = None
-                v_result = None
-
-                if len(h_word) >= 2:
-                    h_result = get_word_in_cache(h_word, lang=lang)
-                    h_valid = h_result.get("is_valid")
-                    
-                    if len(v_word) >= 2:
-                        v_result = get_word_in_cache(v_word, lang=lang)
-                        v_valid = v_result.get("is_valid")
-                    else:
-                        v_valid = len(v_word) < 2
-                    
-                    if h_valid and v_valid:
-                        await self.finalize_pending_group(h_group_id, 'h', trigger_tile=placed_tile, pre_result=h_result)
-                        finalized_h = True
-
-                if len(v_word) >= 2:
-                    if v_result is None:
-                        v_result = get_word_in_cache(v_word, lang=lang)
-                    v_valid = v_result.get("is_valid")
-                    
-                    if h_result is None and len(h_word) >= 2:
-                        h_result = get_word_in_cache(h_word, lang=lang)
-                    h_valid = h_result.get("is_valid") if h_result else len(h_word) < 2
-                    
-                    if v_valid and h_valid:
-                        await self.finalize_pending_group(v_group_id, 'v', trigger_tile=placed_tile, pre_result=v_result)
-                        finalized_v = True
+            # Runs eligible for a dictionary lookup; Korean runs are raw jamos and must
+            # also form valid syllables (the cursors and parses hold the current runs).
+            # Runs with blank tiles are resolved by a trie walk instead of a lookup.
+            def is_candidate(entry):
+                run = entry['cursor'].text
+                return len(run) >= 2 and BLANK_TILE not in run and (lang != 'ko' or entry['parse'].is_valid)
+
+            def has_blank_word(run):
+                return len(run) >= 2 and BLANK_TILE in run and \
+                    resolve_blanks(run, lang, snapshot=self.dictionary) is not None
+
+            h_candidate = is_candidate(h_entry)
+            v_candidate = is_candidate(v_entry)
+            candidates = [run for run, ok in ((h_substring, h_candidate), (v_substring, v_candidate)) if ok]
+            found = iter(validate_words(candidates, lang, snapshot=self.dictionary, overlay=self.word_overlay))
+            h_valid = next(found) is not None if h_candidate else has_blank_word(h_substring)
+            v_valid = next(found) is not None if v_candidate else has_blank_word(v_substring)
+            # A direction may finalize only if the crossing run is a word or still a single tile
+            h_ok = h_valid or len(h_substring) < 2
+            v_ok = v_valid or len(v_substring) < 2
+
+            # A run with blanks is only known to match some word; finalize picks the letters
+            if h_valid and v_ok:
+                pre_result = {"is_valid": True} if h_candidate else None
+                await self.finalize_pending_group(h_group_id, 'h', trigger_tile=placed_tile, pre_result=pre_result)
+                finalized_h = True
+
+            if v_valid and h_ok:
+                pre_result = {"is_valid": True} if v_candidate else None
+                await self.finalize_pending_group(v_group_id, 'v', trigger_tile=placed_tile, pre_result=pre_result)
+                finalized_v = True
 
             # 확정되지 않은 방향만 타이머 시작
             if not finalized_h:
@@ -710,79 +794,92 @@ class GameRoom:
         t = group_tiles[0]
         dx, dy = (1, 0) if direction == 'h' else (0, 1)
         
-        # Create a board dict that ONLY includes confirmed board tiles + THIS group's tiles
+        # A board view (no copy) that ONLY includes confirmed board tiles + THIS group's tiles
         # This prevents dependencies on OTHER pending groups during finalization
-        group_board_dict = {pos: t['letter'] for pos, t in self.board.items()}
-        for gt in group_tiles:
-            group_board_dict[(gt['x'], gt['y'])] = gt['letter']
+        group_board_dict = BoardView(self.board, {(gt['x'], gt['y']): gt for gt in group_tiles})
         
-        # 1. 단어의 시작점 찾기
-        curr_x, curr_y = t['x'], t['y']
-        while (curr_x - dx, curr_y - dy) in group_board_dict:
-            curr_x -= dx
-            curr_y -= dy
-        
-        start_x, start_y = curr_x, curr_y # 시작 좌표 저장
+        # 1. 단어의 시작/끝 찾기 (보드 구간 인덱스로 한 번에)
+        (start_x, start_y), (end_x, end_y) = group_board_dict.run_through(t['x'], t['y'], dx, dy)
 
         # 2. 단어 문자열 구성 및 좌표 리스트 생성
-        word = ""
-        word_coords = [] # 단어를 구성하는 모든 좌표 (기존 + 신규)
-        while (curr_x, curr_y) in group_board_dict:
-            word += group_board_dict[(curr_x, curr_y)]
-            word_coords.append((curr_x, curr_y))
-            curr_x += dx
-            curr_y += dy
+        word = group_board_dict.letters_between((start_x, start_y), (end_x, end_y))
+        # 단어를 구성하는 모든 좌표 (기존 + 신규)
+        if dx:
+            word_coords = [(cx, start_y) for cx in range(start_x, end_x + 1)]
+        else:
+            word_coords = [(start_x, cy) for cy in range(start_y, end_y + 1)]
 
         lang = self.settings.get("lang", "en")
+        cross_direction = 'v' if direction == 'h' else 'h'
+
+        # Blank tiles: pick letters by walking the trie, each blank restricted to the
+        # letters its crossing word allows, then validate the resolved word as usual
+        blank_positions = [pos for pos in word_coords if group_board_dict[pos] == BLANK_TILE]
+        unresolved = False
+        if blank_positions and len(word) >= 2:
+            resolved = self._resolve_group_blanks(word, word_coords, blank_positions, cross_direction, group_board_dict)
+            if resolved is None:
+                unresolved = True
+            else:
+                for i, pos in enumerate(word_coords):
+                    group_board_dict[pos] = resolved[i]
+                word = resolved
+
+        # Korean: one scan gives the syllable check and the composed text for messages
+        if lang == 'ko':
+            pattern_ok, display_word, _, _ = analyze_jamos(word)
+        else:
+            pattern_ok, display_word = True, word
         
-        if pre_result:
+        # The main word is looked up together with the cross words in one batch
+        main_word = None
+        main_rejected = False  # the main word itself is not a word (-> suggestions)
+        if unresolved:
+            logger.debug(f"No word matches blank pattern: {word}")
+            result = {"is_valid": False}
+        elif pre_result and not blank_positions:
             result = pre_result
         elif lang == 'ko' and len(word) >= 2:
-            # word is already composed by _get_word_at, but we have raw jamos on board
-            # Extract raw jamos from board (using group_board_dict)
-            raw_jamos = ""
-            curr_x, curr_y = start_x, start_y
-            while (curr_x, curr_y) in group_board_dict:
-                raw_jamos += group_board_dict[(curr_x, curr_y)]
-                curr_x += dx
-                curr_y += dy
-            
-            # Validate jamo pattern
-            if not is_valid_syllable_pattern(raw_jamos):
-                logger.debug(f"Invalid Korean jamo pattern: {raw_jamos}")
+            # group_board_dict holds raw jamos, so `word` is already the raw jamo string
+            if not pattern_ok:
+                logger.debug(f"Invalid Korean jamo pattern: {word}")
                 result = {"is_valid": False}
+                main_rejected = True
             else:
-                # Compose and validate
-                composed_word = compose_word(raw_jamos)
-                result = get_word_in_cache(raw_jamos, lang=lang)  # Dictionary stores jamo keys
-                logger.debug(f"Korean word validation: {raw_jamos} -> {composed_word} = {result.get('is_valid')}")
+                main_word = word  # Dictionary stores jamo keys
+                result = {"is_valid": True}
+        elif len(word) >= 2:
+            main_word = word
+            result = {"is_valid": True}
         else:
-            # English or single character
-            if len(word) >= 2:
-                result = get_word_in_cache(word, lang=lang)
-            else:
-                result = {"is_valid": False, "skip_penalty": True}
+            # Single character
+            result = {"is_valid": False, "skip_penalty": True}
 
         # 3. 모든 타일에 대해 교차 방향 단어도 유효한지 확인 (Scrabble Rule)
         # 단, 이미 보드에 확정된 타일들로만 이루어진 cross word는 검증 건너뛰기
         if result.get("is_valid"):
-            cross_direction = 'v' if direction == 'h' else 'h'
-            cdx, cdy = (1, 0) if cross_direction == 'h' else (0, 1)
-            pending_coords = {(pt['x'], pt['y']) for pt in self.pending_tiles}
-            
+            group_coords = {(gt['x'], gt['y']) for gt in group_tiles}
+            cross_words = []
             for bx, by in word_coords:
                 # Skip if this coordinate is not a group tile (already on board)
-                # Note: group_tiles includes ALL tiles in the current pending group
-                is_group_tile = any(gt['x'] == bx and gt['y'] == by for gt in group_tiles)
-                if not is_group_tile:
+                if (bx, by) not in group_coords:
                     continue
-                    
-                cross_word = self._get_word_at(bx, by, cross_direction, board_dict=group_board_dict)
-                if len(cross_word) >= 2:
-                    # Current group always contains the tiles we're validating, 
-                    # so no need to check has_pending (it's always True for a group tile)
-                    cross_result = get_word_in_cache(cross_word, lang=lang)
-                    if not cross_result.get("is_valid"):
+                # Looked up as raw jamos for Korean (the dictionary's keys)
+                cross_word = self._get_raw_jamos_at(bx, by, cross_direction, board_dict=group_board_dict)
+                if self._is_cross_word(cross_word):
+                    cross_words.append(((bx, by), cross_word))
+
+            batch = ([main_word] if main_word else []) + [cw for _, cw in cross_words]
+            found = validate_words(batch, lang, snapshot=self.dictionary, overlay=self.word_overlay)
+            if main_word:
+                result["is_valid"] = found[0] is not None
+                main_rejected = not result["is_valid"]
+                if lang == 'ko':
+                    logger.debug(f"Korean word validation: {main_word} -> {display_word} = {result['is_valid']}")
+                found = found[1:]
+            if result["is_valid"]:
+                for ((bx, by), cross_word), entry in zip(cross_words, found):
+                    if entry is None:
                         logger.debug(f"Invalid cross word '{cross_word}' found at ({bx}, {by}) while validating '{word}'")
                         result["is_valid"] = False
                         break
@@ -809,7 +906,9 @@ class GameRoom:
             
             for gt in group_tiles:
                 # Place tile returns False if already on board (e.g. from intersecting word)
-                newly_placed = self.place_tile(gt['x'], gt['y'], gt['letter'], gt['player_id'], 0, new_color, consume_hand=False)
+                letter = group_board_dict[(gt['x'], gt['y'])]
+                newly_placed = self.place_tile(gt['x'], gt['y'], letter, gt['player_id'], 0, new_color, consume_hand=False,
+                                               blank=gt['letter'] == BLANK_TILE)
                 
                 if gt['player_id'] in self.players:
                     # Award points regardless of whether it was already on board
@@ -825,14 +924,22 @@ class GameRoom:
                 self.draw_tiles_for_player(player_id, tile_count)
 
             # pending_tiles 정리 (Broadcasting 전에 수행해야 정확한 상태가 전달됨)
-            self.pending_tiles = [pt for pt in self.pending_tiles if (pt['x'], pt['y']) not in self.board]
+            # Only this word's positions can have just moved to the board: drop their pending tiles by index
+            for pos in word_coords:
+                pt = self.pending_tiles.by_position.get(pos)
+                while pt is not None and pos in self.board:
+                    self.pending_tiles.remove(pt)
+                    pt = self.pending_tiles.by_position.get(pos)
+            # Crossing groups of the finalized tiles cached runs that may hold a blank the
+            # word just resolved: drop them, the next placement rescans from the board
+            self._drop_group_cursors(group_tiles)
 
             # Broadcast word completion with animation data
             completed_tiles = [{'x': bx, 'y': by, 'letter': self.board[(bx, by)]['letter'], 'color': new_color} 
                              for bx, by in word_coords if (bx, by) in self.board]
             await self.broadcast({"type": "WORD_COMPLETED", "word": word, "tiles": completed_tiles})
             await self.broadcast_state()
-            await self.broadcast({"type": "MODAL", "message": f"Word completed: {word}"})
+            await self.broadcast({"type": "MODAL", "message": f"Word completed: {display_word}"})
         
         else:
             # Invalid Word Penalty (5 points for final word validation failure)
@@ -858,7 +965,14 @@ class GameRoom:
                 
                 if penalized_players:
                     logger.info(f"Penalty applied to players {penalized_players} for invalid word: {word}")
-                    await self.broadcast({"type": "MODAL", "message": f"Invalid word: {word}. -{penalty_points} points penalty!"})
+                    message = f"Invalid word: {display_word}. -{penalty_points} points penalty!"
+                    # "Did you mean": nearest dictionary words, time-boxed so finalize stays fast
+                    suggestions = suggest_words(word, lang, snapshot=self.dictionary) if main_rejected else []
+                    if lang == 'ko':
+                        suggestions = [compose_word(s) for s in suggestions]
+                    if suggestions:
+                        message += f" Did you mean: {', '.join(suggestions)}?"
+                    await self.broadcast({"type": "MODAL", "message": message, "suggestions": suggestions})
             # 4. 검증 실패 시 해당 방향 타이머 정보 제거 (현재 로직이 직접 실행 중이므로)
             key = f"{direction}:{group_id}"
             if self.group_timers.get(key) == asyncio.current_task() or \
@@ -895,8 +1009,48 @@ class GameRoom:
                 await self.broadcast({"type": "TILE_REMOVED", "tiles": to_remove})
                 
             self.pending_tiles = [pt for pt in self.pending_tiles if not should_remove(pt)]
+            self._drop_group_cursors(to_remove)
             await self.broadcast_state()
 
+    def _is_cross_word(self, run: str) -> bool:
+        """
+        Whether a crossing run counts as a word to validate.
+
+        Korean runs (raw jamos) need at least two composed characters, i.e.
+        two syllables for a well-formed run; other languages two letters.
+        """
+        if self.settings.get("lang", "en") == 'ko':
+            return len(analyze_jamos(run)[1]) >= 2
+        return len(run) >= 2
+
+    def _resolve_group_blanks(self, word: str, word_coords: List, blank_positions: List, cross_direction: str,
+                              board_dict: BoardView) -> Optional[str]:
+        """
+        Letters for the blanks of a group's word, as the resolved word (None if none fit).
+
+        A blank with a crossing word may only become a letter that also makes the
+        crossing word valid, so one letter satisfies both directions. Letters that
+        leave the crossing run too short to count (_is_cross_word) are allowed too.
+        """
+        lang = self.settings.get("lang", "en")
+        cdx, cdy = (1, 0) if cross_direction == 'h' else (0, 1)
+        choices = {}
+        for pos in blank_positions:
+            cross = self._get_raw_jamos_at(pos[0], pos[1], cross_direction, board_dict=board_dict)
+            if len(cross) < 2:
+                continue
+            first, _ = board_dict.run_through(pos[0], pos[1], cdx, cdy)
+            offset = (pos[0] - first[0]) + (pos[1] - first[1])
+            allowed = blank_choices(cross, lang, snapshot=self.dictionary).get(offset, set())
+            if lang == 'ko':
+                # 한 음절로 남는 교차 단어는 검사하지 않으므로, 그렇게 만드는 자모도 허용
+                allowed |= {jamo for jamo in KOREAN_JAMOS
+                            if not self._is_cross_word(cross[:offset] + jamo + cross[offset + 1:])}
+            if not allowed:
+                return None
+            choices[word_coords.index(pos)] = allowed
+        return resolve_blanks(word, lang, snapshot=self.dictionary, choices=choices)
+
     async def handle_end_game(self):
         """게임을 종료하고 결과를 저장합니다."""
         if self.room_timer_task:
@@ -912,6 +1066,7 @@ class GameRoom:
         players_data = {pid: p.to_dict() for pid, p in self.players.items()}
         game_id = await save_game_result(self.room_code, players_data)
         self.status = "FINISHED"
+        self.dictionary = None  # 이전 사전 버전 해제
         
         # 방 제거 예약 (1분 뒤)
         asyncio.create_task(self._cleanup_room())
@@ -925,9 +1080,53 @@ class GameRoom:
 
     def update_settings(self, settings: dict):
         """방 설정을 업데이트합니다."""
+        settings = dict(settings)
+        word_list = settings.pop("word_list", ...)
         self.settings.update(settings)
+        lang = self.settings.get("lang", "en")
+        if word_list is not ...:
+            self._set_word_list(word_list)
+        elif self.word_overlay is not None and self.word_overlay.lang != lang:
+            logger.info(f"Room {self.room_code}: word list dropped after language change to {lang}")
+            self._set_word_list(None)
         logger.info(f"Room settings updated for {self.room_code}: {self.settings}")
 
+    def _set_word_list(self, word_list: Optional[dict]):
+        """
+        방 전용 단어 목록을 설정합니다: {"mode": "allow" | "deny", "words": [...]}, None이면 해제.
+
+        공유 사전은 복사하지 않고 WordOverlay(해시 집합 + 작은 델타 오토마톤)만 만듭니다.
+        """
+        if not word_list or not word_list.get("words"):
+            self.word_overlay = None
+            self.settings.pop("word_list", None)
+            return
+        words = word_list["words"]
+        if len(words) > WORD_LIST_MAX_WORDS:
+            logger.warning(f"Room {self.room_code}: word list of {len(words)} words exceeds {WORD_LIST_MAX_WORDS}, ignored")
+            return
+        try:
+            overlay = WordOverlay(words, word_list.get("mode", "allow"), self.settings.get("lang", "en"), build=False)
+        except ValueError as e:
+            logger.warning(f"Room {self.room_code}: invalid word list: {e}")
+            return
+        # 큰 허용 목록의 델타 오토마톤은 이벤트 루프를 막지 않도록 스레드에서 만듭니다
+        try:
+            build = asyncio.get_running_loop().run_in_executor(None, overlay.build_factors)
+        except RuntimeError:
+            overlay.build_factors()
+        else:
+            build.add_done_callback(self._word_list_built)
+            self.word_list_build = build
+        self.word_overlay = overlay
+        self.settings["word_list"] = overlay.summary()
+
+    def _word_list_built(self, build: asyncio.Future):
+        """델타 오토마톤 빌드 완료 콜백: 실패하면 기록합니다 (그동안 접두사 검사는 허용으로 남음)."""
+        if not build.cancelled() and build.exception() is not None:
+            logger.error(f"Room {self.room_code}: word list automaton build failed, "
+                         f"prefix checks stay permissive: {build.exception()!r}")
+
 class RoomManager:
     def __init__(self):
         self.rooms: Dict[str, GameRoom] = {}
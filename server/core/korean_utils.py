@@ -2,6 +2,10 @@
 Korean Jamo (자모) Decomposition and Composition Utilities
 
 Handles conversion between Korean syllables and their constituent jamos (consonants and vowels).
+
+All conversions are table lookups: jamo -> index dicts and the full
+11,172-syllable table (both directions) are built once at import, so no
+call scans the jamo lists, and decompose_word is a single str.translate.
 """
 
 # Hangul Unicode Constants
@@ -33,6 +37,21 @@ ALL_CHOSUNG = set(CHOSUNG_LIST)
 ALL_JUNGSUNG = set(JUNGSUNG_LIST)
 ALL_JONGSUNG = set(JONGSUNG_LIST[1:])  # Exclude empty string
 
+# Jamo -> position in the lists above ('' -> 0 for no final consonant)
+CHOSUNG_INDEX = {cho: i for i, cho in enumerate(CHOSUNG_LIST)}
+JUNGSUNG_INDEX = {jung: i for i, jung in enumerate(JUNGSUNG_LIST)}
+JONGSUNG_INDEX = {jong: i for i, jong in enumerate(JONGSUNG_LIST)}
+
+# Syllable tables, built once: code (ord - HANGUL_BASE) -> (초성, 중성, 종성) and back
+SYLLABLE_COUNT = len(CHOSUNG_LIST) * len(JUNGSUNG_LIST) * len(JONGSUNG_LIST)  # 11,172
+SYLLABLE_JAMOS = [
+    (CHOSUNG_LIST[code // 588], JUNGSUNG_LIST[code // 28 % 21], JONGSUNG_LIST[code % 28])
+    for code in range(SYLLABLE_COUNT)
+]
+SYLLABLE_BY_JAMOS = {jamos: chr(HANGUL_BASE + code) for code, jamos in enumerate(SYLLABLE_JAMOS)}
+# str.translate table: syllable code point -> jamo string
+_DECOMPOSE_TABLE = {HANGUL_BASE + code: ''.join(jamos) for code, jamos in enumerate(SYLLABLE_JAMOS)}
+
 
 def is_hangul_syllable(char: str) -> bool:
     """Check if a character is a complete Hangul syllable."""
@@ -58,18 +77,7 @@ def decompose_syllable(syllable: str) -> tuple:
     """
     if not is_hangul_syllable(syllable):
         return (syllable, '', '')  # Return as-is if not Hangul
-    
-    code = ord(syllable) - HANGUL_BASE
-    
-    jong_idx = code % 28
-    jung_idx = ((code - jong_idx) // 28) % 21
-    cho_idx = ((code - jong_idx) // 28) // 21
-    
-    cho = CHOSUNG_LIST[cho_idx]
-    jung = JUNGSUNG_LIST[jung_idx]
-    jong = JONGSUNG_LIST[jong_idx]
-    
-    return (cho, jung, jong)
+    return SYLLABLE_JAMOS[ord(syllable) - HANGUL_BASE]
 
 
 def compose_syllable(cho: str, jung: str, jong: str = '') -> str:
@@ -88,15 +96,10 @@ def compose_syllable(cho: str, jung: str, jong: str = '') -> str:
         compose_syllable('ㅎ', 'ㅏ', 'ㄴ') -> '한'
         compose_syllable('ㄱ', 'ㅏ') -> '가'
     """
-    if cho not in CHOSUNG_LIST or jung not in JUNGSUNG_LIST:
+    syllable = SYLLABLE_BY_JAMOS.get((cho, jung, jong))
+    if syllable is None:
         return cho + jung + jong  # Return concatenated if invalid
-    
-    cho_idx = CHOSUNG_LIST.index(cho)
-    jung_idx = JUNGSUNG_LIST.index(jung)
-    jong_idx = JONGSUNG_LIST.index(jong) if jong else 0
-    
-    code = HANGUL_BASE + (cho_idx * 21 * 28) + (jung_idx * 28) + jong_idx
-    return chr(code)
+    return syllable
 
 
 def decompose_word(word: str) -> str:
@@ -113,17 +116,8 @@ def decompose_word(word: str) -> str:
         decompose_word('사과') -> 'ㅅㅏㄱㅘ'
         decompose_word('한글') -> 'ㅎㅏㄴㄱㅡㄹ'
     """
-    jamos = []
-    for char in word:
-        if is_hangul_syllable(char):
-            cho, jung, jong = decompose_syllable(char)
-            jamos.append(cho)
-            jamos.append(jung)
-            if jong:
-                jamos.append(jong)
-        else:
-            jamos.append(char)  # Keep non-Hangul as-is
-    return ''.join(jamos)
+    # Non-Hangul characters are not in the table and stay as-is
+    return word.translate(_DECOMPOSE_TABLE)
 
 
 def compose_word(jamos: str) -> str:
@@ -140,38 +134,26 @@ def compose_word(jamos: str) -> str:
     Invalid patterns will be concatenated as-is.
     """
     result = []
+    append = result.append
+    n = len(jamos)
     i = 0
     
-    while i < len(jamos):
-        # Try to build a syllable
-        if i < len(jamos) and jamos[i] in ALL_CHOSUNG:
-            cho = jamos[i]
-            i += 1
-            
-            # Check for middle vowel
-            if i < len(jamos) and jamos[i] in ALL_JUNGSUNG:
-                jung = jamos[i]
-                i += 1
-                
-                # Check for optional final consonant
-                jong = ''
-                if i < len(jamos) and jamos[i] in ALL_JONGSUNG:
-                    # Peek ahead: is next char a vowel? If so, this is initial consonant of next syllable
-                    if i + 1 < len(jamos) and jamos[i + 1] in ALL_JUNGSUNG:
-                        # Don't consume as jong
-                        pass
-                    else:
-                        jong = jamos[i]
-                        i += 1
-                
-                result.append(compose_syllable(cho, jung, jong))
-            else:
-                # No vowel after consonant, just append
-                result.append(cho)
-        else:
-            # Not a valid start, just append
-            result.append(jamos[i])
+    while i < n:
+        cho = jamos[i]
+        i += 1
+        # Try to build a syllable: 초성 + 중성
+        if cho not in CHOSUNG_INDEX or i >= n or jamos[i] not in JUNGSUNG_INDEX:
+            append(cho)  # Not a valid start (or no vowel follows), just append
+            continue
+        code = CHOSUNG_INDEX[cho] * 588 + JUNGSUNG_INDEX[jamos[i]] * 28
+        i += 1
+        
+        # Optional final consonant, unless the next char is a vowel
+        # (then it is the initial consonant of the next syllable)
+        if i < n and jamos[i] in ALL_JONGSUNG and (i + 1 >= n or jamos[i + 1] not in JUNGSUNG_INDEX):
+            code += JONGSUNG_INDEX[jamos[i]]
             i += 1
+        append(chr(HANGUL_BASE + code))
     
     return ''.join(result)
 
@@ -228,6 +210,146 @@ def is_valid_syllable_pattern(jamos: str) -> bool:
     return syllable_count > 0
 
 
+def _is_syllable(char: str) -> bool:
+    return HANGUL_BASE <= ord(char) <= HANGUL_END
+
+
+def analyze_jamos(jamos: str) -> tuple:
+    """
+    Validate, compose and split a jamo sequence in a single scan.
+    
+    Same state machine as is_valid_syllable_pattern and compose_word, so a
+    caller that needs several of their answers walks the jamos once.
+    
+    Args:
+        jamos: Jamo string to analyse
+        
+    Returns:
+        (is_valid, composed, syllable_count, boundaries):
+        is_valid as is_valid_syllable_pattern, composed as compose_word,
+        the number of Hangul syllables in composed (count_syllables when
+        valid) and the jamo offset where each character of composed starts.
+        
+    Example:
+        analyze_jamos('ㅅㅏㄱㅘ') -> (True, '사과', 2, (0, 2))
+        analyze_jamos('ㅎㅏㄴㄱ') -> (False, '한ㄱ', 1, (0, 3))
+    """
+    chars = []
+    append = chars.append
+    boundaries = []
+    mark = boundaries.append
+    n = len(jamos)
+    valid = n > 0
+    syllables = 0
+    i = 0
+    
+    while i < n:
+        mark(i)
+        cho = jamos[i]
+        i += 1
+        if cho not in CHOSUNG_INDEX or i >= n or jamos[i] not in JUNGSUNG_INDEX:
+            valid = False  # 초성 + 중성 required
+            append(cho)
+            continue
+        code = CHOSUNG_INDEX[cho] * 588 + JUNGSUNG_INDEX[jamos[i]] * 28
+        i += 1
+        if i < n and jamos[i] in ALL_JONGSUNG and (i + 1 >= n or jamos[i + 1] not in JUNGSUNG_INDEX):
+            code += JONGSUNG_INDEX[jamos[i]]
+            i += 1
+        append(chr(HANGUL_BASE + code))
+        syllables += 1
+    
+    return valid, ''.join(chars), syllables, tuple(boundaries)
+
+
+class SyllableParse:
+    """
+    analyze_jamos() for a run that grows one jamo at a time, at either end.
+    
+    A consonant followed by a vowel always starts a syllable, whatever comes
+    before it (it can never be the previous syllable's 종성), so the parse
+    splits cleanly in front of every composed syllable. Appending only
+    re-parses the jamos from the start of the last syllable, prepending only
+    those before the first one: a few jamos, however long the run.
+    
+    Parses are immutable: appended()/prepended() return new parses.
+    
+    Attributes:
+        text: The jamo run
+        composed: compose_word(text)
+        syllable_count: Hangul syllables in composed
+    """
+    
+    __slots__ = ('text', 'composed', 'syllable_count', '_lone', '_first', '_last')
+    
+    def __init__(self, text: str):
+        _, composed, syllables, boundaries = analyze_jamos(text)
+        self._set(text, composed, syllables, len(composed) - syllables, None, None)
+        # (jamo offset, composed offset) of the first and last syllable: the split points.
+        # Nothing before the first or after the last is a syllable.
+        spans = [(boundaries[i], i) for i, char in enumerate(composed) if _is_syllable(char)]
+        if spans:
+            self._first, self._last = spans[0], spans[-1]
+    
+    def _set(self, text: str, composed: str, syllables: int, lone: int, first, last) -> None:
+        self.text = text
+        self.composed = composed
+        self.syllable_count = syllables
+        self._lone = lone
+        self._first = first
+        self._last = last
+    
+    @property
+    def is_valid(self) -> bool:
+        """is_valid_syllable_pattern(text)"""
+        return self._lone == 0 and bool(self.text)
+    
+    def appended(self, jamo: str) -> 'SyllableParse':
+        text = self.text + jamo
+        if self._last is None:
+            return SyllableParse(text)
+        last, last_c = self._last
+        # Re-parse from the last syllable on (one syllable + lone jamos); the rest is unchanged
+        _, tail, syllables, boundaries = analyze_jamos(text[last:])
+        i = len(tail) - 1
+        while not _is_syllable(tail[i]):  # the tail starts with a syllable
+            i -= 1
+        parse = SyllableParse.__new__(SyllableParse)
+        parse._set(
+            text,
+            self.composed[:last_c] + tail,
+            self.syllable_count - 1 + syllables,
+            self._lone - (len(self.composed) - last_c - 1) + len(tail) - syllables,
+            self._first,
+            (last + boundaries[i], last_c + i),
+        )
+        return parse
+    
+    def prepended(self, jamo: str) -> 'SyllableParse':
+        text = jamo + self.text
+        if self._first is None:
+            return SyllableParse(text)
+        first, first_c = self._first
+        # Re-parse up to the first syllable (lone jamos only); the rest only shifts
+        _, head, syllables, boundaries = analyze_jamos(text[:first + 1])
+        shift = len(head) - first_c
+        new_first = (first + 1, first_c + shift)
+        for i, char in enumerate(head):
+            if _is_syllable(char):
+                new_first = (boundaries[i], i)
+                break
+        parse = SyllableParse.__new__(SyllableParse)
+        parse._set(
+            text,
+            head + self.composed[first_c:],
+            self.syllable_count + syllables,
+            self._lone - first_c + len(head) - syllables,
+            new_first,
+            (self._last[0] + 1, self._last[1] + shift),
+        )
+        return parse
+
+
 def count_syllables(jamos: str) -> int:
     """
     Count the number of syllables in a jamo sequence.
@@ -0,0 +1,313 @@
+"""
+Compact Lexicon
+
+Columnar replacement for the dict-of-tuples word cache: one blob of
+concatenated UTF-8 words, an offsets array and parallel length/score
+columns, ordered by (length, word) so every length is a contiguous range.
+
+Lookups go through a perfect hash (CHD, "compress, hash and displace")
+built on zlib.crc32/adler32, which are stable across processes so the
+tables can be stored in the dictionary artifact. The hash maps any
+string to some row; the row's bytes are compared to reject misses.
+"""
+
+import random
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from typing import Dict, List, Optional, Tuple
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_EMPTY = 0xFFFFFFFF
+_DIRECT = 0x80000000  # disp flag: low bits are the slot itself (singleton buckets)
+
+
+def encode_word_table(words: Dict[str, Tuple[int, int]]) -> Dict[str, object]:
+    """
+    Encode word -> (length, score) as columnar arrays.
+
+    Words are ordered by (length, word) so each length is one contiguous
+    range; ``by_length`` holds flattened (length, start, end) triples.
+    """
+    ordered = sorted(words.items(), key=lambda item: (item[1][0], item[0]))
+    blob = bytearray()
+    offsets = array('I', [0])
+    lengths = array('H')
+    scores = array('H')
+    by_length = array('I')
+
+    for i, (word, (length, score)) in enumerate(ordered):
+        if not (0 <= length <= 0xFFFF and 0 <= score <= 0xFFFF):
+            raise ValueError(f"Length/score out of range for {word!r}: {(length, score)}")
+        blob += word.encode('utf-8')
+        offsets.append(len(blob))
+        lengths.append(length)
+        scores.append(score)
+        if not by_length or by_length[-3] != length:
+            if by_length:
+                by_length[-1] = i
+            by_length.extend((length, i, i))
+    if by_length:
+        by_length[-1] = len(ordered)
+
+    return {
+        'words.blob': blob,
+        'words.offsets': offsets,
+        'words.length': lengths,
+        'words.score': scores,
+        'by_length': by_length,
+    }
+
+
+def _next_prime(n: int) -> int:
+    candidate = max(n, 2)
+    while any(candidate % f == 0 for f in range(2, int(candidate ** 0.5) + 1)):
+        candidate += 1
+    return candidate
+
+
+def _slot(key: bytes, h1: int, d: int, m: int, size: int) -> int:
+    # The step is never 0 mod the (prime) table size, so d = 0..size-1 visits every slot
+    return (zlib.adler32(key) + d * ((h1 // m) % (size - 1) + 1)) % size
+
+
+def _place_buckets(keys: List[bytes], hashes: List[int], buckets: List[List[int]], size: int):
+    """Displace buckets into a table of the given size; None if some bucket cannot fit."""
+    m = len(buckets)
+    disp = array('I', [0]) * m
+    slots = array('I', [_EMPTY]) * size
+    # Largest buckets first, while the table is still mostly empty
+    order = sorted(range(m), key=lambda b: len(buckets[b]), reverse=True)
+    free = None
+    for b in order:
+        members = buckets[b]
+        if len(members) > 1:
+            for d in range(size):
+                positions = {_slot(keys[i], hashes[i], d, m, size) for i in members}
+                if len(positions) == len(members) and all(slots[p] == _EMPTY for p in positions):
+                    break
+            else:
+                return None
+            disp[b] = d
+            for i in members:
+                slots[_slot(keys[i], hashes[i], d, m, size)] = i
+        elif members:
+            # Singletons take any free slot directly, no search needed
+            if free is None:
+                free = [p for p in range(size) if slots[p] == _EMPTY]
+            p = free.pop()
+            disp[b] = _DIRECT | p
+            slots[p] = members[0]
+    return disp, slots
+
+
+def build_perfect_hash(keys: List[bytes], bucket_size: int = 2):
+    """
+    Build a CHD perfect hash over distinct keys.
+
+    The table has the next prime >= len(keys) slots (a larger prime in the
+    rare case two keys of a bucket cannot be separated), so it is minimal
+    up to a handful of empty slots.
+
+    Returns:
+        (disp, slots): ``disp`` has one displacement per bucket
+        (crc32 % len(disp)); ``slots`` maps each hash slot to a key index
+        or _EMPTY.
+    """
+    if len(set(keys)) != len(keys):
+        raise ValueError("Perfect hash keys must be distinct")
+    m = max(1, len(keys) // bucket_size)
+    hashes = [zlib.crc32(key) for key in keys]
+    buckets: List[List[int]] = [[] for _ in range(m)]
+    for i, h1 in enumerate(hashes):
+        buckets[h1 % m].append(i)
+
+    size = _next_prime(len(keys))
+    while True:
+        placed = _place_buckets(keys, hashes, buckets, size)
+        if placed is not None:
+            return placed
+        size = _next_prime(size + 1)
+
+
+class LengthBucket(Sequence):
+    """Words of one length: a read-only sequence over a lexicon row range."""
+
+    __slots__ = ('_lexicon', '_start', '_end')
+
+    def __init__(self, lexicon: 'CompactLexicon', start: int, end: int):
+        self._lexicon = lexicon
+        self._start = start
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LengthBucket index out of range")
+        return self._lexicon.word_at(self._start + index)
+
+
+class LengthSampler:
+    """
+    Uniform random word for a length range in O(log L), L = distinct lengths.
+
+    Precomputes the sorted lengths and cumulative bucket sizes of a
+    length -> sequence-of-words index; a query picks a global rank in the
+    eligible range and bisects to its bucket, without building a list.
+    """
+
+    def __init__(self, buckets: Mapping):
+        self.buckets = buckets
+        self.lengths = sorted(length for length, words in buckets.items() if len(words))
+        self.cumulative = [0]
+        for length in self.lengths:
+            self.cumulative.append(self.cumulative[-1] + len(buckets[length]))
+
+    def sample(self, min_length: int = None, max_length: int = None,
+               rng: random.Random = random) -> Optional[str]:
+        """Random word with min_length <= length <= max_length (None = unbounded), or None."""
+        lo = 0 if min_length is None else bisect_left(self.lengths, min_length)
+        hi = len(self.lengths) if max_length is None else bisect_right(self.lengths, max_length)
+        if lo >= hi:
+            return None
+        rank = rng.randrange(self.cumulative[lo], self.cumulative[hi])
+        i = bisect_right(self.cumulative, rank) - 1
+        return self.buckets[self.lengths[i]][rank - self.cumulative[i]]
+
+
+class CompactLexicon(Mapping):
+    """
+    Read-only word -> (length, score) mapping over columnar arrays.
+
+    Behaves like the dict it replaces (``in``, ``[]``, ``get``, ``len``,
+    iteration in (length, word) order); ``by_length()`` replaces the
+    words_by_length lists with zero-copy LengthBucket views.
+    """
+
+    def __init__(self):
+        self.blob = b''
+        self.offsets = array('I', [0])
+        self.lengths = array('H')
+        self.scores = array('H')
+        self.length_ranges = array('I')
+        self.disp = array('I', [0])
+        self.slots = array('I')
+
+    @classmethod
+    def build(cls, words: Dict[str, Tuple[int, int]]) -> 'CompactLexicon':
+        """
+        Build a lexicon from word -> (length, score).
+
+        Args:
+            words: Mapping of word to (length, score)
+        """
+        columns = encode_word_table(words)
+        lexicon = cls()
+        lexicon.blob = bytes(columns['words.blob'])
+        lexicon.offsets = columns['words.offsets']
+        lexicon.lengths = columns['words.length']
+        lexicon.scores = columns['words.score']
+        lexicon.length_ranges = columns['by_length']
+
+        keys = [lexicon._key_at(i) for i in range(len(lexicon.lengths))]
+        lexicon.disp, lexicon.slots = build_perfect_hash(keys)
+        logger.info(f"Built CompactLexicon with {len(lexicon)} words, {lexicon.memory_usage()} bytes")
+        return lexicon
+
+    def to_buffers(self):
+        """Return (meta, buffers) for serialization; see from_buffers."""
+        meta = {'word_count': len(self.lengths)}
+        return meta, {
+            'blob': self.blob, 'offsets': self.offsets, 'length': self.lengths,
+            'score': self.scores, 'by_length': self.length_ranges,
+            'mph_disp': self.disp, 'mph_slots': self.slots,
+        }
+
+    @classmethod
+    def from_buffers(cls, meta: dict, buffers: dict) -> 'CompactLexicon':
+        """Rebuild a lexicon around existing buffers without copying them."""
+        lexicon = cls()
+        lexicon.blob = buffers['blob']
+        lexicon.offsets = buffers['offsets']
+        lexicon.lengths = buffers['length']
+        lexicon.scores = buffers['score']
+        lexicon.length_ranges = buffers['by_length']
+        lexicon.disp = buffers['mph_disp']
+        lexicon.slots = buffers['mph_slots']
+        return lexicon
+
+    def _key_at(self, row: int) -> bytes:
+        return bytes(self.blob[self.offsets[row]:self.offsets[row + 1]])
+
+    def word_at(self, row: int) -> str:
+        """Decode the word stored in row."""
+        return str(self.blob[self.offsets[row]:self.offsets[row + 1]], 'utf-8')
+
+    def _row(self, word: str) -> int:
+        """Row of word, or -1 if absent."""
+        if not self.lengths or not isinstance(word, str):
+            return -1
+        # Inlined _slot(): this is the per-placement hot path
+        key = word.encode('utf-8')
+        h1 = zlib.crc32(key)
+        m = len(self.disp)
+        d = self.disp[h1 % m]
+        if d & _DIRECT:
+            slot = d ^ _DIRECT
+        else:
+            size = len(self.slots)
+            slot = (zlib.adler32(key) + d * ((h1 // m) % (size - 1) + 1)) % size
+        row = self.slots[slot]
+        if row == _EMPTY:
+            return -1
+        offsets = self.offsets
+        if self.blob[offsets[row]:offsets[row + 1]] != key:
+            return -1
+        return row
+
+    def get(self, word: str, default=None) -> Optional[Tuple[int, int]]:
+        row = self._row(word)
+        if row < 0:
+            return default
+        return self.lengths[row], self.scores[row]
+
+    def __getitem__(self, word: str) -> Tuple[int, int]:
+        row = self._row(word)
+        if row < 0:
+            raise KeyError(word)
+        return self.lengths[row], self.scores[row]
+
+    def __contains__(self, word) -> bool:
+        return self._row(word) >= 0
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __iter__(self):
+        for row in range(len(self.lengths)):
+            yield self.word_at(row)
+
+    def by_length(self) -> Dict[int, LengthBucket]:
+        """length -> LengthBucket, the words_by_length index without word copies."""
+        ranges = self.length_ranges
+        return {
+            ranges[i]: LengthBucket(self, ranges[i + 1], ranges[i + 2])
+            for i in range(0, len(ranges), 3)
+        }
+
+    def memory_usage(self) -> int:
+        """Return memory usage of the blob and arrays in bytes."""
+        return len(self.blob) + sum(
+            column.itemsize * len(column)
+            for column in (self.offsets, self.lengths, self.scores,
+                           self.length_ranges, self.disp, self.slots)
+        )
@@ -0,0 +1,207 @@
+"""
+Wildcard Pattern Search over a Trie
+
+Matches patterns such as ``C?T*`` against the words of a trie engine
+(``?`` = exactly one character, ``*`` = any run, possibly empty) by a
+depth-first walk that only enters children the pattern can still accept.
+Literal-only positions follow a single edge; wildcards fan out.
+
+The pattern is run as an NFA: each trie node carries the set of pattern
+positions it can be in, so every node is visited at most once and every
+word is reported once. Children are walked in character order, so
+results come out sorted and ``after=<last word>`` resumes a page.
+
+A leading ``*`` gives the forward walk nothing to prune on, so patterns
+anchored only at their end (``*ING``) are run reversed over the reverse
+trie instead; results then come in order of the reversed word, and the
+cursor is in that order too.
+
+PatternSearch.stream() runs the walk in short slices on the event loop,
+with a result limit and a total time budget per query.
+"""
+
+import asyncio
+import time
+from typing import Dict, FrozenSet, Iterator, Optional, Set
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+WILDCARD_ONE = '?'
+WILDCARD_ANY = '*'
+
+# Nodes visited between time checks, and how long one slice may hold the loop
+CHECK_EVERY = 64
+SLICE_SECONDS = 0.005
+
+
+def normalize_pattern(pattern: str) -> str:
+    """Collapse runs of '*' (they match the same words as a single '*')."""
+    out = []
+    for char in pattern:
+        if char == WILDCARD_ANY and out and out[-1] == WILDCARD_ANY:
+            continue
+        out.append(char)
+    return ''.join(out)
+
+
+def walks_reversed(pattern: str) -> bool:
+    """True if pattern is anchored at its end only, so the reverse trie prunes it better."""
+    return pattern.startswith(WILDCARD_ANY) and not pattern.endswith(WILDCARD_ANY)
+
+
+class PatternSearch:
+    """
+    One pattern query over a trie engine (dict, double_array or dawg).
+
+    Attributes:
+        cursor: Prefix of the last visited node; passing it back as
+                ``after`` continues exactly where this search stopped
+        stopped: None when the walk finished, else 'limit' or 'time'
+
+    With reverse=True, trie holds reversed words and pattern/after are
+    given reversed; matches are reported the right way round.
+
+    choices optionally narrows the '?' at a pattern position to a set of
+    characters (used to resolve blank tiles against their crossing words);
+    positions count in the pattern as given, so it must not hold '**'.
+    """
+
+    def __init__(self, trie, pattern: str, after: Optional[str] = None, reverse: bool = False,
+                 choices: Optional[Dict[int, Set[str]]] = None):
+        self.trie = trie
+        self.pattern = normalize_pattern(pattern)
+        self.after = after
+        self.reverse = reverse
+        self.choices = choices or {}
+        self.cursor = after
+        self.stopped = None
+        self.visited = 0
+        self._steps = {}
+        self._fanout = {}
+
+        # Positions reachable without consuming a character ('*' may match nothing)
+        n = len(self.pattern)
+        self._closure = [frozenset()] * (n + 1)
+        self._closure[n] = frozenset((n,))
+        for i in range(n - 1, -1, -1):
+            here = frozenset((i,))
+            self._closure[i] = here | self._closure[i + 1] if self.pattern[i] == WILDCARD_ANY else here
+
+    def _step(self, positions: FrozenSet[int], char: str) -> FrozenSet[int]:
+        """Positions after consuming char (memoized per position set)."""
+        key = (positions, char)
+        result = self._steps.get(key)
+        if result is None:
+            pattern = self.pattern
+            result = frozenset()
+            for i in positions:
+                if i == len(pattern):
+                    continue
+                p = pattern[i]
+                if p == WILDCARD_ANY:
+                    result |= self._closure[i]
+                elif p == char or (p == WILDCARD_ONE and (i not in self.choices or char in self.choices[i])):
+                    result |= self._closure[i + 1]
+            self._steps[key] = result
+        return result
+
+    def _literals(self, positions: FrozenSet[int]) -> Optional[list]:
+        """The only characters positions can consume, or None if a wildcard accepts any."""
+        if positions in self._fanout:
+            return self._fanout[positions]
+        pattern = self.pattern
+        chars = set()
+        for i in positions:
+            if i < len(pattern):
+                if pattern[i] == WILDCARD_ONE and i in self.choices:
+                    chars |= self.choices[i]
+                elif pattern[i] in (WILDCARD_ONE, WILDCARD_ANY):
+                    chars = None
+                    break
+                else:
+                    chars.add(pattern[i])
+        self._fanout[positions] = result = sorted(chars) if chars is not None else None
+        return result
+
+    def iter_words(self) -> Iterator[Optional[str]]:
+        """
+        Yield matching words in order, plus None every CHECK_EVERY nodes.
+
+        The None ticks let a caller check its time budget without the
+        walk knowing about clocks or event loops.
+        """
+        trie = self.trie
+        accept = len(self.pattern)
+        after = self.after or ''
+        start = self._closure[0]
+        if not start:
+            return
+
+        # (node, prefix, positions, still equal to after[:len(prefix)])
+        stack = [(trie.root_node(), '', start, bool(after))]
+        while stack:
+            # Tick between nodes, so cursor always names a fully handled node
+            if self.visited and not self.visited % CHECK_EVERY:
+                yield None
+            node, prefix, positions, bound = stack.pop()
+            self.visited += 1
+
+            depth = len(prefix)
+            if bound:
+                # prefix is a prefix of after, so it sorts at or before it
+                if depth == len(after):
+                    bound = False  # every extension sorts after
+            elif accept in positions and trie.is_terminal(node):
+                yield prefix[::-1] if self.reverse else prefix
+
+            literals = self._literals(positions)
+            if literals is None:
+                edges = trie.children(node)
+            else:
+                edges = []
+                for char in literals:
+                    child = trie.child(node, char)
+                    if child is not None:
+                        edges.append((char, child))
+
+            for char, child in reversed(edges):
+                child_bound = bound
+                if bound:
+                    if char < after[depth]:
+                        continue
+                    child_bound = char == after[depth]
+                nxt = self._step(positions, char)
+                if nxt:
+                    stack.append((child, prefix + char, nxt, child_bound))
+            self.cursor = prefix
+
+    async def stream(self, limit: int, time_budget: float):
+        """
+        Async generator of up to limit matches within time_budget seconds.
+
+        Yields the loop every SLICE_SECONDS; sets ``stopped`` to 'limit'
+        or 'time' when the walk is cut short (resume with ``cursor``).
+        """
+        start = slice_start = time.perf_counter()
+        found = 0
+        walk = self.iter_words()
+        for word in walk:
+            if word is not None:
+                yield word
+                found += 1
+                if found >= limit:
+                    self.stopped = 'limit'
+                    self.cursor = word[::-1] if self.reverse else word
+                    break
+                continue
+            now = time.perf_counter()
+            if now - start >= time_budget:
+                self.stopped = 'time'
+                break
+            if now - slice_start >= SLICE_SECONDS:
+                await asyncio.sleep(0)
+                slice_start = time.perf_counter()
+        walk.close()
+        logger.debug(f"Pattern '{self.pattern}': {found} matches, {self.visited} nodes, "
+                     f"stopped={self.stopped}")
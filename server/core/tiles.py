@@ -3,9 +3,14 @@ from typing import List
 import json
 from pathlib import Path
 from core.logging_config import get_logger
+from core.pattern_search import WILDCARD_ONE
 
 logger = get_logger(__name__)
 
+# A blank tile stands for any letter (English) or jamo (Korean); it uses the
+# pattern-search wildcard so a run with blanks is also a search pattern.
+BLANK_TILE = WILDCARD_ONE
+
 class TileBag:
     """
     Queue-based tile generation system.
@@ -16,6 +21,7 @@ class TileBag:
     JUNG_RATIO = 0.46
     JONG_RATIO = 0.12
     REFILL_THRESHOLD = 20
+    BLANK_COUNT = 2  # blank tiles per bag fill, out of BAG_SIZE
     
     def __init__(self, lang: str = 'en'):
         self.lang = lang
@@ -44,6 +50,7 @@ class TileBag:
             self._fill_korean_bag()
         else:
             self._fill_english_bag()
+        self.bag.extend([BLANK_TILE] * self.BLANK_COUNT)
         
         self.shuffle()
         logger.debug(f"TileBag filled with {len(self.bag)} tiles for lang={self.lang}")
@@ -52,9 +59,10 @@ class TileBag:
         """Fill bag with Korean jamos in 4:4:2 ratio."""
         weights = load_korean_weights()
         
-        cho_count = int(self.BAG_SIZE * self.CHO_RATIO)
-        jung_count = int(self.BAG_SIZE * self.JUNG_RATIO)
-        jong_count = self.BAG_SIZE - cho_count - jung_count
+        size = self.BAG_SIZE - self.BLANK_COUNT
+        cho_count = int(size * self.CHO_RATIO)
+        jung_count = int(size * self.JUNG_RATIO)
+        jong_count = size - cho_count - jung_count
         
         cho_jamos = list(weights['chosung'].keys())
         cho_weights = list(weights['chosung'].values())
@@ -73,7 +81,7 @@ class TileBag:
         letters = list(LETTER_WEIGHTS.keys())
         weights = list(LETTER_WEIGHTS.values())
         # Use extend to avoid overwriting existing tiles if bag wasn't completely empty
-        self.bag.extend(random.choices(letters, weights=weights, k=self.BAG_SIZE))
+        self.bag.extend(random.choices(letters, weights=weights, k=self.BAG_SIZE - self.BLANK_COUNT))
     
     def draw(self, count: int) -> List[str]:
         """Draw specified number of tiles from the bag."""
@@ -0,0 +1,96 @@
+"""
+Per-room Word List Overlays
+
+A room can layer a custom word list over the shared dictionary instead
+of copying it. The shared structures (word_cache, tries, factor automata)
+stay untouched; the overlay only holds the delta:
+
+    allow  extra words accepted in the room (themed lists): a hash set
+           for exact lookups plus a small FactorAutomaton over just
+           those words, so runs inside them pass the early check
+    deny   dictionary words refused in the room: a hash set; lookups
+           of listed words miss
+
+A deny-list leaves the early substring check (has_valid_prefix) as it
+is: a run inside a denied word may also sit inside an allowed one, and
+the final lookup refuses the denied word anyway.
+
+The hash set is ready at once; the delta automaton of a large allow-list
+can be built later (build_factors(), e.g. in a worker thread). Until it
+is, is_factor() is permissive, like an unbuilt automaton.
+"""
+
+import sys
+from typing import Iterable, Optional, Tuple
+from core.factor_automaton import FactorAutomaton
+from core.korean_utils import decompose_word
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+OVERLAY_MODES = ('allow', 'deny')
+
+
+class WordOverlay:
+    """
+    Allow- or deny-list for one room, consulted on top of the base lexicon.
+
+    Words are normalised like the base dictionary: upper case for English,
+    jamo for Korean (syllables are decomposed).
+    """
+
+    def __init__(self, words: Iterable[str], mode: str = 'allow', lang: str = 'en', build: bool = True):
+        if mode not in OVERLAY_MODES:
+            raise ValueError(f"Unknown word list mode '{mode}' (expected one of {OVERLAY_MODES})")
+        self.mode = mode
+        self.lang = lang
+        normalize = str.upper if lang == 'en' else decompose_word
+        self.words = frozenset(normalize(w.strip()) for w in words if w and w.strip())
+
+        self.factors = None
+        if build:
+            self.build_factors()
+        logger.debug(f"WordOverlay [{lang}] {mode}: {len(self.words)} words")
+
+    def build_factors(self) -> None:
+        """Build the delta automaton (allow-lists only): just the added words, never the base."""
+        if self.mode == 'allow' and self.factors is None:
+            factors = FactorAutomaton()
+            factors.build(list(self.words))
+            self.factors = factors
+
+    def lookup(self, word: str, base_entry: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """
+        Room view of one normalised word, given its base word_cache entry.
+
+        Returns:
+            (length, score) if the word is valid in the room, else None.
+            Allowed words missing from the base score like the base (length, length).
+        """
+        if self.mode == 'deny':
+            return None if word in self.words else base_entry
+        if base_entry is None and word in self.words:
+            return (len(word), len(word))
+        return base_entry
+
+    def is_factor(self, run: str) -> bool:
+        """True if the (normalised) run occurs inside an added word."""
+        if self.mode != 'allow':
+            return False
+        if self.factors is None:
+            return True  # Delta automaton still building - be permissive
+        return len(self.factors) > 0 and self.factors.is_factor(run)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def memory_usage(self) -> int:
+        """Bytes held by the overlay: the set, its strings and the delta automaton."""
+        size = sys.getsizeof(self.words) + sum(sys.getsizeof(w) for w in self.words)
+        if self.factors is not None:
+            size += self.factors.memory_usage()
+        return size
+
+    def summary(self) -> dict:
+        """Small description for room settings (the list itself is not echoed to clients)."""
+        return {"mode": self.mode, "count": len(self.words)}
@@ -1,68 +1,535 @@
-from core.database import get_db_connection
+from typing import Dict, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import fcntl
+import multiprocessing
+import os
+import resource
+import tempfile
+from array import array
+from pathlib import Path
+from core.database import get_dictionary_fingerprint, iter_dictionary_rows
 from core.logging_config import get_logger
+from core.config import TRIE_ENGINES, DICTIONARY_ARTIFACT_PATH, DICTIONARY_BUILD_MODE, SHARED_DICTIONARY_DIR, \
+    SUGGESTION_MAX_DISTANCE, SUGGESTION_LIMIT, SUGGESTION_TIME_BUDGET, RACK_SEARCH_MAX_NODES
 from core.double_array_trie import DoubleArrayTrie, BidirectionalTrie
+from core.factor_automaton import FactorAutomaton
+from core.dictionary_artifact import SERIALIZABLE_ENGINES, open_artifact, write_artifact
+from core.lexicon import CompactLexicon, LengthSampler
+from core.pattern_search import PatternSearch, walks_reversed, WILDCARD_ONE
+from core.fuzzy_search import suggest
+from core.anagram_index import SignatureIndex
+from core.word_overlay import WordOverlay
+from core.korean_utils import decompose_word
 import random
 
 logger = get_logger(__name__)
 
-# language -> word -> (length, score)
+# language -> CompactLexicon (word -> (length, score))
 word_cache = {}
-# language -> length -> List[str]
+# language -> length -> sequence of words (LengthBucket views into word_cache)
 words_by_length = {}
+# language -> LengthSampler over words_by_length (cumulative bucket counts)
+word_samplers = {}
+# language -> SignatureIndex over words_by_length (sorted-letter signatures of rack-sized words)
+word_signatures = {}
 # language -> BidirectionalTrie
 word_trie = {} 
+# language -> FactorAutomaton (substring validation)
+word_factors = {}
+# language -> FactorAutomaton over reversed words (runs growing to the left)
+word_factors_reverse = {}
+# Version of the structures above; bumped by every reload_dictionary()
+dictionary_version = 0
+# language -> 'pending' | 'loading' | 'ready' | 'failed'
+language_states = {}
 
-async def load_words_to_memory():
-    global word_cache, words_by_length, word_trie
+_reload_lock = asyncio.Lock()
+_warmup_task = None
+# Set once warm-up knows which languages exist; per-language events once each is ready or failed
+_languages_known = None
+_language_events = {}
+# Languages not yet started; a language a room is waiting for moves to the front
+_warmup_queue = []
+
+class DictionarySnapshot:
+    """
+    One version of every in-memory dictionary structure.
+    
+    The module globals above always hold the current version. Rooms pin the
+    snapshot that was current when their match started and pass it to the
+    lookup functions, so a reload never changes the dictionary under a
+    running game; the old version is freed once no room references it.
+    """
+    
+    __slots__ = ('version', 'source', 'word_cache', 'words_by_length', 'word_samplers', 'word_signatures',
+                 'word_trie', 'word_factors', 'word_factors_reverse')
+    
+    def __init__(self, version: int, source: str, word_cache: dict, words_by_length: dict,
+                 word_trie: dict, word_factors: dict, word_factors_reverse: dict, word_samplers: dict = None,
+                 word_signatures: dict = None):
+        self.version = version
+        self.source = source
+        self.word_cache = word_cache
+        self.words_by_length = words_by_length
+        self.word_samplers = word_samplers if word_samplers is not None else {
+            lang: LengthSampler(buckets) for lang, buckets in words_by_length.items()
+        }
+        # Built with each language (see _with_rack_index); _get_signatures fills in any missing
+        self.word_signatures = word_signatures if word_signatures is not None else {}
+        self.word_trie = word_trie
+        self.word_factors = word_factors
+        self.word_factors_reverse = word_factors_reverse
+    
+    @classmethod
+    def from_languages(cls, version: int, source: str, languages: dict) -> 'DictionarySnapshot':
+        """Snapshot from lang -> build_language() result."""
+        cache = {lang: parts['lexicon'] for lang, parts in languages.items()}
+        return cls(version, source, cache,
+                   {lang: parts['by_length'] for lang, parts in languages.items()},
+                   {lang: parts['trie'] for lang, parts in languages.items()},
+                   {lang: parts['factors'] for lang, parts in languages.items()},
+                   {lang: parts['reverse_factors'] for lang, parts in languages.items()},
+                   word_signatures={lang: parts['signatures'] for lang, parts in languages.items()})
+
+def current_snapshot() -> DictionarySnapshot:
+    """The current dictionary version, for a room to pin at match start."""
+    return DictionarySnapshot(dictionary_version, 'current', word_cache, words_by_length,
+                              word_trie, word_factors, word_factors_reverse, word_samplers, word_signatures)
+
+def _install_snapshot(snapshot: DictionarySnapshot):
+    """Make snapshot the current version. Runs on the event loop, so no coroutine sees a mix."""
+    global word_cache, words_by_length, word_samplers, word_signatures, word_trie, word_factors, word_factors_reverse
+    global dictionary_version
+    word_cache, words_by_length = snapshot.word_cache, snapshot.words_by_length
+    word_samplers, word_trie = snapshot.word_samplers, snapshot.word_trie
+    word_signatures = snapshot.word_signatures
+    word_factors, word_factors_reverse = snapshot.word_factors, snapshot.word_factors_reverse
+    dictionary_version = snapshot.version
+
+def _install_language(lang: str, parts: dict, version: int):
+    """Add one language to the current version without touching the others (copy-on-write)."""
+    global word_cache, words_by_length, word_samplers, word_signatures, word_trie, word_factors, word_factors_reverse
+    global dictionary_version
+    by_length = parts['by_length']
+    word_cache = {**word_cache, lang: parts['lexicon']}
+    words_by_length = {**words_by_length, lang: by_length}
+    word_samplers = {**word_samplers, lang: LengthSampler(by_length)}
+    word_signatures = {**word_signatures, lang: parts['signatures']}
+    word_trie = {**word_trie, lang: parts['trie']}
+    word_factors = {**word_factors, lang: parts['factors']}
+    word_factors_reverse = {**word_factors_reverse, lang: parts['reverse_factors']}
+    dictionary_version = version
+
+def build_language_index(lang: str, words: List[str], engine: str = None):
+    """
+    Build the validation structures for one language.
+
+    Returns:
+        {'trie': BidirectionalTrie, 'factors': FactorAutomaton,
+         'reverse_factors': FactorAutomaton over reversed words}
+    """
+    engine = engine or TRIE_ENGINES.get(lang, 'dict')
+    logger.info(f"Building BidirectionalTrie for {lang} (engine={engine})...")
+    trie = BidirectionalTrie(engine=engine)
+    trie.build(words)
+    logger.info(f"  - {lang} BidirectionalTrie built, {len(trie)} words")
+    
+    logger.info(f"Building FactorAutomaton for {lang}...")
+    factors = FactorAutomaton()
+    factors.build(words)
+    logger.info(f"  - {lang} FactorAutomaton built, {factors.memory_usage()} bytes")
+    
+    reverse_factors = FactorAutomaton()
+    reverse_factors.build([word[::-1] for word in words])
+    logger.info(f"  - {lang} reverse FactorAutomaton built, {reverse_factors.memory_usage()} bytes")
+    return {'trie': trie, 'factors': factors, 'reverse_factors': reverse_factors}
+
+def _build_signatures(lang_words: dict) -> SignatureIndex:
+    # Only rack-sized buckets are read; ~70 ms for 100k words
+    return SignatureIndex((word for length in range(2, 11) for word in lang_words.get(length, ())),
+                          source=lang_words)
+
+def _with_rack_index(parts: dict) -> dict:
+    """Add 'by_length' (the lexicon's length buckets) and 'signatures' (their SignatureIndex) to parts."""
+    parts['by_length'] = parts['lexicon'].by_length()
+    parts['signatures'] = _build_signatures(parts['by_length'])
+    return parts
+
+def build_language(lang: str, lang_words: dict, rack_index: bool = True) -> dict:
+    """
+    Build every structure for one language from {word: (length, score)}.
+    
+    Pure CPU work on fresh objects, so it can run off the event loop.
+    
+    Args:
+        rack_index: Also build the length buckets and SignatureIndex (not
+                    stored in artifacts, so a worker building one skips them)
+    
+    Returns:
+        build_language_index() result plus 'lexicon' (CompactLexicon),
+        and 'by_length' and 'signatures' if rack_index
+    """
+    # Columnar lexicon; the row dict is dropped after the index build
+    lexicon = CompactLexicon.build(lang_words)
+    parts = {'lexicon': lexicon, **build_language_index(lang, list(lang_words.keys()))}
+    return _with_rack_index(parts) if rack_index else parts
+
+def _language_from_artifact(artifact, lang: str) -> dict:
+    """
+    Map one language's structures out of the artifact (build_language() layout).
+    
+    The SignatureIndex is built here (~70 ms), so call this off the event loop.
+    """
+    return _with_rack_index({
+        'lexicon': artifact.lexicon(lang),
+        'trie': artifact.bidirectional_trie(lang),
+        'factors': artifact.factor_automaton(lang),
+        'reverse_factors': artifact.factor_automaton(lang, reverse=True),
+    })
+
+def _encode_rows(lang_words: dict):
+    # Flat columns pickle as a memcpy; a dict of tuples pickles item by item while holding the GIL
+    return ('\n'.join(lang_words), array('H', [length for length, _ in lang_words.values()]),
+            array('H', [score for _, score in lang_words.values()]))
+
+def _build_language_artifact(lang: str, rows, path: str, fingerprint: dict = None) -> str:
+    """Worker-process entry point: build lang and write it as a one-language artifact."""
+    text, lengths, scores = rows
+    lang_words = dict(zip(text.split('\n'), zip(lengths, scores))) if text else {}
+    parts = build_language(lang, lang_words, rack_index=False)
+    write_artifact(Path(path), {lang: {**parts, 'words': parts['lexicon']}}, fingerprint)
+    return path
+
+def _run_build_worker(lang: str, rows, path: str, fingerprint: dict = None):
+    # spawn: forking a process that runs an event loop and threads is not safe.
+    # Starting and joining the worker blocks, so this whole function runs in a thread.
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        pool.submit(_build_language_artifact, lang, rows, path, fingerprint).result()
+    # Mapping verifies the checksum over the whole file, so it stays off the loop too
+    return open_artifact(Path(path))
+
+def _builds_in_process(lang: str) -> bool:
+    # The 'dict' trie engine has no serialized form
+    return DICTIONARY_BUILD_MODE == 'process' and TRIE_ENGINES.get(lang, 'dict') in SERIALIZABLE_ENGINES
+
+async def build_language_offloaded(lang: str, lang_words: dict) -> dict:
+    """
+    build_language() without holding the event loop's GIL.
+    
+    In 'process' mode the build runs in a fresh worker process that writes
+    a one-language artifact; the result is mmap'd back (no unpickling, and
+    the worker's build garbage goes away with the process). The 'dict' trie
+    engine cannot be serialized, so it and 'thread' mode build in a thread.
+    """
+    if not _builds_in_process(lang):
+        return await asyncio.to_thread(build_language, lang, lang_words)
+    
+    fd, path = tempfile.mkstemp(prefix=f'yeet-{lang}-', suffix='.bin')
+    os.close(fd)
     try:
-        conn = await get_db_connection()
-        rows = await conn.fetch("SELECT word, lang, length, score FROM dictionary")
+        rows = await asyncio.to_thread(_encode_rows, lang_words)
+        artifact = await asyncio.to_thread(_run_build_worker, lang, rows, path)
+        if artifact is None:
+            raise RuntimeError(f"{lang}: worker produced an unreadable artifact")
+        return await asyncio.to_thread(_language_from_artifact, artifact, lang)
+    finally:
+        # The mapping stays valid after unlink
+        os.unlink(path)
 
-        # Initialize caches
-        word_cache = {}
-        words_by_length = {}
-        
-        for row in rows:
-            word = row['word']
-            lang = row['lang']
-            length = row['length']
-            score = row['score']
-
-            if lang not in word_cache:
-                word_cache[lang] = {}
-            if lang not in words_by_length:
-                words_by_length[lang] = {}
-            
-            word_cache[lang][word] = (length, score)
-            
-            if length not in words_by_length[lang]:
-                words_by_length[lang][length] = []
-            words_by_length[lang][length].append(word)
-            
-        await conn.close()
-        logger.info(f"Loaded words for {len(word_cache)} languages.")
+def _shared_language_path(lang: str) -> Path:
+    return SHARED_DICTIONARY_DIR / f"yeet-dictionary-{lang}.bin"
+
+def _lock_shared_language(path: Path):
+    """Exclusive flock next to path (blocking); closing the returned file releases it."""
+    lock = open(path.with_name(path.name + '.lock'), 'a')
+    fcntl.flock(lock, fcntl.LOCK_EX)
+    return lock
+
+def _open_shared_language(path: Path, fingerprint: dict):
+    artifact = open_artifact(path)
+    if artifact is not None and artifact.fingerprint != fingerprint:
+        logger.info(f"Shared dictionary {path} is from another DB version, rebuilding")
+        return None
+    return artifact
+
+async def load_language(lang: str, fingerprint: Optional[dict]) -> dict:
+    """
+    One language from the dictionary table, built at most once per host.
+    
+    The first worker to get here builds the language and publishes it as
+    a one-language artifact in SHARED_DICTIONARY_DIR (under a file lock,
+    tagged with the language's DB fingerprint); the others wait on the
+    lock and map the same file, so N workers hold one copy of the pages.
+    Without a fingerprint or an in-process build, every worker builds its own.
+    """
+    lang_fingerprint = (fingerprint or {}).get(lang)
+    if lang_fingerprint is None or not _builds_in_process(lang):
+        lang_words = (await _fetch_rows_by_lang(lang)).get(lang, {})
+        logger.info(f"  - {lang}: {len(lang_words)} words")
+        return await build_language_offloaded(lang, lang_words)
+    
+    path = _shared_language_path(lang)
+    expected = {lang: lang_fingerprint}
+    lock = await asyncio.to_thread(_lock_shared_language, path)
+    try:
+        artifact = await asyncio.to_thread(_open_shared_language, path, expected)
+        if artifact is None:
+            lang_words = (await _fetch_rows_by_lang(lang)).get(lang, {})
+            logger.info(f"  - {lang}: {len(lang_words)} words, publishing to {path}")
+            rows = await asyncio.to_thread(_encode_rows, lang_words)
+            artifact = await asyncio.to_thread(_run_build_worker, lang, rows, str(path), expected)
+            if artifact is None:
+                raise RuntimeError(f"{lang}: worker produced an unreadable artifact")
+        else:
+            logger.info(f"  - {lang}: attached to shared dictionary {path}")
+        return await asyncio.to_thread(_language_from_artifact, artifact, lang)
+    finally:
+        lock.close()
+
+def _open_current_artifact(fingerprint):
+    """The compiled artifact if it is intact and matches the DB, else None."""
+    artifact = open_artifact(DICTIONARY_ARTIFACT_PATH)
+    if artifact is None:
+        return None
+    if fingerprint is not None and artifact.fingerprint != fingerprint:
+        logger.warning("Dictionary artifact is stale (DB fingerprint changed), rebuilding from DB")
+        return None
+    return artifact
+
+def _snapshot_from_artifact(fingerprint, version: int) -> Optional[DictionarySnapshot]:
+    """Map the compiled artifact if it is intact and matches the DB."""
+    artifact = _open_current_artifact(fingerprint)
+    if artifact is None:
+        return None
+    languages = {lang: _language_from_artifact(artifact, lang) for lang in artifact.languages}
+    logger.info(f"Loaded dictionary artifact {artifact.path} for {len(languages)} languages.")
+    return DictionarySnapshot.from_languages(version, 'artifact', languages)
+
+def build_snapshot(rows_by_lang: dict, version: int) -> DictionarySnapshot:
+    """Build every language from lang -> {word: (length, score)}; safe to run off the event loop."""
+    languages = {lang: build_language(lang, lang_words) for lang, lang_words in rows_by_lang.items()}
+    return DictionarySnapshot.from_languages(version, 'database', languages)
+
+async def collect_rows_by_lang(rows) -> dict:
+    """
+    lang -> {word: (length, score)} from an async stream of (word, lang, length, score).
+    
+    Rows are consumed one at a time, and equal (length, score) pairs share
+    one tuple (there are only a few hundred distinct pairs), so the only
+    thing that grows with the table is the word dict the builders need.
+    """
+    rows_by_lang = {}
+    pairs = {}
+    async for word, lang, length, score in rows:
+        lang_words = rows_by_lang.get(lang)
+        if lang_words is None:
+            lang_words = rows_by_lang[lang] = {}
+        pair = (length, score)
+        lang_words[word] = pairs.setdefault(pair, pair)
+    return rows_by_lang
+
+async def _fetch_rows_by_lang(lang: str = None) -> dict:
+    """lang -> {word: (length, score)}, for every language or only lang (streamed from the DB)."""
+    return await collect_rows_by_lang(iter_dictionary_rows(lang))
+
+async def _get_fingerprint():
+    try:
+        return await get_dictionary_fingerprint()
+    except Exception as e:
+        logger.warning(f"Could not fingerprint dictionary table, trusting artifact checksum: {e}")
+        return None
+
+async def _load_snapshot(version: int, offload: bool) -> DictionarySnapshot:
+    """Artifact if it matches the DB, else a build from the table (off the event loop if offload)."""
+    # Prefer the compiled artifact; the fingerprint query is a single aggregate
+    fingerprint = await _get_fingerprint()
+    
+    if offload:
+        snapshot = await asyncio.to_thread(_snapshot_from_artifact, fingerprint, version)
+    else:
+        snapshot = _snapshot_from_artifact(fingerprint, version)
+    if snapshot is not None:
+        return snapshot
+    
+    if offload and fingerprint:
+        languages = {lang: await load_language(lang, fingerprint) for lang in fingerprint}
+        return DictionarySnapshot.from_languages(version, 'database', languages)
+    
+    rows_by_lang = await _fetch_rows_by_lang()
+    logger.info(f"Loaded words for {len(rows_by_lang)} languages.")
+    for lang, lang_words in rows_by_lang.items():
+        logger.info(f"  - {lang}: {len(lang_words)} words")
+    if offload:
+        languages = {lang: await build_language_offloaded(lang, lang_words)
+                     for lang, lang_words in rows_by_lang.items()}
+        return DictionarySnapshot.from_languages(version, 'database', languages)
+    return build_snapshot(rows_by_lang, version)
+
+async def load_words_to_memory():
+    try:
+        snapshot = await _load_snapshot(dictionary_version + 1, offload=False)
+        _install_snapshot(snapshot)
+        _mark_ready(snapshot)
         for lang in word_cache:
             logger.info(f"  - {lang}: {len(word_cache[lang])} words")
-        
-        # Build BidirectionalTrie for each language (prefix + suffix validation)
-        for lang, words_dict in word_cache.items():
-            logger.info(f"Building BidirectionalTrie for {lang}...")
-            trie = BidirectionalTrie()
-            trie.build(list(words_dict.keys()))
-            word_trie[lang] = trie
-            logger.info(f"  - {lang} BidirectionalTrie built, {len(trie)} words")
-        
         return word_cache
     except Exception as e:
         logger.error(f"데이터 로드 중 오류 발생: {e}")
         return {}
 
-def get_word_in_cache(word: str, lang: str = 'en'):
-    target_word = word.upper() if lang == 'en' else word
-    lang_cache = word_cache.get(lang, {})
+def _mark_ready(snapshot: DictionarySnapshot):
+    language_states.clear()
+    language_states.update({lang: 'ready' for lang in snapshot.word_cache})
+
+async def _warm_up_language(lang: str, artifact, fingerprint, version: int):
+    language_states[lang] = 'loading'
+    try:
+        if artifact is not None:
+            parts = await asyncio.to_thread(_language_from_artifact, artifact, lang)
+        else:
+            parts = await load_language(lang, fingerprint)
+        _install_language(lang, parts, version)
+        language_states[lang] = 'ready'
+        logger.info(f"Dictionary for {lang} is ready (v{version}, {len(parts['lexicon'])} words)")
+    except Exception as e:
+        language_states[lang] = 'failed'
+        logger.error(f"{lang} 사전 로드 중 오류 발생: {e}")
+    finally:
+        _language_events[lang].set()
+
+async def _warm_up_dictionary():
+    # Holds the reload lock so a reload requested during warm-up waits for it
+    async with _reload_lock:
+        version = dictionary_version + 1
+        fingerprint = await _get_fingerprint()
+        artifact = await asyncio.to_thread(_open_current_artifact, fingerprint)
+        languages = artifact.languages if artifact is not None else list(fingerprint or {})
+        if not languages:
+            logger.error("No dictionary languages found (no usable artifact and no DB fingerprint)")
+        for lang in languages:
+            language_states[lang] = 'pending'
+            _language_events[lang] = asyncio.Event()
+        _warmup_queue[:] = languages
+        _languages_known.set()
+        await asyncio.sleep(0)  # let rooms already waiting reorder the queue
+        
+        # One language at a time: builds are CPU-bound, so running them side by side
+        # only delays the first one; each is installed as soon as it is built
+        while _warmup_queue:
+            await _warm_up_language(_warmup_queue.pop(0), artifact, fingerprint, version)
+
+def start_dictionary_warmup() -> asyncio.Task:
+    """
+    Start loading every language in the background and return immediately.
+    
+    Languages become usable one by one; wait_for_language() blocks only on
+    a language that is still loading. Must be called on the running loop.
+    """
+    global _warmup_task, _languages_known
+    language_states.clear()
+    _language_events.clear()
+    _warmup_queue.clear()
+    _languages_known = asyncio.Event()
+    _warmup_task = asyncio.create_task(_warm_up_dictionary())
+    return _warmup_task
+
+async def wait_for_language(lang: str) -> bool:
+    """
+    Wait until lang's dictionary is loaded.
+    
+    Returns:
+        True if lang is ready, False if it failed or has no dictionary
+    """
+    if language_states.get(lang) == 'ready':
+        return True
+    if _warmup_task is None:
+        # Loaded eagerly (or installed directly), nothing to wait for
+        return lang in word_cache
+    await _languages_known.wait()
+    event = _language_events.get(lang)
+    if event is None:
+        return False
+    if lang in _warmup_queue:
+        _warmup_queue.remove(lang)
+        _warmup_queue.insert(0, lang)
+    await event.wait()
+    return language_states[lang] == 'ready'
+
+def dictionary_status() -> dict:
+    """Per-language load state for the readiness probe."""
+    known = _warmup_task is None or _languages_known.is_set()
+    return {
+        'ready': known and bool(language_states) and all(state == 'ready' for state in language_states.values()),
+        'version': dictionary_version,
+        'languages': dict(language_states),
+    }
+
+def _memory_stats() -> dict:
+    """Current and peak RSS of this process in bytes."""
+    try:
+        with open('/proc/self/status') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return {
+            'rss': int(fields['VmRSS'].split()[0]) * 1024,
+            'peak_rss': int(fields['VmHWM'].split()[0]) * 1024,
+        }
+    except (OSError, KeyError, ValueError):
+        # Non-Linux: only the lifetime peak is available (kilobytes on Linux/BSD)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return {'rss': None, 'peak_rss': peak}
+
+def _reset_peak_rss():
+    """Restart the VmHWM high-water mark so the reload's own peak can be read (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        pass
+
+async def reload_dictionary() -> dict:
+    """
+    Build the next dictionary version off the event loop and swap it in.
+    
+    Rooms already in a match keep validating against the snapshot they
+    pinned; new matches use the new version. On failure the current
+    version stays installed and the exception propagates.
+    
+    Returns:
+        Version numbers, word counts and RSS before/after plus the peak
+        RSS while both versions were alive
+    """
+    async with _reload_lock:
+        _reset_peak_rss()
+        before = _memory_stats()
+        previous = dictionary_version
+        snapshot = await _load_snapshot(previous + 1, offload=True)
+        _install_snapshot(snapshot)
+        _mark_ready(snapshot)
+        after = _memory_stats()
+        
+        report = {
+            'version': snapshot.version,
+            'previous_version': previous,
+            'source': snapshot.source,
+            'words': {lang: len(lexicon) for lang, lexicon in snapshot.word_cache.items()},
+            'memory': {'rss_before': before['rss'], 'rss_after': after['rss'], 'peak_rss': after['peak_rss']},
+        }
+        logger.info(f"Dictionary reloaded: v{previous} -> v{snapshot.version} ({snapshot.source}), "
+                    f"words={report['words']}, memory={report['memory']}")
+        return report
+
+def get_word_in_cache(word: str, lang: str = 'en', snapshot: DictionarySnapshot = None,
+                      overlay: WordOverlay = None):
+    """Look up one word. Korean words may be given as syllables or jamo (stored as jamo)."""
+    target_word = word.upper() if lang == 'en' else decompose_word(word)
+    lang_cache = (snapshot.word_cache if snapshot else word_cache).get(lang, {})
     
-    if target_word in lang_cache:
-        length, score = lang_cache[target_word]
+    entry = lang_cache.get(target_word)
+    if overlay is not None:
+        entry = overlay.lookup(target_word, entry)
+    if entry is not None:
+        length, score = entry
         logger.debug(f"Cache hit for word [{lang}]: {target_word}")
         return {
             "is_valid": True,
@@ -72,55 +539,393 @@ def get_word_in_cache(word: str, lang: str = 'en'):
         }
     return {"is_valid": False, "word": target_word}
 
-def get_random_word(min_length: int = 6, max_length: int = None, exact_length: int = None, lang: str = 'en'):
+def validate_words(words: List[str], lang: str = 'en', snapshot: DictionarySnapshot = None,
+                   overlay: WordOverlay = None) -> List[Optional[Tuple[int, int]]]:
+    """
+    Batch version of get_word_in_cache for many candidate strings.
+    
+    Each distinct string is normalised and looked up once; no per-word
+    result dicts or log lines are produced. A room's WordOverlay, if
+    given, is applied on top of the shared word_cache.
+    
+    Returns:
+        One entry per input string: (length, score) if it is a word, else None
+    """
+    lang_cache = (snapshot.word_cache if snapshot else word_cache).get(lang, {})
+    # Keyed like get_word_in_cache: Korean syllables are looked up as their jamo
+    normalize = str.upper if lang == 'en' else decompose_word
+    keys = {word: normalize(word) for word in set(words)}
+    found = {word: lang_cache.get(key) for word, key in keys.items()}
+    if overlay is not None:
+        found = {word: overlay.lookup(keys[word], entry) for word, entry in found.items()}
+    logger.debug(f"validate_words [{lang}]: {len(words)} strings, {len(found)} distinct")
+    return [found[word] for word in words]
+
+def _get_sampler(lang: str, snapshot: DictionarySnapshot = None):
+    """Sampler for words_by_length[lang], rebuilt if the index was replaced."""
+    by_length = snapshot.words_by_length if snapshot else words_by_length
+    samplers = snapshot.word_samplers if snapshot else word_samplers
+    lang_words = by_length.get(lang)
+    if not lang_words:
+        return None
+    sampler = samplers.get(lang)
+    if sampler is None or sampler.buckets is not lang_words:
+        sampler = samplers[lang] = LengthSampler(lang_words)
+    return sampler
+
+def _get_signatures(lang: str, snapshot: DictionarySnapshot = None) -> Optional[SignatureIndex]:
+    """
+    SignatureIndex for words_by_length[lang].
+    
+    Loaded languages come with one (see _with_rack_index); it is only built
+    here, on first use, for structures installed some other way or replaced.
+    """
+    by_length = snapshot.words_by_length if snapshot else words_by_length
+    indexes = snapshot.word_signatures if snapshot else word_signatures
+    lang_words = by_length.get(lang)
+    if not lang_words:
+        return None
+    index = indexes.get(lang)
+    if index is None or index.source is not lang_words:
+        index = indexes[lang] = _build_signatures(lang_words)
+        logger.info(f"SignatureIndex [{lang}] built: {len(index)} signatures")
+    return index
+
+def find_rack_word(tiles: List[Optional[str]], lang: str = 'en', snapshot: DictionarySnapshot = None,
+                   free: int = 0, rng: random.Random = None,
+                   max_nodes: int = RACK_SEARCH_MAX_NODES) -> Optional[Tuple[str, str]]:
+    """
+    손패(rack)로 만들 수 있는 단어(길이 2 이상)를 찾습니다.
+    빈 칸(None)은 무시하고, 블랭크 타일은 아무 글자로 취급합니다.
+
+    Args:
+        free: 아직 비어 있어 아무 글자나 채울 수 있는 칸 수
+        rng: 주어지면 와일드카드 글자를 무작위 순서로 시도
+
+    Returns:
+        (정렬된 글자 서명, 블랭크/빈 칸이 대신한 글자) 또는 max_nodes 안에 못 찾으면 None
+    """
+    index = _get_signatures(lang, snapshot)
+    if index is None:
+        return None
+    if lang == 'en':
+        tiles = [t.upper() if t else t for t in tiles]
+    return index.find(tiles, blank=WILDCARD_ONE, free=free, max_nodes=max_nodes, rng=rng)
+
+def get_random_word(min_length: int = 6, max_length: int = None, exact_length: int = None, lang: str = 'en',
+                    snapshot: DictionarySnapshot = None):
     """
     words_by_length 인덱스를 사용하여 무작위로 단어를 뽑습니다.
+    누적 길이 버킷 크기(LengthSampler)로 O(log L)에 균등 추출하며, 후보 리스트를 만들지 않습니다.
     """
     logger.debug(f"get_random_word called for {lang} with min_length={min_length}, max_length={max_length}, exact_length={exact_length}")
     
-    lang_words = words_by_length.get(lang, {})
-    if not lang_words:
+    sampler = _get_sampler(lang, snapshot)
+    if sampler is None:
         return None
 
     if exact_length:
-        eligible_words = lang_words.get(exact_length, [])
-    else:
-        eligible_words = []
-        possible_lengths = [l for l in lang_words.keys() if l >= min_length]
-        if max_length:
-            possible_lengths = [l for l in possible_lengths if l <= max_length]
-        
-        for l in possible_lengths:
-            eligible_words.extend(lang_words[l])
-        
-    if not eligible_words:
-        return None
-    return random.choice(eligible_words)
+        return sampler.sample(exact_length, exact_length)
+    return sampler.sample(min_length, max_length or None)
 
-def has_valid_prefix(prefix: str, lang: str = 'en') -> bool:
+def has_valid_prefix(prefix: str, lang: str = 'en', snapshot: DictionarySnapshot = None,
+                     overlay: WordOverlay = None) -> bool:
     """
     Check if the given prefix could lead to a valid word.
     
-    Uses BidirectionalTrie for both prefix and suffix lookup.
-    This allows words to be built from either direction.
+    Uses the FactorAutomaton, so the run may sit anywhere inside a word
+    (prefix, suffix or middle gap). Falls back to the BidirectionalTrie
+    prefix/suffix check if no automaton was built for the language.
+    Blank tiles (WILDCARD_ONE) match any character. With an allow-list
+    overlay, runs inside the room's added words are accepted too. Korean
+    runs may be given as syllables or jamo.
     
     Args:
-        prefix: The string to check (actually checks both prefix AND suffix)
+        prefix: The string to check (any substring position is accepted)
         lang: Language code ('en' or 'ko')
+        snapshot: Pinned dictionary version (current version if None)
+        overlay: The room's WordOverlay, if any
         
     Returns:
-        True if at least one valid word contains this as prefix OR suffix
+        True if at least one valid word contains this string
     """
     if not prefix:
         return True
         
-    target = prefix.upper() if lang == 'en' else prefix
+    target = prefix.upper() if lang == 'en' else decompose_word(prefix)
+    if overlay is not None and overlay.is_factor(target):
+        logger.debug(f"Overlay factor [{lang}]: '{target}' -> True")
+        return True
+    factors = snapshot.word_factors if snapshot else word_factors
+    tries = snapshot.word_trie if snapshot else word_trie
     
-    if lang not in word_trie:
+    if lang in factors:
+        result = factors[lang].is_factor(target)
+        logger.debug(f"Factor check [{lang}]: '{target}' -> {result}")
+        return result
+    
+    if lang not in tries:
         logger.debug(f"No Trie for language {lang}, allowing")
         return True
     
     # Check both prefix and suffix (bidirectional)
-    result = word_trie[lang].has_substring(target)
+    if WILDCARD_ONE in target:
+        trie = tries[lang]
+        result = (_first_match(PatternSearch(trie.forward_trie, target + '*')) is not None
+                  or _first_match(PatternSearch(trie.reverse_trie, target[::-1] + '*')) is not None)
+    else:
+        result = tries[lang].has_substring(target)
     logger.debug(f"Bidirectional check [{lang}]: '{target}' -> {result}")
     return result
+
+
+def count_with_prefix(prefix: str, lang: str = 'en', snapshot: DictionarySnapshot = None) -> int:
+    """
+    Number of dictionary words starting with prefix, in O(len(prefix)).
+
+    0 means the run can never become a word in this direction (dead end);
+    large counts mean an easy, open run.
+
+    Args:
+        prefix: Word start to count completions for
+        lang: Language code ('en' or 'ko')
+        snapshot: Pinned dictionary version (current version if None)
+    """
+    tries = snapshot.word_trie if snapshot else word_trie
+    if lang not in tries:
+        return 0
+    return tries[lang].count_with_prefix(prefix.upper() if lang == 'en' else prefix)
+
+
+def count_with_suffix(suffix: str, lang: str = 'en', snapshot: DictionarySnapshot = None) -> int:
+    """
+    Number of dictionary words ending with suffix, in O(len(suffix)).
+
+    Args:
+        suffix: Word end to count
+        lang: Language code ('en' or 'ko')
+        snapshot: Pinned dictionary version (current version if None)
+    """
+    tries = snapshot.word_trie if snapshot else word_trie
+    if lang not in tries:
+        return 0
+    return tries[lang].count_with_suffix(suffix.upper() if lang == 'en' else suffix)
+
+
+def pattern_search(pattern: str, lang: str = 'en', after: str = None,
+                   snapshot: DictionarySnapshot = None) -> Optional[PatternSearch]:
+    """
+    Wildcard search ('?' one character, '*' any run) over a language's trie.
+
+    English patterns are upper-cased; Korean patterns may mix syllables and
+    jamo and are matched on jamo, like the stored words. Patterns anchored
+    only at the end walk the reverse trie (see core.pattern_search); the
+    search's cursor is then a reversed word, to be passed back as is.
+
+    Returns:
+        PatternSearch to iterate or stream, or None if lang is not loaded
+    """
+    tries = snapshot.word_trie if snapshot else word_trie
+    if lang not in tries:
+        return None
+    if lang == 'en':
+        pattern, after = pattern.upper(), after.upper() if after else after
+    else:
+        pattern, after = decompose_word(pattern), decompose_word(after) if after else after
+    if walks_reversed(pattern):
+        return PatternSearch(tries[lang].reverse_trie, pattern[::-1], after, reverse=True)
+    return PatternSearch(tries[lang].forward_trie, pattern, after)
+
+
+def suggest_words(word: str, lang: str = 'en', snapshot: DictionarySnapshot = None,
+                  max_distance: int = SUGGESTION_MAX_DISTANCE, limit: int = SUGGESTION_LIMIT,
+                  time_budget: float = SUGGESTION_TIME_BUDGET) -> List[str]:
+    """
+    "Did you mean" candidates for a rejected word (see core.fuzzy_search).
+
+    The nearest dictionary words within max_distance edits, closest first,
+    found by a Levenshtein automaton walk of the trie under a hard time
+    budget. Korean words are compared on jamo, like the stored words.
+
+    Returns:
+        Up to limit words in stored form (jamo for Korean); [] if lang is not loaded
+    """
+    tries = snapshot.word_trie if snapshot else word_trie
+    if lang not in tries or not word:
+        return []
+    target = word.upper() if lang == 'en' else decompose_word(word)
+    return [candidate for candidate, _ in suggest(tries[lang], target, max_distance, limit, time_budget)]
+
+
+def _first_match(search: PatternSearch) -> Optional[str]:
+    for word in search.iter_words():
+        if word is not None:
+            return word
+    return None
+
+
+def _blank_search(pattern: str, lang: str, snapshot: DictionarySnapshot,
+                  choices: Dict[int, Set[str]] = None) -> Optional[PatternSearch]:
+    """PatternSearch for a run with blanks, from whichever end is a letter."""
+    tries = snapshot.word_trie if snapshot else word_trie
+    if lang not in tries:
+        return None
+    target = pattern.upper() if lang == 'en' else pattern
+    if target.startswith(WILDCARD_ONE) and not target.endswith(WILDCARD_ONE):
+        # Leading blanks fan out at the root; walk the fixed end first instead
+        last = len(target) - 1
+        reversed_choices = {last - i: chars for i, chars in (choices or {}).items()}
+        return PatternSearch(tries[lang].reverse_trie, target[::-1], reverse=True,
+                             choices=reversed_choices)
+    return PatternSearch(tries[lang].forward_trie, target, choices=choices)
+
+
+def resolve_blanks(pattern: str, lang: str = 'en', snapshot: DictionarySnapshot = None,
+                   choices: Dict[int, Set[str]] = None) -> Optional[str]:
+    """
+    Find a word for a run with blank tiles (WILDCARD_ONE) by walking the trie.
+
+    Only trie edges the fixed letters (and choices) allow are followed, so
+    this costs one pruned walk instead of a get_word_in_cache call per
+    combination of blank letters.
+
+    Args:
+        pattern: The run, blanks included (jamo for Korean)
+        lang: Language code ('en' or 'ko')
+        snapshot: Pinned dictionary version (current version if None)
+        choices: Optional allowed letters per blank position, e.g. from
+                 the blank's crossing word (see blank_choices)
+
+    Returns:
+        The first matching word, or None if no assignment makes a word
+    """
+    search = _blank_search(pattern, lang, snapshot, choices)
+    if search is None:
+        return None
+    word = _first_match(search)
+    logger.debug(f"resolve_blanks [{lang}]: '{pattern}' -> {word} ({search.visited} nodes)")
+    return word
+
+
+def blank_choices(pattern: str, lang: str = 'en',
+                  snapshot: DictionarySnapshot = None) -> Dict[int, Set[str]]:
+    """
+    Letters each blank in pattern can take so that pattern is a word.
+
+    Meant for the crossing word of a blank, which holds only that blank,
+    so the walk reports at most one word per letter of the alphabet.
+
+    Returns:
+        {position: letters} for every blank position (empty sets if none fit)
+    """
+    positions = [i for i, char in enumerate(pattern) if char == WILDCARD_ONE]
+    found = {i: set() for i in positions}
+    search = _blank_search(pattern, lang, snapshot)
+    if search is not None:
+        for word in search.iter_words():
+            if word is not None:
+                for i in positions:
+                    found[i].add(word[i])
+    return found
+
+
+class FactorCursor:
+    """
+    Incremental has_valid_prefix() for a run that grows one tile at a time.
+    
+    Keeps the run's state in the forward FactorAutomaton (for appends) and
+    in the reverse one (for prepends). Growing at one end invalidates the
+    other end's state; it is only recomputed (one walk) if the run later
+    grows at that end, so building a word in one direction costs a single
+    edge step per tile instead of a walk over the whole run.
+    
+    Cursors are immutable: appended()/prepended() return new cursors.
+    
+    Once the run holds a blank tile its state becomes the frozenset of
+    automaton states reachable under any letter for the blank.
+    
+    A room's allow-list overlay is checked (one walk of its small delta
+    automaton) only when the shared automata reject the run.
+    """
+    
+    __slots__ = ('lang', 'text', 'snapshot', 'overlay', '_forward', '_backward')
+    
+    def __init__(self, text: str, lang: str = 'en', _forward: int = None, _backward: int = None,
+                 snapshot: DictionarySnapshot = None, overlay: WordOverlay = None):
+        self.lang = lang
+        self.text = text.upper() if lang == 'en' else text
+        self.snapshot = snapshot
+        self.overlay = overlay
+        self._forward = _forward
+        self._backward = _backward
+    
+    def _automata(self):
+        snapshot = self.snapshot
+        if snapshot is not None:
+            return snapshot.word_factors, snapshot.word_factors_reverse
+        return word_factors, word_factors_reverse
+    
+    @staticmethod
+    def _walk(automaton, text: str):
+        if WILDCARD_ONE in text:
+            return automaton.walk_states(text)
+        return automaton.walk(text)
+    
+    @staticmethod
+    def _step(automaton, state, char: str):
+        if isinstance(state, frozenset):
+            return automaton.step_states(state, char)
+        if char == WILDCARD_ONE:
+            states = frozenset() if state == automaton.DEAD else frozenset((state,))
+            return automaton.step_states(states, char)
+        return automaton.step(state, char)
+    
+    @staticmethod
+    def _accepts(automaton, state) -> bool:
+        if isinstance(state, frozenset):
+            return automaton.accepts_states(state)
+        return automaton.accepts(state)
+    
+    def _forward_state(self):
+        if self._forward is None:
+            self._forward = self._walk(self._automata()[0][self.lang], self.text)
+        return self._forward
+    
+    def _backward_state(self):
+        if self._backward is None:
+            self._backward = self._walk(self._automata()[1][self.lang], self.text[::-1])
+        return self._backward
+    
+    def appended(self, char: str) -> 'FactorCursor':
+        """Cursor for the run extended by one character at the end."""
+        char = char.upper() if self.lang == 'en' else char
+        forward = None
+        factors = self._automata()[0]
+        if self.lang in factors:
+            forward = self._step(factors[self.lang], self._forward_state(), char)
+        return FactorCursor(self.text + char, self.lang, _forward=forward, snapshot=self.snapshot,
+                            overlay=self.overlay)
+    
+    def prepended(self, char: str) -> 'FactorCursor':
+        """Cursor for the run extended by one character at the start."""
+        char = char.upper() if self.lang == 'en' else char
+        backward = None
+        reverse_factors = self._automata()[1]
+        if self.lang in reverse_factors:
+            backward = self._step(reverse_factors[self.lang], self._backward_state(), char)
+        return FactorCursor(char + self.text, self.lang, _backward=backward, snapshot=self.snapshot,
+                            overlay=self.overlay)
+    
+    @property
+    def is_valid(self) -> bool:
+        """Same answer as has_valid_prefix(self.text, self.lang, self.snapshot, self.overlay)."""
+        if not self.text:
+            return True
+        factors, reverse_factors = self._automata()
+        if self._backward is not None and self.lang in reverse_factors:
+            valid = self._accepts(reverse_factors[self.lang], self._backward)
+        elif self.lang in factors:
+            valid = self._accepts(factors[self.lang], self._forward_state())
+        else:
+            return has_valid_prefix(self.text, self.lang, self.snapshot, self.overlay)
+        return valid or (self.overlay is not None and self.overlay.is_factor(self.text))
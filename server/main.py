@@ -1,7 +1,7 @@
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, Response
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
-from core.words import load_words_to_memory
+from core.words import start_dictionary_warmup, dictionary_status
 from api.routes import router as api_router
 from websocket.handlers import handle_websocket
 from core.database import init_db
@@ -13,10 +13,11 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Server is starting up...")
-    logger.debug("Initializing database and loading words...")
+    logger.debug("Initializing database and warming up dictionaries...")
     await init_db()
-    await load_words_to_memory()
-    logger.info("Database and words loaded.")
+    # Languages load in the background; /ready reports when each one can be served
+    start_dictionary_warmup()
+    logger.info("Database initialized, dictionaries loading.")
     yield
     logger.info("Server is shutting down...")
 
@@ -31,6 +32,13 @@ async def health_check():
     logger.info("Health check requested")
     return {"status": "ok"}
 
+@app.get("/ready")
+async def readiness_check(response: Response):
+    status = dictionary_status()
+    if not status["ready"]:
+        response.status_code = 503
+    return status
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     logger.debug(f"New websocket connection attempt from {websocket.client}")
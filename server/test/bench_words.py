@@ -0,0 +1,85 @@
+"""
+Benchmark helpers: word lists, timing and memory measurement.
+
+load_words() uses the real dictionaries from data/ (see core.config) when
+they are present, otherwise a deterministic synthetic list of similar shape
+so the benchmarks still run on a fresh checkout.
+"""
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import WORDS_JSON_PATH, KOREAN_WORDS_JSON_PATH
+from core.korean_utils import decompose_word, compose_syllable
+from core.tiles import LETTER_WEIGHTS, load_korean_weights
+
+
+def _synthetic_english(count: int) -> dict:
+    rng = random.Random(42)
+    letters = list(LETTER_WEIGHTS.keys())
+    weights = list(LETTER_WEIGHTS.values())
+    words = {}
+    while len(words) < count:
+        length = rng.choice([3, 4, 5, 5, 6, 6, 7, 7, 8, 9, 10, 11, 12])
+        word = ''.join(rng.choices(letters, weights=weights, k=length))
+        words[word] = (length, length)
+    return words
+
+
+def _synthetic_korean(count: int) -> dict:
+    rng = random.Random(42)
+    weights = load_korean_weights()
+    cho = list(weights['chosung'].keys())
+    jung = list(weights['jungsung'].keys())
+    jong = list(weights['jongsung'].keys())
+    pool = set()
+    while len(pool) < 1500:
+        final = rng.choice(jong) if rng.random() < 0.35 else ''
+        pool.add(compose_syllable(rng.choice(cho), rng.choice(jung), final))
+    pool = sorted(pool)
+    pool_weights = [1 / (i + 1) for i in range(len(pool))]
+    words = {}
+    while len(words) < count:
+        syllables = rng.choice([2, 2, 2, 3, 3, 4, 5])
+        jamos = decompose_word(''.join(rng.choices(pool, weights=pool_weights, k=syllables)))
+        words[jamos] = (len(jamos), len(jamos))
+    return words
+
+
+def load_words(lang: str = 'en', count: int = 100000) -> dict:
+    """Return word -> (length, score) for lang, real if available."""
+    path = WORDS_JSON_PATH if lang == 'en' else KOREAN_WORDS_JSON_PATH
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {
+            (word.upper() if lang == 'en' else word): (info[0], info[1])
+            for word, info in data.items()
+        }
+    if lang == 'en':
+        return _synthetic_english(count)
+    return _synthetic_korean(count)
+
+
+def timed(fn, *args, **kwargs):
+    """Run fn once; return (result, seconds)."""
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def traced(fn, *args, **kwargs):
+    """Run fn under tracemalloc; return (result, retained_bytes, peak_bytes)."""
+    tracemalloc.start()
+    try:
+        result = fn(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
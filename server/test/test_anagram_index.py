@@ -0,0 +1,235 @@
+"""
+Test the anagram signature index and solvable hands from draw_tiles_for_player
+"""
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.anagram_index import SignatureIndex, signature
+from core.words import find_rack_word
+from core.tiles import TileBag, BLANK_TILE
+from core.game import GameRoom, Player
+
+WORDS = ["CAT", "ACT", "TACT", "AT", "CARE", "RACE", "SCARE", "XYLYL", "QI", "ZZZ", "CARETAKINGS"]
+
+
+def _spellable(rack, word_list, wild=0):
+    """Brute force: some word whose letters the rack covers, with wild letters to spare."""
+    have = Counter(rack)
+    for word in word_list:
+        if 2 <= len(word) <= 10:
+            missing = Counter(word) - have
+            if sum(missing.values()) <= wild:
+                return True
+    return False
+
+
+def _install(word_list, lang='en'):
+    saved = words.words_by_length, words.word_signatures
+    by_length = {}
+    for word in word_list:
+        by_length.setdefault(len(word), []).append(word)
+    words.words_by_length = {lang: by_length}
+    words.word_signatures = {}
+    return saved
+
+
+def _restore(saved):
+    words.words_by_length, words.word_signatures = saved
+
+
+def test_signature_index():
+    print("Testing SignatureIndex queries against brute force...")
+    index = SignatureIndex(WORDS)
+    assert signature("CARE") == signature("RACE") == "ACER"
+    assert len(index) == 8, "anagrams share a signature; words over 10 letters are skipped"
+
+    rng = random.Random(7)
+    for _ in range(300):
+        rack = rng.choices("ACERSTXYLQIZ", k=rng.randint(0, 10))
+        found = index.find(rack)
+        assert (found is not None) == _spellable(rack, WORDS), rack
+        if found:
+            assert not Counter(found[0]) - Counter(rack) and found[1] == ""
+
+        # Blanks and free slots stand for any letter
+        for wild in (1, 2):
+            found = index.find(rack[:8] + [BLANK_TILE] * wild, blank=BLANK_TILE)
+            assert (found is not None) == _spellable(rack[:8], WORDS, wild), (rack, wild)
+            found = index.find(rack[:8], free=wild, rng=rng)
+            assert (found is not None) == _spellable(rack[:8], WORDS, wild), (rack, wild)
+            if found:
+                assert len(found[1]) <= wild and not Counter(found[0]) - Counter(rack[:8] + list(found[1]))
+
+    assert index.find([None, "T", None, "A"]) == ("AT", "")
+    assert index.find(["Q"], free=1) == ("IQ", "I")
+    assert index.find(list("XYLYL")) == ("LLXYY", "")
+    assert index.find(list("XYLYL"), max_nodes=3) is None, "gives up after max_nodes prefixes"
+    print("✓ SignatureIndex passed!")
+
+
+def test_find_rack_word():
+    print("\nTesting find_rack_word...")
+    saved = _install(WORDS)
+    try:
+        assert find_rack_word(["t", "a", None]) == ("AT", "")
+        assert find_rack_word([BLANK_TILE, "I"]) == ("IQ", "Q")
+        assert find_rack_word(["Q", "Z"]) is None
+        assert find_rack_word(["A", "T"], lang='ko') is None, "language not loaded"
+        first = words.word_signatures['en']
+        find_rack_word(["Q", "I"])
+        assert words.word_signatures['en'] is first, "index is built once per dictionary version"
+        words.words_by_length = {'en': {2: ["QI"]}}
+        assert find_rack_word(["A", "T"]) is None, "rebuilt when the words were replaced"
+    finally:
+        _restore(saved)
+
+    saved = _install(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅎㅏㄴㄱㅡㄹ"], lang='ko')
+    try:
+        assert find_rack_word(list("ㄱㅘㅅㅣㅏ"), 'ko') == (signature("ㅅㅏㄱㅘ"), "")
+        assert find_rack_word(list("ㄱㅘㅅ"), 'ko') is None
+    finally:
+        _restore(saved)
+    print("✓ find_rack_word passed!")
+
+
+def test_index_built_with_language():
+    """Loaded languages come with their SignatureIndex: the first draw builds nothing."""
+    print("\nTesting SignatureIndex built with the language...")
+    parts = words.build_language('en', {w: (len(w), 1) for w in WORDS})
+    assert parts['signatures'].source is parts['by_length']
+
+    saved_snapshot, saved_build = words.current_snapshot(), words._build_signatures
+
+    def fail(lang_words):
+        raise AssertionError("SignatureIndex built on first use")
+
+    words._build_signatures = fail
+    try:
+        snapshot = words.DictionarySnapshot.from_languages(1, 'test', {'en': parts})
+        assert find_rack_word(["T", "A"], snapshot=snapshot) == ("AT", "")
+        words._install_language('en', parts, saved_snapshot.version + 1)
+        assert words.word_signatures['en'] is parts['signatures']
+        assert find_rack_word(["T", "A"]) == ("AT", "")
+    finally:
+        words._build_signatures = saved_build
+        words._install_snapshot(saved_snapshot)
+    print("✓ SignatureIndex built with the language passed!")
+
+
+def _room(lang='en'):
+    room = GameRoom("TEST_RACK")
+    room.settings["lang"] = lang
+    room.tile_bag = TileBag(lang=lang)
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    return room, player
+
+
+def test_draws_are_solvable():
+    """Whatever the bag holds, a drawn hand spells at least one word."""
+    print("\nTesting solvable draws...")
+    # Words rare letters spell; random draws almost never contain them
+    word_list = ["QI", "ZZZ", "JUJU", "XYLYL"]
+    saved = _install(word_list)
+    try:
+        for seed in range(50):
+            random.seed(seed)
+            room, player = _room()
+            bag_total = len(room.tile_bag.bag)
+            drawn = room.draw_tiles_for_player("p1", 10)
+            assert len(drawn) == 10 and None not in player.hand
+            assert _spellable(player.hand, word_list, player.hand.count(BLANK_TILE)), player.hand
+            assert len(room.tile_bag.bag) <= bag_total, "redrawn tiles went back to the bag"
+
+            # Destroying a tile draws one: the hand still spells a word
+            room.destroy_tile("p1", seed % 10)
+            assert _spellable(player.hand, word_list, player.hand.count(BLANK_TILE)), player.hand
+            room.reroll_hand("p1")
+            assert _spellable(player.hand, word_list, player.hand.count(BLANK_TILE)), player.hand
+
+        # A full hand draws nothing
+        assert room.draw_tiles_for_player("p1", 3) == []
+    finally:
+        _restore(saved)
+    print("✓ Solvable draws passed!")
+
+
+def benchmark_draws():
+    """Index build, rack query latency and draw_tiles_for_player latency with the guarantee."""
+    import time
+    from bench_words import load_words, timed
+
+    print("\nBenchmarking solvable draws...")
+    for lang in ("en", "ko"):
+        word_list = list(load_words(lang))
+        saved = _install(word_list, lang)
+        try:
+            index, build_s = timed(words._get_signatures, lang)
+            print(f"  {lang} SignatureIndex: {len(index)} signatures from {len(word_list)} words | "
+                  f"build {build_s * 1000:.0f} ms | {index.memory_usage() / 1e6:.1f} MB")
+
+            bag = TileBag(lang=lang)
+            racks = []
+            for _ in range(3000):
+                rack = bag.draw(10)
+                racks.append(rack)
+                bag.add_tiles(rack)
+            times, unsolvable = [], 0
+            for rack in racks:
+                found, elapsed = timed(find_rack_word, rack, lang)
+                times.append(elapsed)
+                unsolvable += found is None
+            times.sort()
+            # Linear scan over every word, for scale
+            sample = racks[:20]
+            _, scan_s = timed(lambda: [_spellable(rack, word_list) for rack in sample])
+            print(f"  {lang} random 10-tile racks: {unsolvable / len(racks):5.1%} spell no word | query "
+                  f"p50 {times[len(times) // 2] * 1e6:5.0f} us | p99 {times[int(len(times) * 0.99)] * 1e6:5.0f} us | "
+                  f"max {times[-1] * 1e6:5.0f} us | linear scan {scan_s / len(sample) * 1000:.0f} ms/rack")
+
+            for count in (10, 1):
+                times, solvable = [], 0
+                for seed in range(1000):
+                    random.seed(seed)
+                    room, player = _room(lang)
+                    if count == 1:
+                        # Worst case for a single draw: 9 kept tiles that spell nothing (when any turn up)
+                        for _ in range(100):
+                            player.hand = room.tile_bag.draw(9) + [None]
+                            if find_rack_word(player.hand, lang) is None:
+                                break
+                    start = time.perf_counter()
+                    room.draw_tiles_for_player("p1", count)
+                    times.append(time.perf_counter() - start)
+                    solvable += find_rack_word(player.hand, lang) is not None
+                times.sort()
+                print(f"  {lang} draw {count:>2} tiles: {solvable / len(times):6.1%} hands spell a word | "
+                      f"p50 {times[len(times) // 2] * 1e6:5.0f} us | p99 {times[int(len(times) * 0.99)] * 1e6:5.0f} us | "
+                      f"max {times[-1] * 1e6:5.0f} us")
+        finally:
+            _restore(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Anagram Signature Index Test Suite")
+    print("=" * 50)
+
+    test_signature_index()
+    test_find_rack_word()
+    test_index_built_with_language()
+    test_draws_are_solvable()
+
+    if "--bench" in sys.argv:
+        benchmark_draws()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,276 @@
+"""
+Test blank tiles: bag contents, wildcard substring checks and trie-walk resolution in GameRoom
+"""
+import asyncio
+import re
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.words import FactorCursor, has_valid_prefix, resolve_blanks, blank_choices
+from core.tiles import TileBag, BLANK_TILE
+from core.game import GameRoom, Player
+from word_fixtures import install_words, restore_words
+
+WORDS = ["CAT", "COT", "CUT", "CUTE", "OX", "AX", "TO", "SCAT", "ACT", "TACT", "UP"]
+
+
+def _regex(pattern):
+    return re.compile(re.escape(pattern).replace(re.escape(BLANK_TILE), '.'))
+
+
+def test_bag_has_blanks():
+    print("Testing blank tiles in the bag...")
+    for lang in ("en", "ko"):
+        bag = TileBag(lang=lang)
+        assert len(bag.bag) == TileBag.BAG_SIZE, (lang, len(bag.bag))
+        assert bag.bag.count(BLANK_TILE) == TileBag.BLANK_COUNT, lang
+    print("✓ Bag blank tiles passed!")
+
+
+def test_substring_checks_with_blanks():
+    """has_valid_prefix and FactorCursor treat a blank as any letter."""
+    print("\nTesting substring checks with blanks...")
+    saved = install_words(WORDS)
+    try:
+        runs = ["?", "C?", "?T", "C?T", "?C?", "??T?", "S??T", "X?", "?Q", "??????", "T?C?", "A?"]
+        for run in runs:
+            expected = any(_regex(run).search(w) for w in WORDS)
+            assert has_valid_prefix(run) == expected, run
+            assert FactorCursor(run).is_valid == expected, run
+
+            # Grown tile by tile from the middle, in both directions
+            mid = len(run) // 2
+            cursor = FactorCursor(run[mid])
+            for char in reversed(run[:mid]):
+                cursor = cursor.prepended(char)
+            for char in run[mid + 1:]:
+                cursor = cursor.appended(char)
+            assert cursor.text == run and cursor.is_valid == expected, run
+        assert not FactorCursor("XQ").appended("?").is_valid, "DEAD stays DEAD through a blank"
+
+        # Without automata the trie fallback also understands blanks
+        factors = words.word_factors, words.word_factors_reverse
+        words.word_factors, words.word_factors_reverse = {}, {}
+        try:
+            assert has_valid_prefix("C?") and has_valid_prefix("?TE") and not has_valid_prefix("?Q")
+        finally:
+            words.word_factors, words.word_factors_reverse = factors
+    finally:
+        restore_words(saved)
+    print("✓ Substring checks with blanks passed!")
+
+
+def test_resolve_blanks():
+    print("\nTesting blank resolution...")
+    saved = install_words(WORDS)
+    try:
+        assert resolve_blanks("c?t") == "CAT"
+        assert resolve_blanks("C?T", choices={1: {"O", "X"}}) == "COT"
+        assert resolve_blanks("C?T", choices={1: {"E"}}) is None
+        assert resolve_blanks("??T") == "CAT" and resolve_blanks("?CT") == "ACT"
+        assert resolve_blanks("??T", choices={0: {"S", "T"}}) is None
+        assert resolve_blanks("?C?T", choices={0: {"S"}}) == "SCAT"
+        assert resolve_blanks("C??Z") is None and resolve_blanks("?", lang="ko") is None
+        assert blank_choices("?X") == {0: {"A", "O"}}
+        assert blank_choices("C?T") == {1: {"A", "O", "U"}}
+        assert blank_choices("?Q") == {0: set()}
+    finally:
+        restore_words(saved)
+
+    saved = install_words(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅅㅏ", "ㅎㅏㄴㄱㅡㄹ"], lang='ko')
+    try:
+        assert resolve_blanks("ㅅ?ㄱㅘ", lang='ko') == "ㅅㅏㄱㅘ"
+        assert resolve_blanks("??ㄴㄱㅡ?", lang='ko') == "ㅎㅏㄴㄱㅡㄹ"
+        assert resolve_blanks("ㅅㅏ?ㅏ?", lang='ko', choices={2: {"ㄱ"}}) is None
+        assert has_valid_prefix("ㅏ?ㄱ", lang='ko') and not has_valid_prefix("ㅏ??ㅎ", lang='ko')
+    finally:
+        restore_words(saved)
+    print("✓ Blank resolution passed!")
+
+
+def _room(board):
+    room = GameRoom("TEST_BLANK")
+    room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+    room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    player.hand = [BLANK_TILE, "Q"]
+    for (x, y), letter in board.items():
+        room.board[(x, y)] = {'x': x, 'y': y, 'letter': letter, 'color': '#000'}
+    return room, player
+
+
+def test_crossing_blank():
+    """One blank completing two words takes a letter valid in both directions."""
+    print("\nTesting a blank shared by crossing words...")
+    saved = install_words(WORDS)
+
+    async def scenario():
+        # C ? T across, ? X down: both words resolve with the same letter
+        room, player = _room({(0, 0): "C", (2, 0): "T", (1, 1): "X"})
+        ok, err = await room.handle_place_tile(1, 0, BLANK_TILE, "p1", hand_index=0)
+        assert ok, err
+        tile = room.board.get((1, 0))
+        assert tile and tile['blank'] and tile['letter'] == "A", tile
+        assert room.pending_tiles == []
+
+        # ? P across, C ? T down: CAT sorts first, but only U also makes UP
+        room, player = _room({(0, 0): "C", (0, 2): "T", (1, 1): "P"})
+        ok, err = await room.handle_place_tile(0, 1, BLANK_TILE, "p1", hand_index=0)
+        assert ok, err
+        assert room.board[(0, 1)]['letter'] == "U" and room.board[(0, 1)]['blank']
+
+        # Each direction alone has a word (CUTE, AX/OX) but no letter fits both:
+        # the blank goes back to the hand as a blank
+        room, player = _room({(0, 0): "C", (2, 0): "T", (3, 0): "E", (1, 1): "X"})
+        ok, err = await room.handle_place_tile(1, 0, BLANK_TILE, "p1", hand_index=0)
+        assert ok, err
+        assert (1, 0) not in room.board and room.pending_tiles == []
+        assert player.hand[0] == BLANK_TILE
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ Crossing blank passed!")
+
+
+def test_crossing_cursor_after_blank():
+    """A crossing group still pending reads the blank's resolved letter, not the blank."""
+    print("\nTesting the crossing group's cursor after a blank resolves...")
+    saved = install_words(["CAT", "GITE", "LATE"])
+
+    async def scenario():
+        # C ? T across resolves to CAT while T E below the blank stays pending
+        room, player = _room({(0, 0): "C", (2, 0): "T", (1, 2): "E"})
+        player.hand = [BLANK_TILE, "T", "G"]
+        player.score = 10
+        for x, y, letter, hand_index in [(1, 1, "T", 1), (1, 0, BLANK_TILE, 0)]:
+            ok, err = await room.handle_place_tile(x, y, letter, "p1", hand_index=hand_index)
+            assert ok, err
+        for task in room.group_timers.values():
+            task.cancel()
+        await room.finalize_pending_group(room.pending_tiles.tile_at(1, 0)['h_group_id'], 'h')
+        assert room.board[(1, 0)]['letter'] == "A"
+        v_key = f"v:{room.pending_tiles.tile_at(1, 1)['v_group_id']}"
+        assert v_key not in room.group_cursors or BLANK_TILE not in room.group_cursors[v_key]['cursor'].text
+        score = player.score
+
+        # G A T E is not a factor of any word: G alone is rejected early, T stays pending
+        ok, err = await room.handle_place_tile(1, -1, "G", "p1", hand_index=2)
+        assert ok, err
+        assert player.score == score - 1, (score, player.score)
+        assert player.hand[2] == "G" and room.pending_tiles.tile_at(1, 1) is not None
+        assert (1, -1) not in room.board and (1, 1) not in room.board
+        for task in room.group_timers.values():
+            task.cancel()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ Crossing cursor after a blank passed!")
+
+
+def test_crossing_blank_korean():
+    """A Korean crossing run that stays one syllable does not restrict the blank."""
+    print("\nTesting a blank under a one-syllable Korean crossing run...")
+    saved = install_words(["ㅅㅏㄱㅘ", "ㅇㅏㄱㅏ"], lang='ko')
+
+    async def scenario():
+        # ㅅ ? ㄱ ㅘ across, ㅇ ? down: 사과 as long as the blank is ㅏ (ㅇ+ㅏ is just 아)
+        room, player = _room({(0, 0): "ㅅ", (2, 0): "ㄱ", (3, 0): "ㅘ", (1, -1): "ㅇ"})
+        room.settings["lang"] = "ko"
+        ok, err = await room.handle_place_tile(1, 0, BLANK_TILE, "p1", hand_index=0)
+        assert ok, err
+        # ㅇ? matches no word yet, so the group waits for its timer: finalize it as the timer would
+        for task in room.group_timers.values():
+            task.cancel()
+        await room.finalize_pending_group(room.pending_tiles[0]['h_group_id'], 'h')
+        tile = room.board.get((1, 0))
+        assert tile and tile['blank'] and tile['letter'] == "ㅏ", tile
+        messages = [call.args[0].get("message") for call in room.broadcast.call_args_list]
+        assert "Word completed: 사과" in messages, messages
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ Korean crossing blank passed!")
+
+
+def benchmark_blank_resolution():
+    """Worst case: several blanks in one long word, trie walk vs 26^k / jamo^k cache lookups."""
+    import random
+    from bench_words import load_words, timed
+    from core.words import get_word_in_cache
+
+    print("\nBenchmarking blank resolution...")
+    naive_limit = 20000  # expansions actually run; larger ones are extrapolated
+    for lang in ("en", "ko"):
+        word_list = list(load_words(lang))
+        saved = install_words(word_list, lang)
+        try:
+            rng = random.Random(0)
+            alphabet = sorted({char for word in word_list for char in word})
+            long_words = rng.sample([w for w in word_list if len(w) >= 12], 50)
+            # Almost every expanded candidate misses the cache, so time misses
+            misses = [w + w[0] for w in long_words] * 200
+            probe_s = timed(lambda: [get_word_in_cache(w, lang) for w in misses])[1] / len(misses)
+            for blanks in (2, 3, 4, 5):
+                for kind in ("match", "no match"):
+                    patterns = []
+                    for word in long_words:
+                        chars = list(word)
+                        if kind == "no match":
+                            chars[-1] = rng.choice([c for c in alphabet if c != chars[-1]])
+                        # Leading blanks are the hardest case for a forward walk
+                        for i in [0] + rng.sample(range(1, len(word) - 1), blanks - 1):
+                            chars[i] = BLANK_TILE
+                        patterns.append(''.join(chars))
+                    _, walk_s = timed(lambda: [resolve_blanks(p, lang) for p in patterns])
+                    found = sum(resolve_blanks(p, lang) is not None for p in patterns)
+                    combos = len(alphabet) ** blanks
+                    naive = f"{combos * probe_s * 1000:9.1f} ms (est., lookups only)"
+                    if combos <= naive_limit:
+                        sample = patterns[:3]
+
+                        def expand():
+                            import itertools
+                            for pattern in sample:
+                                for letters in itertools.product(alphabet, repeat=blanks):
+                                    fill = iter(letters)
+                                    candidate = ''.join(next(fill) if c == BLANK_TILE else c for c in pattern)
+                                    if get_word_in_cache(candidate, lang)["is_valid"]:
+                                        break
+                        naive = f"{timed(expand)[1] / len(sample) * 1000:9.1f} ms"
+                    print(f"  {lang} {blanks} blanks, {kind:<8} ({found:>2}/{len(patterns)} resolved) | "
+                          f"trie {walk_s / len(patterns) * 1000:6.3f} ms/word | "
+                          f"naive {combos:>12,} lookups {naive}/word")
+        finally:
+            restore_words(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Blank Tile Test Suite")
+    print("=" * 50)
+
+    test_bag_has_blanks()
+    test_substring_checks_with_blanks()
+    test_resolve_blanks()
+    test_crossing_blank()
+    test_crossing_cursor_after_blank()
+    test_crossing_blank_korean()
+
+    if "--bench" in sys.argv:
+        benchmark_blank_resolution()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,294 @@
+"""
+Test coordinate indexes for pending tiles (PendingTiles) and the combined board view (BoardView)
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.board_index import Board, PendingTiles, BoardView, RunIndex
+from core.game import GameRoom, Player
+from word_fixtures import install_words, restore_words
+
+WORDS = ["CAT", "CATS", "AT", "TO"]
+
+
+def _tile(x, y, letter, group="g"):
+    return {'x': x, 'y': y, 'letter': letter, 'player_id': 'p1', 'color': '#fff',
+            'h_group_id': group, 'v_group_id': group, 'hand_index': None}
+
+
+def test_pending_tiles_index():
+    print("Testing the PendingTiles coordinate index...")
+    a, b, c = _tile(0, 0, "A"), _tile(1, 0, "B"), _tile(0, 0, "C")
+    tiles = PendingTiles([a, b])
+    assert tiles == [a, b] and tiles.tile_at(1, 0) is b and tiles.tile_at(5, 5) is None
+
+    tiles.append(c)
+    assert tiles.tile_at(0, 0) is a, "the first tile at a position wins"
+    tiles.remove(a)
+    assert tiles.tile_at(0, 0) is c, "a shadowed tile takes over"
+    assert tiles.pop() is c and (0, 0) not in tiles.by_position
+    tiles += [a]
+    tiles[0] = _tile(2, 0, "D")
+    assert set(tiles.by_position) == {(2, 0), (0, 0)}
+    del tiles[0]
+    assert set(tiles.by_position) == {(0, 0)}
+    tiles.clear()
+    assert tiles == [] and tiles.by_position == {}
+    assert json.loads(json.dumps(PendingTiles([a]))) == [a], "sent to clients as a plain list"
+    print("✓ PendingTiles index passed!")
+
+
+def test_board_view():
+    print("\nTesting BoardView...")
+    board = {(0, 0): {'x': 0, 'y': 0, 'letter': 'C'}}
+    pending = PendingTiles([_tile(1, 0, "A")])
+    view = BoardView(board, pending.by_position)
+    assert (0, 0) in view and view[(1, 0)] == "A" and view.get((2, 0)) is None
+
+    # Live: later placements show up without rebuilding the view
+    pending.append(_tile(2, 0, "T"))
+    board[(0, 1)] = {'x': 0, 'y': 1, 'letter': 'O'}
+    assert view[(2, 0)] == "T" and view[(0, 1)] == "O"
+
+    # Board tiles shadow pending ones; assigned letters shadow both and stay in the view
+    pending.append(_tile(0, 0, "X"))
+    assert view[(0, 0)] == "C"
+    view[(1, 0)] = "E"
+    assert view[(1, 0)] == "E" and pending.tile_at(1, 0)['letter'] == "A"
+    try:
+        view[(9, 9)]
+        assert False, "missing positions raise KeyError like a dict"
+    except KeyError:
+        pass
+    print("✓ BoardView passed!")
+
+
+def _runs_brute(board, horizontal):
+    """Maximal runs per line, with their text, by sorting the occupied cells."""
+    lines = {}
+    for x, y in board:
+        line, c = (y, x) if horizontal else (x, y)
+        lines.setdefault(line, []).append(c)
+    runs = {}
+    for line, coords in lines.items():
+        coords.sort()
+        start = coords[0]
+        for prev, cur in zip(coords, coords[1:] + [None]):
+            if cur != prev + 1:
+                cells = [(c, line) if horizontal else (line, c) for c in range(start, prev + 1)]
+                text = ''.join(board[pos]['letter'] for pos in cells)
+                runs.update({(line, c): ((start, prev), text) for c in range(start, prev + 1)})
+                start = cur
+    return runs
+
+
+def test_run_index():
+    """Runs kept up to date by add/remove match the runs recomputed from scratch."""
+    print("\nTesting the RunIndex against brute force...")
+    import random
+    rng = random.Random(4)
+    board = Board()
+    for step in range(3000):
+        pos = (rng.randint(-5, 14), rng.randint(0, 3))
+        if pos in board and rng.random() < 0.5:
+            if step % 2:
+                del board[pos]
+            else:
+                board.pop(pos)
+        else:
+            board[pos] = {'x': pos[0], 'y': pos[1], 'letter': rng.choice("ABC")}
+        if step % 50 == 0:
+            for index, horizontal in ((board.rows, True), (board.columns, False)):
+                expected = _runs_brute(board, horizontal)
+                for x in range(-6, 16):
+                    for y in range(-1, 5):
+                        key = (y, x) if horizontal else (x, y)
+                        run, text = expected.get(key, (None, None))
+                        assert index.run(*key) == run, (key, horizontal)
+                        if run:
+                            assert index.text(key[0], *run) == text, (key, horizontal)
+                            assert index.text(key[0], key[1], run[1]) == text[key[1] - run[0]:]
+
+    rebuilt = Board(board)
+    assert all(rebuilt.rows.run(y, x) == board.rows.run(y, x) for x, y in board)
+    board.clear()
+    assert board.rows.run(0, 0) is None and board.columns.run(0, 0) is None
+    print("✓ RunIndex passed!")
+
+
+def test_view_run_through():
+    print("\nTesting BoardView.run_through...")
+    board = Board({(x, 0): {'x': x, 'y': 0, 'letter': letter} for x, letter in zip([0, 1, 2, 4, 5], "CATIS")})
+    pending = PendingTiles([_tile(3, 0, "-"), _tile(6, 0, "!")])
+    view = BoardView(board, pending.by_position)
+    # Board runs joined by pending cells
+    assert view.run_through(1, 0, 1, 0) == ((0, 0), (6, 0))
+    assert view.letters_between((0, 0), (6, 0)) == "CAT-IS!"
+    assert view.letters_between((1, 0), (4, 0)) == "AT-I", "board text sliced, pending letters in between"
+    board[(5, 0)] = {'x': 5, 'y': 0, 'letter': "T"}
+    assert view.letters_between((0, 0), (6, 0)) == "CAT-IT!", "replacing a tile updates the run text"
+    view[(1, 0)] = "O"
+    assert view.letters_between((0, 0), (2, 0)) == "COT"
+    assert BoardView(board, {}).run_through(5, 0, 1, 0) == ((4, 0), (5, 0))
+    assert view.run_through(1, 0, 0, 1) == ((1, 0), (1, 0))
+    # A plain dict board is stepped cell by cell, with the same answer
+    plain = BoardView(dict(board), pending.by_position)
+    assert plain.run_through(4, 0, 1, 0) == ((0, 0), (6, 0)) and plain.letters_between((0, 0), (6, 0)) == "CAT-IT!"
+    print("✓ BoardView.run_through passed!")
+
+
+
+def _room():
+    room = GameRoom("TEST_INDEX")
+    room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+    room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    return room, player
+
+
+def test_room_uses_the_index():
+    print("\nTesting GameRoom lookups through the index...")
+    saved = install_words(WORDS)
+
+    async def scenario():
+        room, player = _room()
+        player.hand = list("CATSO")
+        try:
+            for x, letter in [(0, "C"), (1, "A")]:
+                ok, err = await room.handle_place_tile(x, 0, letter, "p1")
+                assert ok, err
+            assert set(room.pending_tiles.by_position) == {(0, 0), (1, 0)}
+            ok, err = await room.handle_place_tile(1, 0, "T", "p1")
+            assert not ok and "already exists" in err
+            ok, err = await room.handle_place_tile(5, 5, "T", "p1")
+            assert not ok and "adjacent" in err
+
+            view = room._get_combined_board_dict()
+            assert room._get_word_at(0, 0, 'h', board_dict=view) == "CA"
+            ok, err = await room.handle_place_tile(2, 0, "T", "p1")
+            assert ok, err
+            assert [(0, 0), (1, 0), (2, 0)] <= list(room.board) and room.pending_tiles.by_position == {}
+            assert room._get_word_at(0, 0, 'h', board_dict=view) == "CAT", "the view is live"
+
+            assert room.board.rows.run(0, 1) == (0, 2), "the board keeps its run index"
+            room.board = dict(room.board)
+            assert isinstance(room.board, Board) and room.board.columns.run(2, 0) == (0, 0)
+
+            # Replacing the list (as cleanup code and tests do) keeps it indexed
+            room.pending_tiles = [_tile(3, 0, "S")]
+            assert isinstance(room.pending_tiles, PendingTiles) and room._letter_at(3, 0) == "S"
+            assert room._get_word_at(1, 0, 'h') == "CATS"
+        finally:
+            for task in room.group_timers.values():
+                task.cancel()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ GameRoom index lookups passed!")
+
+
+def benchmark_board_size_scaling():
+    """Placement checks and word reads as the board and the pending list grow."""
+    import logging
+    import random
+    import time
+    from bench_words import load_words, timed
+
+    print("\nBenchmarking placement cost vs. board size...")
+    saved = install_words(list(load_words('en')))
+    rng = random.Random(0)
+    logging.disable(logging.DEBUG)
+    try:
+        for size in (100, 1000, 10000, 50000):
+            room, player = _room()
+            room.draw_tiles_for_player = MagicMock(return_value=[])
+            # Isolated tiles on a grid: one in ten still pending
+            side = int((size * 1.1) ** 0.5) + 1
+            cells = [(x * 3, y * 3) for x in range(side) for y in range(side)][:size + size // 10]
+            for i, (x, y) in enumerate(cells):
+                letter = rng.choice("ABCDEFGHIKLMNOPRSTU")
+                if i % 11 == 10:
+                    room.pending_tiles.append(_tile(x, y, letter, group=f"g{i}"))
+                else:
+                    room.board[(x, y)] = {'x': x, 'y': y, 'letter': letter, 'color': '#fff'}
+            targets = [(x + 1, y) for x, y in rng.sample(list(room.board), min(200, len(room.board)))]
+
+            async def place_all():
+                elapsed = 0.0
+                for x, y in targets:
+                    player.hand = ["A"] + [None] * 9
+                    start = time.perf_counter()
+                    await room.handle_place_tile(x, y, "A", "p1")
+                    elapsed += time.perf_counter() - start
+                    for task in room.group_timers.values():
+                        task.cancel()
+                    room.group_timers.clear()
+                    # Undo whatever the placement did (untimed)
+                    room.board.pop((x, y), None)
+                    room.pending_tiles = [t for t in room.pending_tiles if (t['x'], t['y']) != (x, y)]
+                return elapsed
+
+            place_s = asyncio.run(place_all())
+            _, read_s = timed(lambda: [room._get_word_at(x - 1, y, 'h') for x, y in targets])
+            print(f"  {size:>6} board + {len(room.pending_tiles):>5} pending tiles | "
+                  f"handle_place_tile {place_s / len(targets) * 1e6:8.0f} us | "
+                  f"_get_word_at {read_s / len(targets) * 1e6:8.1f} us")
+    finally:
+        logging.disable(logging.NOTSET)
+        restore_words(saved)
+
+
+def benchmark_long_lines():
+    """Finding and reading the word through a cell as lines get long: stepping vs. run index."""
+    import random
+    from bench_words import timed
+
+    print("\nBenchmarking word extraction on long lines...")
+    rng = random.Random(0)
+    for length in (10, 100, 1000, 10000):
+        # One fully occupied row and column of `length` tiles, plus a few pending tiles at the ends
+        board = Board()
+        for i in range(length):
+            board[(i, 0)] = {'x': i, 'y': 0, 'letter': 'A'}
+            board[(0, i + 1)] = {'x': 0, 'y': i + 1, 'letter': 'B'}
+        pending = PendingTiles([_tile(length, 0, "S"), _tile(0, length + 1, "S")])
+        indexed = BoardView(board, pending.by_position)
+        stepped = BoardView(dict(board), pending.by_position)
+        queries = [(rng.randrange(length), 0, 1, 0) for _ in range(500)] + \
+                  [(0, rng.randrange(1, length + 1), 0, 1) for _ in range(500)]
+
+        _, step_s = timed(lambda: [stepped.run_through(*q) for q in queries])
+        _, index_s = timed(lambda: [indexed.run_through(*q) for q in queries])
+        assert [stepped.run_through(*q) for q in queries] == [indexed.run_through(*q) for q in queries]
+        _, read_s = timed(lambda: [indexed.letters_between(*indexed.run_through(*q)) for q in queries])
+        print(f"  {length:>5}-tile lines | word through a cell: stepping {step_s / len(queries) * 1e6:8.1f} us, "
+              f"run index {index_s / len(queries) * 1e6:5.1f} us | with its letters {read_s / len(queries) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Board Index Test Suite")
+    print("=" * 50)
+
+    test_pending_tiles_index()
+    test_board_view()
+    test_run_index()
+    test_view_run_through()
+    test_room_uses_the_index()
+
+    if "--bench" in sys.argv:
+        benchmark_board_size_scaling()
+        benchmark_long_lines()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,155 @@
+"""
+Test Minimal DAWG Implementation
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.dawg import MinimalDawg
+from core.double_array_trie import DoubleArrayTrie, BidirectionalTrie
+from core.dictionary_artifact import write_artifact, open_artifact
+from core.words import build_language_index
+
+WORDS = ["apple", "app", "application", "banana", "band", "bandana", "caring", "playing",
+         "ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅎㅏㄴㄱㅡㄹ", "a", "zzz"]
+
+
+def test_dawg_matches_dict_trie():
+    """Test that the DAWG answers exactly like the dict engine."""
+    print("Testing MinimalDawg parity...")
+    dict_trie = DoubleArrayTrie()
+    dict_trie.build(WORDS)
+    dawg = MinimalDawg()
+    dawg.build(WORDS + ["band"])  # duplicates are ignored
+
+    queries = WORDS + ["", "ap", "appl", "apples", "ban", "bandanas", "ing", "aring", "x",
+                       "ㅅ", "ㅅㅏ", "ㅅㅏㅇ", "ㅎㅏㄴ", "zz", "zzzz", "A"]
+    for q in queries:
+        assert dawg.search(q) == dict_trie.search(q), f"search mismatch for '{q}'"
+        assert dawg.has_prefix(q) == dict_trie.has_prefix(q), f"has_prefix mismatch for '{q}'"
+
+    assert len(dawg) == len(WORDS)
+    assert dawg.memory_usage() > 0
+    print("✓ MinimalDawg parity tests passed!")
+
+
+def test_dawg_is_minimal():
+    """Test that equivalent suffixes are merged into shared states."""
+    print("\nTesting DAWG minimisation...")
+    dawg = MinimalDawg()
+    dawg.build(["cats", "bats", "cat", "bat"])
+    # root -{b,c}-> . -a-> . -t-> (final) -s-> (final)
+    assert dawg.state_count() == 5, dawg.state_count()
+
+    dawg.build(["caring", "playing", "saying", "ring"])
+    trie_states = 1 + len({w[:i] for w in ["caring", "playing", "saying", "ring"] for i in range(1, len(w) + 1)})
+    assert dawg.state_count() < trie_states // 2, (dawg.state_count(), trie_states)
+    assert dawg.search("ring") and not dawg.search("ing") and not dawg.search("pring")
+    print(f"  {dawg.state_count()} DAWG states vs {trie_states} trie nodes")
+    print("✓ DAWG minimisation tests passed!")
+
+
+def test_dawg_empty():
+    """Test that an empty DAWG behaves like an empty dict trie."""
+    print("\nTesting empty MinimalDawg...")
+    dawg = MinimalDawg()
+    assert dawg.search("a") == False, "Unbuilt graph finds nothing"
+    assert dawg.has_prefix("a") == True, "Unbuilt graph should be permissive"
+
+    dawg.build([])
+    assert dawg.search("test") == False
+    assert dawg.has_prefix("a") == True, "Empty graph should be permissive"
+    print("✓ Empty MinimalDawg tests passed!")
+
+
+def test_bidirectional_dawg():
+    print("\nTesting BidirectionalTrie with the dawg engine...")
+    btrie = BidirectionalTrie(engine='dawg')
+    btrie.build(["caring", "playing", "hello"])
+    assert btrie.search("hello") and not btrie.search("hell")
+    assert btrie.has_prefix("car") and btrie.has_suffix("ing") and btrie.has_substring("hel")
+    assert not btrie.has_suffix("xyz")
+    print("✓ BidirectionalTrie dawg engine passed!")
+
+
+def test_dawg_artifact_roundtrip():
+    """A dawg-engine language is written to and mapped back from the artifact."""
+    print("\nTesting dawg artifact roundtrip...")
+    words = {"CAT": (3, 3), "CATS": (4, 4), "CARING": (6, 8), "PLAYING": (7, 9)}
+    parts = build_language_index('en', list(words), engine='dawg')
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "dictionary.bin"
+        write_artifact(path, {'en': {**parts, 'words': words}})
+        artifact = open_artifact(path)
+        trie = artifact.bidirectional_trie('en')
+        assert trie.engine == 'dawg' and isinstance(trie.forward_trie, MinimalDawg)
+        assert isinstance(trie.forward_trie.targets, memoryview), "served from the mapping"
+        for probe in ["CAT", "CATS", "CA", "CARINGS", "PLAY", "ING", "X"]:
+            assert trie.search(probe) == parts['trie'].search(probe), probe
+            assert trie.has_prefix(probe) == parts['trie'].has_prefix(probe), probe
+            assert trie.has_suffix(probe) == parts['trie'].has_suffix(probe), probe
+            assert trie.count_with_prefix(probe) == parts['trie'].count_with_prefix(probe), probe
+        assert trie.count_with_prefix("CA") == 3 and trie.count_with_suffix("ING") == 2
+
+        try:
+            write_artifact(Path(tmpdir) / "dict.bin",
+                           {'en': {**build_language_index('en', list(words), engine='dict'), 'words': words}})
+            assert False, "dict engine cannot be compiled"
+        except ValueError:
+            pass
+    print("✓ Dawg artifact roundtrip passed!")
+
+
+def benchmark_engines():
+    """Memory and query speed of dict, double_array and dawg on the real word lists."""
+    import random
+    from bench_words import load_words, timed, traced
+
+    print("\nBenchmarking trie engines (forward + reverse, as BidirectionalTrie)...")
+    for lang in ("en", "ko"):
+        words = list(load_words(lang))
+        rng = random.Random(0)
+        hits = rng.sample(words, 20000)
+        misses = [w[:-1] + w[0] for w in rng.sample(words, 20000)]
+        prefixes = [w[:rng.randint(1, len(w))] for w in rng.sample(words, 20000)] + misses
+        queries = hits + misses
+
+        def build(engine):
+            btrie = BidirectionalTrie(engine=engine)
+            btrie.build(words)
+            return btrie
+
+        for engine in ("dict", "double_array", "dawg"):
+            btrie, build_s = timed(build, engine)
+            _, retained, peak = traced(build, engine)
+            forward = btrie.forward_trie
+            _, search_s = timed(lambda: [forward.search(q) for q in queries])
+            _, prefix_s = timed(lambda: [forward.has_prefix(q) for q in prefixes])
+            arrays = f"{btrie.memory_usage() / 1e6:5.1f} MB arrays" if engine != 'dict' else " " * 15
+            print(f"  {lang:<3} {engine:<13} {len(words):>7} words | build {build_s:6.2f}s | "
+                  f"retained {retained / 1e6:6.1f} MB | {arrays} | peak {peak / 1e6:6.1f} MB | "
+                  f"search {len(queries) / search_s / 1e3:5.0f}k/s | "
+                  f"has_prefix {len(prefixes) / prefix_s / 1e3:5.0f}k/s")
+            del btrie, forward
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Minimal DAWG Test Suite")
+    print("=" * 50)
+
+    test_dawg_matches_dict_trie()
+    test_dawg_is_minimal()
+    test_dawg_empty()
+    test_bidirectional_dawg()
+    test_dawg_artifact_roundtrip()
+
+    if "--bench" in sys.argv:
+        benchmark_engines()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
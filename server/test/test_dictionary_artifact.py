@@ -0,0 +1,163 @@
+"""
+Test the compiled, mmap'd dictionary artifact
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.dictionary_artifact import write_artifact, open_artifact
+from core.lexicon import encode_word_table
+from core.double_array_trie import BidirectionalTrie
+from core.factor_automaton import FactorAutomaton
+
+WORDS = {
+    'en': {"CAT": (3, 3), "CATS": (4, 4), "ACT": (3, 3), "CARING": (6, 8), "TO": (2, 2)},
+    'ko': {"ㅅㅏㄱㅘ": (4, 4), "ㅅㅏㄹㅏㅁ": (5, 5), "ㅎㅏㄴㄱㅡㄹ": (6, 6)},
+}
+FINGERPRINT = {'en': [5, 12345], 'ko': [3, -678]}
+
+
+def _build_languages(words_by_lang):
+    languages = {}
+    for lang, words in words_by_lang.items():
+        trie = BidirectionalTrie(engine='double_array')
+        trie.build(list(words))
+        factors = FactorAutomaton()
+        factors.build(list(words))
+        reverse_factors = FactorAutomaton()
+        reverse_factors.build([word[::-1] for word in words])
+        languages[lang] = {'words': words, 'trie': trie, 'factors': factors,
+                           'reverse_factors': reverse_factors}
+    return languages
+
+
+def _write(tmpdir, words_by_lang=WORDS):
+    path = Path(tmpdir) / "dictionary.bin"
+    write_artifact(path, _build_languages(words_by_lang), FINGERPRINT)
+    return path
+
+
+def test_roundtrip():
+    print("Testing artifact roundtrip...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact = open_artifact(_write(tmpdir))
+        assert artifact is not None, "Fresh artifact should open"
+        assert sorted(artifact.languages) == ['en', 'ko']
+        assert artifact.fingerprint == FINGERPRINT
+
+        for lang, words in WORDS.items():
+            cache, by_length = artifact.word_table(lang)
+            assert cache == words, f"{lang} word table mismatch"
+            for length, bucket in by_length.items():
+                assert sorted(bucket) == sorted(w for w, (l, _) in words.items() if l == length)
+
+            trie = artifact.bidirectional_trie(lang)
+            factors = artifact.factor_automaton(lang)
+            for word in words:
+                assert trie.search(word)
+                assert trie.has_prefix(word[:2]) and trie.has_suffix(word[-2:])
+                assert factors.is_factor(word[1:-1] or word)
+            assert not trie.search("ZZZ")
+
+        cats = artifact.bidirectional_trie('en')
+        assert cats.has_prefix("CAR") and not cats.has_prefix("CAX")
+        assert artifact.factor_automaton('en').is_factor("ARI")
+        assert not artifact.factor_automaton('en').is_factor("TAC")
+        assert artifact.factor_automaton('en', reverse=True).is_factor("IRA")
+    print("✓ Roundtrip passed!")
+
+
+def test_corrupt_artifact_rejected():
+    print("\nTesting corrupt artifact rejection...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir)
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        assert open_artifact(path) is None, "Checksum mismatch must be rejected"
+
+        path.write_bytes(b"NOTADICT" + bytes(100))
+        assert open_artifact(path) is None, "Bad magic must be rejected"
+
+        path.write_bytes(b"")
+        assert open_artifact(path) is None, "Empty file must be rejected"
+
+        assert open_artifact(Path(tmpdir) / "missing.bin") is None
+    print("✓ Corrupt artifact rejection passed!")
+
+
+def test_version_mismatch_rejected():
+    print("\nTesting format version check...")
+    import core.dictionary_artifact as artifact_module
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir)
+        original = artifact_module.FORMAT_VERSION
+        artifact_module.FORMAT_VERSION = original + 1
+        try:
+            assert open_artifact(path) is None, "Old format must be rejected"
+        finally:
+            artifact_module.FORMAT_VERSION = original
+        assert open_artifact(path) is not None
+    print("✓ Format version check passed!")
+
+
+def test_word_table_by_length_ranges():
+    print("\nTesting by-length index...")
+    table = encode_word_table(WORDS['en'])
+    triples = list(table['by_length'])
+    assert triples == [2, 0, 1, 3, 1, 3, 4, 3, 4, 6, 4, 5], triples
+    assert list(table['words.length']) == [2, 3, 3, 4, 6]
+    print("✓ By-length index passed!")
+
+
+def benchmark_time_to_ready():
+    """Startup cost: build from rows vs. map the compiled artifact."""
+    from bench_words import load_words, timed
+    from core.words import build_language_index
+
+    print("\nBenchmarking time-to-ready...")
+    words_by_lang = {lang: load_words(lang) for lang in ('en', 'ko')}
+
+    def build_from_rows():
+        for lang, words in words_by_lang.items():
+            build_language_index(lang, list(words))
+
+    _, build_s = timed(build_from_rows)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = _write(tmpdir, words_by_lang)
+
+        def load_artifact():
+            artifact = open_artifact(path)
+            for lang in artifact.languages:
+                artifact.word_table(lang)
+                artifact.bidirectional_trie(lang)
+                artifact.factor_automaton(lang)
+                artifact.factor_automaton(lang, reverse=True)
+            return artifact
+
+        _, load_s = timed(load_artifact)
+        print(f"  {sum(len(w) for w in words_by_lang.values())} words, "
+              f"artifact {path.stat().st_size / 1e6:.1f} MB")
+        print(f"  build from rows: {build_s:.2f}s | mmap artifact: {load_s * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Dictionary Artifact Test Suite")
+    print("=" * 50)
+
+    test_roundtrip()
+    test_corrupt_artifact_rejected()
+    test_version_mismatch_rejected()
+    test_word_table_by_length_ranges()
+
+    if "--bench" in sys.argv:
+        benchmark_time_to_ready()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,147 @@
+"""
+Test that dictionary builds run off the event loop (worker process)
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.words import build_language, build_language_offloaded
+
+WORDS = {"CARING": (6, 8), "CARE": (4, 4), "SCARE": (5, 5), "RACING": (6, 6), "TO": (2, 2)}
+
+
+def _health_app():
+    """FastAPI app with main.py's /health route (main itself pulls in auth/DB modules)."""
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "ok"}
+
+    return app
+
+
+async def _get_health(app) -> float:
+    """One GET /health through the ASGI app; returns the latency in seconds."""
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+             'scheme': 'http', 'path': '/health', 'raw_path': b'/health', 'root_path': '',
+             'query_string': b'', 'headers': [], 'client': ('test', 0), 'server': ('test', 80)}
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - start
+    assert messages[0]['status'] == 200
+    return elapsed
+
+
+async def _health_latencies_during(app, build, interval: float = 0.01):
+    """Poll /health every interval while build runs; returns (result, latencies incl. scheduling delay)."""
+    latencies = []
+    task = asyncio.create_task(build)
+    while not task.done():
+        scheduled = time.perf_counter()
+        await asyncio.sleep(interval)
+        # Time from when the probe was due until its response, like a client would see it
+        delay = time.perf_counter() - scheduled - interval
+        latencies.append(delay + await _get_health(app))
+    return await task, latencies
+
+
+def test_offloaded_build_matches():
+    """The structures mmap'd back from the worker answer like an in-process build."""
+    print("Testing worker-process build...")
+    saved = words.DICTIONARY_BUILD_MODE
+    try:
+        words.DICTIONARY_BUILD_MODE = 'process'
+        parts = asyncio.run(build_language_offloaded('en', WORDS))
+    finally:
+        words.DICTIONARY_BUILD_MODE = saved
+    local = build_language('en', WORDS)
+
+    assert dict(parts['lexicon']) == dict(local['lexicon']) == WORDS
+    for probe in ["CAR", "ACIN", "ARE", "CARINGS", "X", "OT"]:
+        assert parts['factors'].is_factor(probe) == local['factors'].is_factor(probe), probe
+        assert parts['reverse_factors'].is_factor(probe) == local['reverse_factors'].is_factor(probe), probe
+        assert parts['trie'].has_substring(probe) == local['trie'].has_substring(probe), probe
+    assert isinstance(parts['lexicon'].blob, memoryview), "handed back through the mmap'd artifact"
+    print("✓ Worker-process build passed!")
+
+
+def test_health_stays_responsive_during_build(word_count: int = 60000, bound: float = 0.1):
+    print("\nTesting /health latency during a dictionary build...")
+    from bench_words import load_words
+
+    app = _health_app()
+    table = dict(list(load_words('en').items())[:word_count])
+    saved = words.DICTIONARY_BUILD_MODE
+    try:
+        words.DICTIONARY_BUILD_MODE = 'process'
+        parts, latencies = asyncio.run(_health_latencies_during(app, build_language_offloaded('en', table)))
+    finally:
+        words.DICTIONARY_BUILD_MODE = saved
+
+    assert len(parts['lexicon']) == len(table)
+    assert len(latencies) > 10, "the loop kept polling during the build"
+    worst = max(latencies)
+    print(f"  {len(table)} words, {len(latencies)} probes, worst /health latency {worst * 1000:.1f} ms")
+    assert worst < bound, f"/health stalled for {worst * 1000:.0f} ms during the build"
+    print("✓ /health stayed responsive!")
+
+
+def benchmark_health_latency(word_count: int = None):
+    """/health latency percentiles while a full language builds: blocking, thread and process."""
+    from bench_words import load_words
+
+    app = _health_app()
+    print("\nBenchmarking /health latency during a dictionary build...")
+    table = load_words('en')
+    if word_count:
+        table = dict(list(table.items())[:word_count])
+
+    async def blocking():
+        return build_language('en', table)
+
+    saved = words.DICTIONARY_BUILD_MODE
+    try:
+        for mode in ('blocking', 'thread', 'process'):
+            words.DICTIONARY_BUILD_MODE = mode
+            build = blocking() if mode == 'blocking' else build_language_offloaded('en', table)
+            start = time.perf_counter()
+            _, latencies = asyncio.run(_health_latencies_during(app, build))
+            total = time.perf_counter() - start
+            latencies.sort()
+            pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+            print(f"  {mode:8s}: build {total:.1f}s, {len(latencies)} probes | "
+                  f"p50 {pick(0.5):.1f} ms, p99 {pick(0.99):.1f} ms, max {latencies[-1] * 1000:.0f} ms")
+    finally:
+        words.DICTIONARY_BUILD_MODE = saved
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Dictionary Build Offload Test Suite")
+    print("=" * 50)
+
+    test_offloaded_build_matches()
+    test_health_stays_responsive_during_build()
+
+    if "--bench" in sys.argv:
+        benchmark_health_latency()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
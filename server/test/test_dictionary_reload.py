@@ -0,0 +1,200 @@
+"""
+Test versioned dictionary snapshots and the hot reload
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.game import GameRoom, Player
+from core.words import build_snapshot, current_snapshot, get_word_in_cache, reload_dictionary
+
+OLD = {'en': {"CAT": (3, 3), "CATS": (4, 4), "AT": (2, 2)}}
+NEW = {'en': {"DOG": (3, 3), "DOGS": (4, 4), "AT": (2, 2)}}
+
+_GLOBALS = ('word_cache', 'words_by_length', 'word_samplers', 'word_trie',
+            'word_factors', 'word_factors_reverse', 'dictionary_version')
+
+
+def _save():
+    return {name: getattr(words, name) for name in _GLOBALS}
+
+
+def _restore(saved):
+    for name, value in saved.items():
+        setattr(words, name, value)
+
+
+def _room(code):
+    room = GameRoom(code)
+    room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+    room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    return room, player
+
+
+def test_rooms_keep_pinned_version():
+    """A room validates against the snapshot it started with; new rooms get the new one."""
+    print("Testing pinned dictionary versions...")
+    saved = _save()
+
+    async def place(room, word):
+        room.players["p1"].hand = list(word) + [None] * (10 - len(word))
+        for x, letter in enumerate(word):
+            ok, _ = await room.handle_place_tile(x, 0, letter, "p1")
+            if not ok:
+                break  # a rejected tile leaves nothing to attach to
+        for task in room.group_timers.values():
+            task.cancel()
+        return all((x, 0) in room.board for x in range(len(word)))
+
+    def started_rooms(count):
+        rooms = [_room(f"ROOM{i}")[0] for i in range(count)]
+        for room in rooms:
+            room.start_match()
+            room.board.clear()
+        return rooms
+
+    async def scenario():
+        words._install_snapshot(build_snapshot(OLD, 1))
+        old_rooms = started_rooms(2)
+        words._install_snapshot(build_snapshot(NEW, 2))
+        new_rooms = started_rooms(2)
+        assert [r.dictionary.version for r in old_rooms + new_rooms] == [1, 1, 2, 2]
+
+        assert await place(old_rooms[0], "CAT"), "old room still accepts CAT"
+        assert not await place(old_rooms[1], "DOG"), "DOG is not in version 1"
+        assert await place(new_rooms[0], "DOG"), "new room accepts DOG"
+        assert not await place(new_rooms[1], "CAT"), "CAT is gone in version 2"
+
+        # Unpinned lookups always see the current version
+        assert get_word_in_cache("dog")["is_valid"] and not get_word_in_cache("cat")["is_valid"]
+        assert get_word_in_cache("cat", snapshot=old_rooms[0].dictionary)["is_valid"]
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        _restore(saved)
+    print("✓ Pinned dictionary version tests passed!")
+
+
+def test_reload_swaps_atomically():
+    """reload_dictionary builds off the loop and installs every structure together."""
+    print("\nTesting reload_dictionary...")
+    saved = _save()
+    saved_fetch, saved_fingerprint = words._fetch_rows_by_lang, words.get_dictionary_fingerprint
+    saved_path = words.DICTIONARY_ARTIFACT_PATH
+
+    async def fetch():
+        return NEW
+
+    async def fingerprint():
+        return None
+
+    async def scenario():
+        words._install_snapshot(build_snapshot(OLD, 7))
+        pinned = current_snapshot()
+
+        # The loop keeps serving while the build runs in a thread
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        report = await reload_dictionary()
+        task.cancel()
+
+        assert report['previous_version'] == 7 and report['version'] == 8
+        assert report['source'] == 'database' and report['words'] == {'en': 3}
+        assert report['memory']['peak_rss'] > 0
+        assert ticks > 0
+
+        current = current_snapshot()
+        assert current.version == words.dictionary_version == 8
+        assert "DOG" in words.word_cache['en'] and "CAT" not in words.word_cache['en']
+        assert words.word_factors['en'].is_factor("OGS") and not words.word_factors['en'].is_factor("CA")
+        assert sorted(words.words_by_length['en']) == [2, 3, 4]
+        assert "CAT" in pinned.word_cache['en'], "pinned snapshot is untouched"
+
+    words._fetch_rows_by_lang = fetch
+    words.get_dictionary_fingerprint = fingerprint
+    words.DICTIONARY_ARTIFACT_PATH = Path(__file__).parent / "missing-dictionary.bin"
+    try:
+        asyncio.run(scenario())
+    finally:
+        words._fetch_rows_by_lang, words.get_dictionary_fingerprint = saved_fetch, saved_fingerprint
+        words.DICTIONARY_ARTIFACT_PATH = saved_path
+        _restore(saved)
+    print("✓ reload_dictionary tests passed!")
+
+
+def benchmark_reload_memory():
+    """RSS before, at peak and after swapping in a full rebuild while a room pins the old version."""
+    from bench_words import load_words
+
+    print("\nBenchmarking dictionary reload memory...")
+    saved = _save()
+    saved_fetch, saved_fingerprint = words._fetch_rows_by_lang, words.get_dictionary_fingerprint
+    saved_path = words.DICTIONARY_ARTIFACT_PATH
+    rows = {lang: load_words(lang) for lang in ("en", "ko")}
+
+    async def fetch():
+        return rows
+
+    async def fingerprint():
+        return None
+
+    async def scenario():
+        words._install_snapshot(build_snapshot(rows, 1))
+        room, _ = _room("BENCH")
+        room.start_match()
+        for pinned in (True, False):
+            if not pinned:
+                room.dictionary = None
+            report, seconds = await timed_async(reload_dictionary)
+            memory = report['memory']
+            print(f"  v{report['previous_version']} -> v{report['version']} "
+                  f"({'old version pinned' if pinned else 'no pins'}) in {seconds:.1f}s | "
+                  f"RSS before {memory['rss_before'] / 1e6:.0f} MB, peak {memory['peak_rss'] / 1e6:.0f} MB, "
+                  f"after {memory['rss_after'] / 1e6:.0f} MB")
+
+    async def timed_async(fn):
+        import time
+        start = time.perf_counter()
+        result = await fn()
+        return result, time.perf_counter() - start
+
+    words._fetch_rows_by_lang = fetch
+    words.get_dictionary_fingerprint = fingerprint
+    words.DICTIONARY_ARTIFACT_PATH = Path(__file__).parent / "missing-dictionary.bin"
+    try:
+        asyncio.run(scenario())
+    finally:
+        words._fetch_rows_by_lang, words.get_dictionary_fingerprint = saved_fetch, saved_fingerprint
+        words.DICTIONARY_ARTIFACT_PATH = saved_path
+        _restore(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Dictionary Reload Test Suite")
+    print("=" * 50)
+
+    test_rooms_keep_pinned_version()
+    test_reload_swaps_atomically()
+
+    if "--bench" in sys.argv:
+        benchmark_reload_memory()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
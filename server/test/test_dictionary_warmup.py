@@ -0,0 +1,209 @@
+"""
+Test lazy, per-language dictionary warm-up and readiness reporting
+"""
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.game import GameRoom, Player
+from core.words import dictionary_status, start_dictionary_warmup, wait_for_language
+
+ROWS = {
+    'en': {"CAT": (3, 3), "CATS": (4, 4), "AT": (2, 2)},
+    'ko': {"ㅅㅏㄱㅘ": (4, 4), "ㄱㅏ": (2, 2)},
+}
+
+_GLOBALS = ('word_cache', 'words_by_length', 'word_samplers', 'word_trie', 'word_factors',
+            'word_factors_reverse', 'dictionary_version', 'language_states', '_warmup_task',
+            '_languages_known', '_language_events', '_warmup_queue', '_fetch_rows_by_lang', 'get_dictionary_fingerprint',
+            'build_language', 'DICTIONARY_ARTIFACT_PATH', 'DICTIONARY_BUILD_MODE')
+
+
+def _patch(gate: threading.Event, fail=()):
+    """Serve ROWS from a fake DB; the Korean build (in a thread) blocks until gate is set."""
+    saved = {name: getattr(words, name) for name in _GLOBALS}
+    saved['language_states'] = dict(words.language_states)
+    saved['_language_events'] = dict(words._language_events)
+    real_build = words.build_language
+
+    async def fetch(lang=None):
+        return {l: rows for l, rows in ROWS.items() if lang in (None, l)}
+
+    async def fingerprint():
+        return {lang: [len(rows), 0] for lang, rows in ROWS.items()}
+
+    def build(lang, lang_words):
+        if lang in fail:
+            raise RuntimeError(f"{lang} build failed")
+        if lang == 'ko':
+            gate.wait(5)
+        return real_build(lang, lang_words)
+
+    words._fetch_rows_by_lang = fetch
+    words.get_dictionary_fingerprint = fingerprint
+    words.build_language = build
+    words.DICTIONARY_BUILD_MODE = 'thread'
+    words.DICTIONARY_ARTIFACT_PATH = Path(__file__).parent / "missing-dictionary.bin"
+    words.word_cache, words.words_by_length, words.word_samplers = {}, {}, {}
+    words.word_trie, words.word_factors, words.word_factors_reverse = {}, {}, {}
+    return saved
+
+
+def _restore(saved):
+    for name, value in saved.items():
+        if name in ('language_states', '_language_events'):
+            getattr(words, name).clear()
+            getattr(words, name).update(value)
+        else:
+            setattr(words, name, value)
+
+
+def test_languages_become_ready_independently():
+    print("Testing per-language warm-up...")
+    gate = threading.Event()
+    saved = _patch(gate)
+
+    async def scenario():
+        task = start_dictionary_warmup()
+        assert not dictionary_status()['ready'], "nothing is ready before warm-up runs"
+
+        # English is served while Korean is still building
+        assert await asyncio.wait_for(wait_for_language('en'), 5)
+        status = dictionary_status()
+        assert status['languages']['en'] == 'ready' and status['languages']['ko'] in ('pending', 'loading')
+        assert not status['ready']
+        assert "CAT" in words.word_cache['en'] and 'ko' not in words.word_cache
+        assert words.word_factors['en'].is_factor("ATS")
+
+        ko_room = GameRoom("KO")
+        ko_room.settings["lang"] = "ko"
+        waiting = asyncio.create_task(ko_room.wait_for_dictionary())
+        await asyncio.sleep(0.05)
+        assert not waiting.done(), "a Korean room waits while ko is loading"
+
+        gate.set()
+        await asyncio.wait_for(waiting, 5)
+        await task
+        status = dictionary_status()
+        assert status['ready'] and status['languages'] == {'en': 'ready', 'ko': 'ready'}
+        assert words.word_cache['ko'].get("ㄱㅏ") == (2, 2)
+
+        # Unknown languages do not block
+        assert await asyncio.wait_for(wait_for_language('fr'), 1) is False
+
+        # Rooms started after warm-up pin a snapshot with both languages
+        ko_room.add_player(Player("p1", "TestPlayer", MagicMock()))
+        ko_room.start_match()
+        assert set(ko_room.dictionary.word_cache) == {'en', 'ko'}
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        gate.set()
+        _restore(saved)
+    print("✓ Per-language warm-up passed!")
+
+
+def test_waited_language_loads_first():
+    print("\nTesting warm-up priority...")
+    gate = threading.Event()
+    gate.set()
+    saved = _patch(gate)
+
+    async def scenario():
+        task = start_dictionary_warmup()
+
+        # A room waiting for ko moves it ahead of en, which was queued first
+        assert await wait_for_language('ko')
+        assert words.language_states['en'] != 'ready'
+        await task
+        assert dictionary_status()['ready']
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        _restore(saved)
+    print("✓ Waited-for language loaded first!")
+
+
+def test_failed_language_is_reported():
+    print("\nTesting failed warm-up...")
+    gate = threading.Event()
+    gate.set()
+    saved = _patch(gate, fail=('ko',))
+
+    async def scenario():
+        await start_dictionary_warmup()
+        assert await wait_for_language('en')
+        assert await wait_for_language('ko') is False
+        status = dictionary_status()
+        assert status['languages'] == {'en': 'ready', 'ko': 'failed'} and not status['ready']
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        _restore(saved)
+    print("✓ Failed warm-up reported!")
+
+
+def benchmark_time_to_first_language():
+    """Boot to first servable language vs. the eager load of every language."""
+    import time
+    from bench_words import load_words
+
+    print("\nBenchmarking warm-up vs eager load...")
+    gate = threading.Event()
+    gate.set()
+    saved = _patch(gate)
+    ROWS.clear()
+    ROWS.update({lang: load_words(lang) for lang in ("en", "ko")})
+
+    async def warm():
+        start = time.perf_counter()
+        task = start_dictionary_warmup()
+        boot = time.perf_counter() - start
+        ready = {}
+
+        async def watch(lang):
+            await wait_for_language(lang)
+            ready[lang] = time.perf_counter() - start
+
+        await asyncio.gather(task, *(watch(lang) for lang in ROWS))
+        return boot, ready
+
+    async def eager():
+        start = time.perf_counter()
+        await words.load_words_to_memory()
+        return time.perf_counter() - start
+
+    try:
+        eager_s = asyncio.run(eager())
+        boot, ready = asyncio.run(warm())
+        print(f"  eager load_words_to_memory: lifespan blocked {eager_s:.1f}s")
+        print(f"  warm-up: lifespan blocked {boot * 1000:.2f} ms | "
+              + ", ".join(f"{lang} ready at {t:.1f}s" for lang, t in sorted(ready.items(), key=lambda i: i[1])))
+    finally:
+        _restore(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Dictionary Warm-up Test Suite")
+    print("=" * 50)
+
+    test_languages_become_ready_independently()
+    test_waited_language_loads_first()
+    test_failed_language_is_reported()
+
+    if "--bench" in sys.argv:
+        benchmark_time_to_first_language()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -7,7 +7,7 @@ from pathlib import Path
 # Add server directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.double_array_trie import DoubleArrayTrie
+from core.double_array_trie import DoubleArrayTrie, CompactDoubleArrayTrie, BidirectionalTrie
 
 
 def test_empty_trie():
@@ -138,6 +138,154 @@ def test_memory_and_size():
     print("✓ Memory tests passed!")
 
 
+def test_compact_trie_matches_dict_trie():
+    """Test that the double-array engine answers exactly like the dict engine."""
+    print("\nTesting CompactDoubleArrayTrie parity...")
+    words = ["apple", "app", "application", "banana", "band", "bandana",
+             "ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅎㅏㄴㄱㅡㄹ", "a", "zzz"]
+    dict_trie = DoubleArrayTrie()
+    dict_trie.build(words)
+    compact = CompactDoubleArrayTrie()
+    compact.build(words)
+    
+    queries = words + ["", "ap", "appl", "apples", "ban", "bandanas", "x",
+                       "ㅅ", "ㅅㅏ", "ㅅㅏㅇ", "ㅎㅏㄴ", "zz", "zzzz", "A"]
+    for q in queries:
+        assert compact.search(q) == dict_trie.search(q), f"search mismatch for '{q}'"
+        assert compact.has_prefix(q) == dict_trie.has_prefix(q), f"has_prefix mismatch for '{q}'"
+    
+    assert len(compact) == len(words)
+    assert compact.memory_usage() > 0
+    print("✓ CompactDoubleArrayTrie parity tests passed!")
+
+
+def test_compact_trie_empty():
+    """Test that an empty double-array behaves like an empty dict trie."""
+    print("\nTesting empty CompactDoubleArrayTrie...")
+    compact = CompactDoubleArrayTrie()
+    assert compact.search("a") == False, "Unbuilt trie finds nothing"
+    assert compact.has_prefix("a") == True, "Unbuilt trie should be permissive"
+    
+    compact.build([])
+    assert compact.search("test") == False
+    assert compact.has_prefix("a") == True, "Empty trie should be permissive"
+    
+    # The empty string walks to the root, which exists even with no words
+    for trie in (compact, CompactDoubleArrayTrie.from_buffers(*compact.to_buffers())):
+        assert trie.search("") == False
+        assert trie.has_prefix("") == True
+        assert trie.count_with_prefix("") == 0 and trie.count_with_prefix("a") == 0
+        assert trie.children(trie.root_node()) == [] and not trie.is_terminal(trie.root_node())
+    
+    bidirectional = BidirectionalTrie(engine='double_array')
+    bidirectional.build([])
+    assert bidirectional.count_with_prefix("") == 0 and bidirectional.count_with_suffix("") == 0
+    assert bidirectional.has_substring("")
+    print("✓ Empty CompactDoubleArrayTrie tests passed!")
+
+
+def test_bidirectional_engine_selection():
+    """Test that BidirectionalTrie works with every engine."""
+    print("\nTesting BidirectionalTrie engine selection...")
+    for engine in ("dict", "double_array", "dawg"):
+        btrie = BidirectionalTrie(engine=engine)
+        btrie.build(["caring", "playing", "hello"])
+        assert btrie.search("hello") == True
+        assert btrie.has_prefix("car") == True
+        assert btrie.has_suffix("ing") == True
+        assert btrie.has_suffix("xyz") == False
+    
+    try:
+        BidirectionalTrie(engine="nope")
+        assert False, "Unknown engine should raise"
+    except ValueError:
+        pass
+    print("✓ Engine selection tests passed!")
+
+
+def test_completion_counts():
+    """Test count_with_prefix/count_with_suffix against a brute-force count on every engine."""
+    print("\nTesting completion counts...")
+    words = ["care", "cared", "cares", "caring", "car", "scare", "playing", "ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ"]
+    probes = ["", "c", "car", "care", "cares", "caring", "x", "ing", "re", "s", "ㅅㅏ", "ㅏㅁ", "d"]
+    for engine in ("dict", "double_array", "dawg"):
+        btrie = BidirectionalTrie(engine=engine)
+        btrie.build(words + ["care"])  # a duplicate is counted once
+        for p in probes:
+            assert btrie.count_with_prefix(p) == sum(w.startswith(p) for w in words), (engine, p)
+            assert btrie.count_with_suffix(p) == sum(w.endswith(p) for w in words), (engine, p)
+        
+        empty = BidirectionalTrie(engine=engine)
+        assert empty.count_with_prefix("a") == 0, "Unbuilt trie counts nothing"
+        empty.build([])
+        assert empty.count_with_prefix("") == 0 and empty.count_with_suffix("a") == 0
+    print("✓ Completion count tests passed!")
+
+
+def benchmark_completion_counts():
+    """count_with_prefix (stored counts) vs counting by walking the subtree."""
+    import random
+    from bench_words import load_words, timed
+    
+    def subtree_count(trie, prefix):
+        node = trie.root
+        for char in prefix:
+            if char not in node:
+                return 0
+            node = node[char]
+        total, stack = 0, [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key == trie.END_MARKER:
+                    total += 1
+                elif key != trie.COUNT_MARKER:
+                    stack.append(child)
+        return total
+    
+    print("\nBenchmarking completion counts...")
+    for lang in ("en", "ko"):
+        words = list(load_words(lang))
+        rng = random.Random(0)
+        prefixes = [w[:rng.randint(1, 3)] for w in rng.sample(words, 2000)]
+        for engine in ("dict", "double_array", "dawg"):
+            btrie = BidirectionalTrie(engine=engine)
+            btrie.build(words)
+            _, count_s = timed(lambda: [btrie.count_with_prefix(p) for p in prefixes])
+            line = f"  {lang:<3} {engine:<13} count_with_prefix {count_s / len(prefixes) * 1e6:6.2f} us"
+            if engine == "dict":
+                _, walk_s = timed(lambda: [subtree_count(btrie.forward_trie, p) for p in prefixes])
+                line += f" | subtree walk {walk_s / len(prefixes) * 1e6:9.1f} us"
+            print(line)
+
+
+def benchmark_trie_engines():
+    """Compare build time, memory and lookup throughput of the trie engines."""
+    import random
+    from bench_words import load_words, timed, traced
+    
+    print("\nBenchmarking trie engines (forward + reverse, as BidirectionalTrie)...")
+    for lang in ("en", "ko"):
+        words = list(load_words(lang))
+        rng = random.Random(0)
+        queries = rng.sample(words, 20000)
+        queries += [w[:-1] + w[0] for w in rng.sample(words, 20000)]
+        
+        def build(engine):
+            btrie = BidirectionalTrie(engine=engine)
+            btrie.build(words)
+            return btrie
+        
+        for engine in ("dict", "double_array"):
+            btrie, build_s = timed(build, engine)
+            _, retained, peak = traced(build, engine)
+            
+            _, lookup_s = timed(lambda: [btrie.has_substring(q) for q in queries])
+            print(f"  {lang:<3} {engine:<13} {len(words):>7} words | "
+                  f"build {build_s:6.2f}s | retained {retained / 1e6:7.1f} MB | "
+                  f"peak {peak / 1e6:7.1f} MB | {len(queries) / lookup_s / 1e3:6.0f}k lookups/s")
+
+
 if __name__ == "__main__":
     print("=" * 50)
     print("Double Array Trie Test Suite")
@@ -150,6 +298,10 @@ if __name__ == "__main__":
     test_korean_jamo()
     test_case_sensitivity()
     test_memory_and_size()
+    test_compact_trie_matches_dict_trie()
+    test_compact_trie_empty()
+    test_bidirectional_engine_selection()
+    test_completion_counts()
     
     # Test BidirectionalTrie
     print("\n" + "=" * 50)
@@ -198,6 +350,10 @@ if __name__ == "__main__":
     
     print("✓ Korean BidirectionalTrie tests passed!")
 
+    if "--bench" in sys.argv:
+        benchmark_trie_engines()
+        benchmark_completion_counts()
+
     print("\n" + "=" * 50)
     print("✨ All tests passed!")
     print("=" * 50)
@@ -0,0 +1,145 @@
+"""
+Test Factor Automaton (substring validation)
+"""
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.factor_automaton import FactorAutomaton
+from core.double_array_trie import BidirectionalTrie
+
+
+def test_all_factors_accepted():
+    """Every substring of every word must be accepted."""
+    print("Testing factor acceptance...")
+    words = ["caring", "playing", "hello", "world", "banana"]
+    fa = FactorAutomaton()
+    fa.build(words)
+
+    for word in words:
+        for i in range(len(word)):
+            for j in range(i + 1, len(word) + 1):
+                assert fa.is_factor(word[i:j]), f"'{word[i:j]}' is a factor of '{word}'"
+    print("✓ Factor acceptance passed!")
+
+
+def test_middle_substrings():
+    """Middle substrings are valid even though they are neither prefix nor suffix."""
+    print("\nTesting middle substrings...")
+    words = ["caring", "playing", "hello"]
+    fa = FactorAutomaton()
+    fa.build(words)
+    btrie = BidirectionalTrie()
+    btrie.build(words)
+
+    for middle in ["ari", "lay", "ell", "yin"]:
+        assert btrie.has_substring(middle) == False, f"'{middle}' is neither prefix nor suffix"
+        assert fa.is_factor(middle) == True, f"'{middle}' is a middle substring"
+
+    for bad in ["xyz", "ingp", "helo", "gc", "ohel"]:
+        assert fa.is_factor(bad) == False, f"'{bad}' is not in any word"
+    print("✓ Middle substring tests passed!")
+
+
+def test_korean_jamo_factors():
+    """Korean jamo runs inside words are accepted."""
+    print("\nTesting Korean jamo factors...")
+    fa = FactorAutomaton()
+    fa.build(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅎㅏㄴㄱㅡㄹ"])
+
+    assert fa.is_factor("ㄴㄱㅡ") == True, "middle of 한글"
+    assert fa.is_factor("ㅏㄹㅏ") == True, "middle of 사람"
+    assert fa.is_factor("ㄱㅘ") == True, "suffix of 사과"
+    assert fa.is_factor("ㄱㅏ") == False
+    assert fa.is_factor("ㅘㅅ") == False
+    print("✓ Korean jamo factor tests passed!")
+
+
+def test_step_and_walk():
+    """step() and walk() agree, and DEAD is absorbing."""
+    print("\nTesting step/walk...")
+    fa = FactorAutomaton()
+    fa.build(["banana", "bandana"])
+
+    state = fa.ROOT
+    for char in "anda":
+        state = fa.step(state, char)
+        assert state != fa.DEAD
+    assert state == fa.walk("anda")
+    assert fa.step(state, "x") == fa.DEAD
+    assert fa.step(fa.DEAD, "a") == fa.DEAD
+    assert fa.walk("na", fa.walk("ba")) == fa.walk("bana")
+    print("✓ step/walk tests passed!")
+
+
+def test_empty_automaton():
+    """Unbuilt or empty automata are permissive, like the tries."""
+    print("\nTesting empty automaton...")
+    fa = FactorAutomaton()
+    assert fa.is_factor("abc") == True
+    fa.build([])
+    assert fa.is_factor("abc") == True
+    assert len(fa) == 0
+    print("✓ Empty automaton tests passed!")
+
+
+def benchmark_factor_automaton():
+    """Compare memory and query speed against the two tries it replaces."""
+    import random
+    from bench_words import load_words, timed, traced
+
+    print("\nBenchmarking FactorAutomaton vs BidirectionalTrie.has_substring...")
+    for lang in ("en", "ko"):
+        words = list(load_words(lang))
+        rng = random.Random(0)
+        queries = []
+        for word in rng.sample(words, 40000):
+            i = rng.randrange(len(word) - 1)
+            queries.append(word[i:i + rng.randint(2, 4)])
+
+        def build_factors():
+            fa = FactorAutomaton()
+            fa.build(words)
+            return fa
+
+        def build_tries():
+            btrie = BidirectionalTrie(engine="double_array")
+            btrie.build(words)
+            return btrie
+
+        fa, fa_build = timed(build_factors)
+        _, _, fa_peak = traced(build_factors)
+        btrie, trie_build = timed(build_tries)
+
+        _, fa_s = timed(lambda: [fa.is_factor(q) for q in queries])
+        _, trie_s = timed(lambda: [btrie.has_substring(q) for q in queries])
+        accepted_fa = sum(fa.is_factor(q) for q in queries)
+        accepted_trie = sum(btrie.has_substring(q) for q in queries)
+
+        print(f"  {lang}: automaton {fa.memory_usage() / 1e6:.1f} MB "
+              f"(build {fa_build:.2f}s, peak {fa_peak / 1e6:.1f} MB) vs "
+              f"two packed tries {btrie.memory_usage() / 1e6:.1f} MB (build {trie_build:.2f}s)")
+        print(f"      queries/s: automaton {len(queries) / fa_s / 1e3:.0f}k, "
+              f"tries {len(queries) / trie_s / 1e3:.0f}k | "
+              f"accepted {accepted_fa}/{len(queries)} vs {accepted_trie}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Factor Automaton Test Suite")
+    print("=" * 50)
+
+    test_all_factors_accepted()
+    test_middle_substrings()
+    test_korean_jamo_factors()
+    test_step_and_walk()
+    test_empty_automaton()
+
+    if "--bench" in sys.argv:
+        benchmark_factor_automaton()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
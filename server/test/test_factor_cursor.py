@@ -0,0 +1,174 @@
+"""
+Test incremental substring validation (FactorCursor) and per-group cursors in GameRoom
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.words import FactorCursor, has_valid_prefix
+from core.game import GameRoom, Player
+from word_fixtures import install_words, restore_words
+
+WORDS = ["CARING", "CARE", "SCARE", "RACING", "TO", "AT"]
+
+
+def test_cursor_matches_has_valid_prefix():
+    """Growing a cursor at either end answers exactly like has_valid_prefix on the run."""
+    print("Testing FactorCursor parity...")
+    saved = install_words(WORDS)
+    try:
+        # (start, characters with side): every intermediate run is checked
+        plans = [
+            ("R", [("a", "I"), ("a", "N"), ("p", "A"), ("p", "C"), ("a", "G"), ("p", "X")]),
+            ("A", [("p", "C"), ("p", "S"), ("a", "R"), ("a", "E"), ("a", "S")]),
+            ("T", [("a", "O"), ("p", "A"), ("a", "T")]),
+        ]
+        for start, steps in plans:
+            cursor = FactorCursor(start)
+            assert cursor.is_valid == has_valid_prefix(start)
+            for side, char in steps:
+                cursor = cursor.appended(char) if side == "a" else cursor.prepended(char)
+                expected = has_valid_prefix(cursor.text)
+                assert cursor.is_valid == expected, f"'{cursor.text}': {cursor.is_valid} != {expected}"
+
+        assert FactorCursor("aci").is_valid, "lowercase input is normalised like has_valid_prefix"
+        assert not FactorCursor("RAC").prepended("X").appended("I").is_valid, "DEAD stays DEAD"
+    finally:
+        restore_words(saved)
+    print("✓ FactorCursor parity passed!")
+
+
+def test_cursor_without_automaton():
+    """Languages without automata fall back to has_valid_prefix (permissive)."""
+    print("\nTesting FactorCursor fallback...")
+    cursor = FactorCursor("ㄱ", lang="xx").appended("ㅏ").prepended("ㅎ")
+    assert cursor.text == "ㅎㄱㅏ"
+    assert cursor.is_valid == has_valid_prefix("ㅎㄱㅏ", "xx") == True
+    print("✓ FactorCursor fallback passed!")
+
+
+def _room():
+    room = GameRoom("TEST_CURSOR")
+    room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+    room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    player.hand = list("ARCINGXSE")
+    return room, player
+
+
+def test_room_group_cursors():
+    """Runs built tile by tile keep one cursor per group; merges and removals invalidate it."""
+    print("\nTesting GameRoom group cursors...")
+    saved = install_words(WORDS)
+
+    async def scenario():
+        room, player = _room()
+        try:
+            # "ACIN" grown right then left: R A C I N -> stays one h group
+            for x, letter in [(11, "A"), (12, "C"), (13, "I"), (14, "N"), (10, "R")]:
+                ok, err = await room.handle_place_tile(x, 10, letter, "p1")
+                assert ok, err
+            gid = room.pending_tiles[0]['h_group_id']
+            entry = room.group_cursors[f"h:{gid}"]
+            assert entry['cursor'].text == "RACIN"
+            assert (entry['start'], entry['end']) == ((10, 10), (14, 10))
+            assert entry['cursor'].is_valid
+
+            # Invalid extension explodes and leaves the cached cursor untouched
+            ok, _ = await room.handle_place_tile(15, 10, "X", "p1")
+            assert ok and not any(t['x'] == 15 for t in room.pending_tiles)
+            assert room.group_cursors[f"h:{gid}"] is entry
+
+            # Completing the word finalizes the group and drops its cursor
+            ok, err = await room.handle_place_tile(15, 10, "G", "p1")
+            assert ok, err
+            assert (15, 10) in room.board
+            assert f"h:{gid}" not in room.group_cursors
+            assert room.group_cursors == {}, room.group_cursors
+        finally:
+            for task in room.group_timers.values():
+                task.cancel()
+
+        # Bridging two pending runs merges their groups: one cursor survives
+        room, player = _room()
+        try:
+            for x, letter in [(0, "C"), (1, "A")]:
+                ok, err = await room.handle_place_tile(x, 0, letter, "p1")
+                assert ok, err
+            room.pending_tiles.append({'x': 3, 'y': 0, 'letter': 'I', 'player_id': 'p1', 'color': '#fff',
+                                       'h_group_id': 'other', 'v_group_id': 'v-other', 'hand_index': None})
+            room.group_cursors["h:other"] = {'start': (3, 0), 'end': (3, 0), 'cursor': FactorCursor("I")}
+            ok, err = await room.handle_place_tile(2, 0, "R", "p1")
+            assert ok, err
+            h_keys = [k for k in room.group_cursors if k.startswith("h:")]
+            merged = {f"h:{t['h_group_id']}" for t in room.pending_tiles}
+            assert len(h_keys) == 1 and set(h_keys) == merged, (h_keys, merged)
+            assert room.group_cursors[h_keys[0]]['cursor'].text == "CARI"
+        finally:
+            for task in room.group_timers.values():
+                task.cancel()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ GameRoom group cursor tests passed!")
+
+
+def benchmark_incremental_validation():
+    """Per-tile validation cost: full walk of the run vs. one cursor step."""
+    import random
+    from bench_words import load_words, timed
+
+    print("\nBenchmarking incremental substring validation...")
+    for lang in ("en", "ko"):
+        word_list = list(load_words(lang))
+        saved = install_words(word_list, lang)
+        try:
+            rng = random.Random(0)
+            long_words = [w for w in word_list if len(w) >= 12]
+            runs = rng.sample(long_words, min(2000, len(long_words)))
+            tiles = sum(len(w) for w in runs)
+
+            def full_walks():
+                for word in runs:
+                    for i in range(1, len(word) + 1):
+                        has_valid_prefix(word[:i], lang)
+
+            def cursor_steps():
+                for word in runs:
+                    cursor = FactorCursor(word[0], lang)
+                    cursor.is_valid
+                    for char in word[1:]:
+                        cursor = cursor.appended(char)
+                        cursor.is_valid
+
+            _, walk_s = timed(full_walks)
+            _, step_s = timed(cursor_steps)
+            print(f"  {lang}: {len(runs)} runs (avg {tiles / len(runs):.1f} tiles) | "
+                  f"full walk {walk_s / tiles * 1e6:.2f} us/tile, "
+                  f"cursor {step_s / tiles * 1e6:.2f} us/tile")
+        finally:
+            restore_words(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Factor Cursor Test Suite")
+    print("=" * 50)
+
+    test_cursor_matches_has_valid_prefix()
+    test_cursor_without_automaton()
+    test_room_group_cursors()
+
+    if "--bench" in sys.argv:
+        benchmark_incremental_validation()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,177 @@
+"""
+Test "did you mean" suggestions (Levenshtein automaton over the trie engines)
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.double_array_trie import BidirectionalTrie
+from core.fuzzy_search import LevenshteinSearch, suggest
+from core.words import suggest_words
+from core.game import GameRoom, Player
+from word_fixtures import install_words, restore_words
+
+WORDS = ["CAT", "CART", "CARROT", "SCAT", "AT", "A", "CATS", "CXYAT", "CAXYT", "ACT", "TACT",
+         "CUT", "XX", "COAT", "TO", "CARTOON", "CARTON"]
+QUERIES = ["CAT", "CT", "C", "AT", "CA", "XCATX", "CAXT", "COT", "TAC", "Z", "CATXY", "XYCAT",
+           "CXAT", "CAXYT", "CARTOONS", "CRATON", "QQQQ"]
+
+
+def _levenshtein(a, b):
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def _nearest(word_list, query, max_distance):
+    """Linear scan: every word at the smallest distance in 1..max_distance."""
+    max_distance = min(max_distance, max(1, len(query) // 2))
+    near = {w: _levenshtein(query, w) for w in word_list}
+    near = {w: d for w, d in near.items() if 0 < d <= max_distance}
+    best = min(near.values(), default=None)
+    return sorted((w, d) for w, d in near.items() if d == best)
+
+
+def test_automaton_matches_linear_scan():
+    print("Testing LevenshteinSearch against a linear scan...")
+    for engine in ("dict", "double_array", "dawg"):
+        trie = BidirectionalTrie(engine=engine)
+        trie.build(WORDS)
+        for query in QUERIES:
+            for distance in (0, 1, 2):
+                got = sorted(m for m in LevenshteinSearch(trie.forward_trie, query, distance).iter_matches() if m)
+                expected = sorted((w, _levenshtein(query, w)) for w in WORDS
+                                  if _levenshtein(query, w) <= distance)
+                assert got == expected, (engine, query, distance)
+
+            # Split forward/reverse walks find exactly the nearest words
+            got = sorted(suggest(trie, query, 2, 100, 10.0))
+            assert got == _nearest(WORDS, query, 2), (engine, query, got)
+    print("✓ Levenshtein search matches the linear scan!")
+
+
+def test_suggest_order_and_limits():
+    print("\nTesting suggestion order and limits...")
+    trie = BidirectionalTrie(engine='double_array')
+    trie.build(WORDS)
+    assert suggest(trie, "CAT", 2, 3, 10.0) == [("AT", 1), ("CART", 1), ("CATS", 1)]
+    assert suggest(trie, "CARTOOON", 2, 3, 10.0) == [("CARTOON", 1)]
+    assert suggest(trie, "CRATON", 2, 3, 10.0) == [("CARTON", 2)], "widens to 2 only if 1 finds nothing"
+    assert suggest(trie, "TCA", 2, 3, 10.0) == [], "3-letter words stay at distance 1"
+    assert suggest(trie, "QQQQ", 2, 3, 10.0) == []
+    assert suggest(trie, "CAT", 1, 0, 10.0) == []
+    print("✓ Suggestion order and limits passed!")
+
+
+def test_suggest_words_korean():
+    print("\nTesting Korean suggestions...")
+    saved = words.word_trie
+    trie = BidirectionalTrie(engine='double_array')
+    trie.build(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅅㅏ", "ㅎㅏㄴㄱㅡㄹ"])
+    words.word_trie = {'ko': trie}
+    try:
+        assert suggest_words("사가", 'ko') == ["ㅅㅏㄱㅘ"], "compared on jamo"
+        assert suggest_words("ㅎㅏㄴㄱㅡ", 'ko') == ["ㅎㅏㄴㄱㅡㄹ"]
+        assert suggest_words("CAT", 'en') == [], "language not loaded"
+    finally:
+        words.word_trie = saved
+    print("✓ Korean suggestions passed!")
+
+
+def test_invalid_word_modal():
+    """The penalty MODAL for a rejected word carries the suggestions."""
+    print("\nTesting suggestions in the invalid-word message...")
+    saved = install_words(WORDS)
+    words.word_factors, words.word_factors_reverse = {}, {}
+
+    async def scenario():
+        room = GameRoom("TEST_SUGGEST")
+        sent = []
+        room.broadcast = MagicMock(side_effect=lambda msg: sent.append(msg) or asyncio.sleep(0))
+        room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+        player = Player("p1", "TestPlayer", MagicMock())
+        room.add_player(player)
+        player.score = 10
+        for x, letter in enumerate("CAST"):
+            room.pending_tiles.append({'x': x, 'y': 0, 'letter': letter, 'player_id': 'p1', 'color': '#fff',
+                                       'h_group_id': 'g', 'v_group_id': f'v{x}', 'hand_index': None})
+        await room.finalize_pending_group('g', 'h')
+        modal = [m for m in sent if m["type"] == "MODAL"][-1]
+        assert modal["suggestions"] == ["CART", "CAT"], modal
+        assert modal["message"].endswith("Did you mean: CART, CAT?"), modal["message"]
+        assert player.score == 5
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ Invalid-word suggestions passed!")
+
+
+def benchmark_suggestions():
+    """Suggestion latency (p50/p99) with and without the time budget, vs a linear scan."""
+    import random
+    from bench_words import load_words, timed
+    from core.config import SUGGESTION_MAX_DISTANCE, SUGGESTION_LIMIT, SUGGESTION_TIME_BUDGET
+
+    print("\nBenchmarking suggestions...")
+    for lang in ("en", "ko"):
+        word_list = list(load_words(lang))
+        trie = BidirectionalTrie(engine='double_array')
+        trie.build(word_list)
+        rng = random.Random(0)
+        alphabet = sorted({char for word in word_list for char in word})
+
+        typos = []
+        for word in rng.sample(word_list, 1000):
+            chars = list(word)
+            for _ in range(rng.choice((1, 1, 2))):
+                chars[rng.randrange(len(chars))] = rng.choice(alphabet)
+            typos.append(''.join(chars))
+        junk = [''.join(rng.choices(alphabet, k=rng.randint(2, 10))) for _ in range(1000)]
+
+        scan_sample = typos[:5]
+        _, scan_s = timed(lambda: [_nearest(word_list, q, SUGGESTION_MAX_DISTANCE) for q in scan_sample])
+
+        for name, queries in (("typos", typos), ("junk", junk)):
+            for budget in (10.0, SUGGESTION_TIME_BUDGET):
+                times, complete = [], 0
+                for query in queries:
+                    result, elapsed = timed(suggest, trie, query, SUGGESTION_MAX_DISTANCE, SUGGESTION_LIMIT, budget)
+                    times.append(elapsed)
+                    if budget < 10.0:
+                        complete += result == suggest(trie, query, SUGGESTION_MAX_DISTANCE, SUGGESTION_LIMIT, 10.0)
+                times.sort()
+                label = "unbounded" if budget >= 10.0 else f"budget {budget * 1000:.1f} ms"
+                extra = f" | same result {complete / len(queries):6.1%}" if budget < 10.0 else ""
+                print(f"  {lang} {name:<5} {label:<16} p50 {times[len(times) // 2] * 1000:6.3f} ms | "
+                      f"p99 {times[int(len(times) * 0.99)] * 1000:6.3f} ms | "
+                      f"max {times[-1] * 1000:6.3f} ms{extra}")
+        print(f"  {lang} linear scan over {len(word_list)} words: {scan_s / len(scan_sample) * 1000:.0f} ms/query")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Fuzzy Suggestion Test Suite")
+    print("=" * 50)
+
+    test_automaton_matches_linear_scan()
+    test_suggest_order_and_limits()
+    test_suggest_words_korean()
+    test_invalid_word_modal()
+
+    if "--bench" in sys.argv:
+        benchmark_suggestions()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
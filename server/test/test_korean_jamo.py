@@ -1,17 +1,23 @@
 """
 Test Korean Jamo Utilities
 """
+import asyncio
+import random
 import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
 # Add server directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.game import GameRoom, Player
 from core.korean_utils import (
     decompose_syllable, compose_syllable,
     decompose_word, compose_word,
-    is_valid_syllable_pattern
+    is_valid_syllable_pattern, count_syllables, analyze_jamos, SyllableParse,
+    CHOSUNG_LIST, JUNGSUNG_LIST, JONGSUNG_LIST, HANGUL_BASE, HANGUL_END
 )
+from word_fixtures import install_words, restore_words
 
 def test_syllable_decomposition():
     print("Testing syllable decomposition...")
@@ -115,6 +121,219 @@ def test_roundtrip():
     
     print("✓ Roundtrip test passed!")
 
+def test_syllable_tables():
+    print("\nTesting the syllable tables against the Unicode formula...")
+    
+    for code in range(HANGUL_END - HANGUL_BASE + 1):
+        syllable = chr(HANGUL_BASE + code)
+        expected = (CHOSUNG_LIST[code // 588], JUNGSUNG_LIST[code // 28 % 21], JONGSUNG_LIST[code % 28])
+        assert decompose_syllable(syllable) == expected, syllable
+        assert compose_syllable(*expected) == syllable, expected
+        assert compose_word(decompose_word(syllable)) == syllable, syllable
+    
+    # Invalid jamo and non-Hangul pass through unchanged
+    assert compose_syllable('ㅏ', 'ㅏ', '') == 'ㅏㅏ'
+    assert compose_syllable('ㅅ', 'ㅏ', 'ㄸ') == 'ㅅㅏㄸ'
+    assert decompose_syllable('A') == ('A', '', '')
+    assert decompose_word('A사b ㄱ') == 'Aㅅㅏb ㄱ'
+    assert compose_word('ㅏㅅㄱㅅㅏㄸㅏ') == 'ㅏㅅㄱ사따'
+    print("✓ Syllable tables passed!")
+
+def test_analyze_jamos():
+    print("\nTesting the fused jamo analyser...")
+    
+    assert analyze_jamos('ㅅㅏㄱㅘ') == (True, '사과', 2, (0, 2))
+    assert analyze_jamos('ㅎㅏㄴㄱㅡㄹ') == (True, '한글', 2, (0, 3))
+    assert analyze_jamos('ㅏㅅㅏ') == (False, 'ㅏ사', 1, (0, 1))
+    assert analyze_jamos('') == (False, '', 0, ())
+    
+    # Same answers as the separate functions, on random jamo strings
+    alphabet = CHOSUNG_LIST + JUNGSUNG_LIST + JONGSUNG_LIST[1:] + ['A']
+    rng = random.Random(5)
+    for _ in range(5000):
+        jamos = ''.join(rng.choices(alphabet, k=rng.randint(1, 9)))
+        is_valid, composed, syllables, boundaries = analyze_jamos(jamos)
+        assert is_valid == is_valid_syllable_pattern(jamos), jamos
+        assert composed == compose_word(jamos), jamos
+        assert (syllables if is_valid else 0) == count_syllables(jamos), jamos
+        assert len(boundaries) == len(composed) and boundaries[0] == 0, jamos
+        spans = zip(boundaries, boundaries[1:] + (len(jamos),))
+        assert [compose_word(jamos[a:b]) for a, b in spans] == list(composed), jamos
+    print("✓ Fused jamo analyser passed!")
+
+def test_syllable_parse():
+    """Parses grown at either end answer exactly like analyze_jamos on the whole run."""
+    print("\nTesting incremental syllable parses...")
+    
+    parse = SyllableParse('ㄱㅘ').prepended('ㅏ')
+    assert (parse.composed, parse.is_valid) == ('ㅏ과', False)
+    parse = parse.prepended('ㅅ')
+    assert (parse.composed, parse.is_valid, parse.syllable_count) == ('사과', True, 2)
+    parse = parse.appended('ㄱ')
+    assert (parse.composed, parse.is_valid) == ('사곽', True)
+    parse = parse.appended('ㅣ')
+    assert (parse.text, parse.composed, parse.syllable_count) == ('ㅅㅏㄱㅘㄱㅣ', '사과기', 3), "ㄱ moved to the next syllable"
+    
+    alphabet = CHOSUNG_LIST + JUNGSUNG_LIST + JONGSUNG_LIST[1:] + ['A']
+    rng = random.Random(9)
+    for _ in range(3000):
+        parse = SyllableParse(rng.choice(alphabet))
+        for _ in range(rng.randint(1, 12)):
+            jamo = rng.choice(alphabet)
+            parse = parse.appended(jamo) if rng.random() < 0.5 else parse.prepended(jamo)
+            is_valid, composed, syllables, _ = analyze_jamos(parse.text)
+            assert (parse.is_valid, parse.composed, parse.syllable_count) == (is_valid, composed, syllables), parse.text
+    print("✓ Incremental syllable parses passed!")
+
+def _korean_room(word_list):
+    """A Korean GameRoom validating against word_list; returns (room, player, restore)."""
+    saved = install_words(word_list, lang='ko')
+    
+    def restore():
+        restore_words(saved)
+    
+    room = GameRoom("TEST_KO")
+    room.settings["lang"] = "ko"
+    room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+    room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    return room, player, restore
+
+def test_room_korean_words():
+    print("\nTesting Korean words in a GameRoom...")
+    room, player, restore = _korean_room(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅎㅏㄴㄱㅡㄹ"])
+    
+    async def scenario():
+        try:
+            for x, jamo in enumerate("ㅅㅏㄱㅘ"):
+                player.hand = [jamo] + [None] * 9
+                ok, err = await room.handle_place_tile(x, 0, jamo, "p1")
+                assert ok, err
+            assert all((x, 0) in room.board for x in range(4)), "사과 finalized on the last tile"
+            messages = [call.args[0].get("message") for call in room.broadcast.call_args_list]
+            assert "Word completed: 사과" in messages, messages
+            
+            # 사라 built right to left on an empty board: the group keeps one parse, grown at the front
+            room.board.clear()
+            for x, jamo in reversed(list(enumerate("ㅅㅏㄹㅏ"))):
+                player.hand = [jamo] + [None] * 9
+                ok, err = await room.handle_place_tile(x, 0, jamo, "p1")
+                assert ok, err
+            entry = room.group_cursors[f"h:{room.pending_tiles[0]['h_group_id']}"]
+            assert (entry['parse'].text, entry['parse'].composed) == ("ㅅㅏㄹㅏ", "사라")
+        finally:
+            for task in room.group_timers.values():
+                task.cancel()
+    
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore()
+    print("✓ Korean GameRoom words passed!")
+
+def benchmark_fused_analysis():
+    """Per-run jamo analysis (separate scans vs one) and per-placement CPU in a Korean room."""
+    import logging
+    import time
+    from bench_words import load_words, timed
+    
+    print("\nBenchmarking the fused jamo analyser...")
+    word_list = list(load_words('ko'))
+    rng = random.Random(0)
+    runs = [w[:rng.randint(2, len(w))] for w in rng.sample(word_list, 20000)]
+    
+    def separate():
+        for run in runs:
+            is_valid_syllable_pattern(run)
+            compose_word(run)
+            count_syllables(run)
+    
+    _, separate_s = timed(separate)
+    _, fused_s = timed(lambda: [analyze_jamos(run) for run in runs])
+    print(f"  {len(runs)} runs | pattern + compose + count {separate_s / len(runs) * 1e6:.2f} us | "
+          f"analyze_jamos {fused_s / len(runs) * 1e6:.2f} us")
+    
+    # Words built tile by tile on an empty board: every placement checks both
+    # directions, the last one finalizes the word (debug log output and refills muted)
+    room, player, restore = _korean_room(word_list)
+    room.draw_tiles_for_player = MagicMock(return_value=[])
+    placed = rng.sample([w for w in word_list if 4 <= len(w) <= 10], 2000)
+    
+    async def scenario():
+        times = []
+        for word in placed:
+            room.board.clear()
+            room.pending_tiles.clear()
+            room.group_cursors.clear()
+            for x, jamo in enumerate(word):
+                player.hand = [jamo] + [None] * 9
+                start = time.perf_counter()
+                ok, err = await room.handle_place_tile(x, 0, jamo, "p1")
+                times.append(time.perf_counter() - start)
+                assert ok, err
+            for task in room.group_timers.values():
+                task.cancel()
+            assert len(room.board) == len(word), word
+        return times
+    
+    logging.disable(logging.DEBUG)
+    try:
+        times = asyncio.run(scenario())
+    finally:
+        logging.disable(logging.NOTSET)
+        restore()
+    times.sort()
+    print(f"  {len(times)} Korean placements ({len(placed)} words) | mean {sum(times) / len(times) * 1e6:.0f} us | "
+          f"p50 {times[len(times) // 2] * 1e6:.0f} us | p99 {times[int(len(times) * 0.99)] * 1e6:.0f} us")
+
+def benchmark_incremental_parse():
+    """Per-tile cost of checking a growing Korean run: full re-analysis vs. one parse step."""
+    from bench_words import load_words, timed
+    
+    print("\nBenchmarking incremental syllable parses...")
+    word_list = list(load_words('ko'))
+    rng = random.Random(0)
+    for length in (8, 16, 32, 64):
+        # Long runs: dictionary words laid end to end
+        runs = []
+        for _ in range(500):
+            run = ''
+            while len(run) < length:
+                run += rng.choice(word_list)
+            runs.append(run[:length])
+        
+        def reanalyse():
+            for run in runs:
+                for i in range(1, length + 1):
+                    analyze_jamos(run[:i])
+        
+        def parse_steps():
+            for run in runs:
+                parse = SyllableParse(run[0])
+                for jamo in run[1:]:
+                    parse = parse.appended(jamo)
+        
+        _, full_s = timed(reanalyse)
+        _, step_s = timed(parse_steps)
+        tiles = len(runs) * length
+        print(f"  {length:>2}-jamo runs | re-analyse {full_s / tiles * 1e6:5.2f} us/tile | "
+              f"parse step {step_s / tiles * 1e6:5.2f} us/tile")
+
+def benchmark_jamo_throughput():
+    """compose_word / decompose_word throughput over the whole Korean word list."""
+    from bench_words import load_words, timed
+    
+    print("\nBenchmarking jamo conversion throughput...")
+    jamo_words = list(load_words('ko'))
+    _, compose_s = timed(lambda: [compose_word(w) for w in jamo_words])
+    composed = [compose_word(w) for w in jamo_words]
+    _, decompose_s = timed(lambda: [decompose_word(w) for w in composed])
+    assert [decompose_word(w) for w in composed] == jamo_words
+    for name, seconds in (("compose_word", compose_s), ("decompose_word", decompose_s)):
+        print(f"  {name:<15} {len(jamo_words)} words in {seconds * 1000:6.1f} ms | "
+              f"{len(jamo_words) / seconds / 1000:6.0f}k words/s | {seconds / len(jamo_words) * 1e6:.2f} us/word")
+
 if __name__ == "__main__":
     print("=" * 50)
     print("Korean Jamo Utilities Test Suite")
@@ -126,6 +345,15 @@ if __name__ == "__main__":
     test_word_composition()
     test_pattern_validation()
     test_roundtrip()
+    test_syllable_tables()
+    test_analyze_jamos()
+    test_syllable_parse()
+    test_room_korean_words()
+    
+    if "--bench" in sys.argv:
+        benchmark_jamo_throughput()
+        benchmark_fused_analysis()
+        benchmark_incremental_parse()
     
     print("\n" + "=" * 50)
     print("✨ All tests passed!")
@@ -0,0 +1,247 @@
+"""
+Test the compact, columnar word cache (CompactLexicon)
+"""
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.lexicon import CompactLexicon, LengthSampler, build_perfect_hash
+from core.words import get_word_in_cache, get_random_word
+
+WORDS = {
+    'en': {"CAT": (3, 3), "CATS": (4, 4), "ACT": (3, 3), "CARING": (6, 8), "TO": (2, 2)},
+    'ko': {"ㅅㅏㄱㅘ": (4, 4), "ㅅㅏㄹㅏㅁ": (5, 5), "ㅎㅏㄴㄱㅡㄹ": (6, 6)},
+}
+
+
+def test_lexicon_matches_dict():
+    print("Testing CompactLexicon lookups...")
+    for lang, table in WORDS.items():
+        lexicon = CompactLexicon.build(table)
+        assert len(lexicon) == len(table)
+        assert lexicon == table, f"{lang}: mapping mismatch"
+        for word, value in table.items():
+            assert word in lexicon and lexicon[word] == value and lexicon.get(word) == value
+        for miss in ["", "CA", "CATSS", "cat", "ㅅㅏ", "사과", "XYZZY"]:
+            assert miss not in lexicon and lexicon.get(miss) is None, miss
+        try:
+            lexicon["DOG"]
+            assert False, "missing word must raise KeyError"
+        except KeyError:
+            pass
+    print("✓ CompactLexicon lookups passed!")
+
+
+def test_get_word_in_cache_unchanged():
+    """get_word_in_cache returns exactly what the dict cache returned."""
+    print("\nTesting get_word_in_cache on CompactLexicon...")
+    saved = words.word_cache
+    try:
+        expected = {}
+        for cache in (WORDS, {lang: CompactLexicon.build(t) for lang, t in WORDS.items()}):
+            words.word_cache = cache
+            results = [get_word_in_cache(w, lang)
+                       for lang in ('en', 'ko', 'fr')
+                       for w in ["cat", "CARING", "dog", "ㅅㅏㄱㅘ", "ㅅㅏㄱ", ""]]
+            expected.setdefault('results', results)
+            assert results == expected['results']
+    finally:
+        words.word_cache = saved
+    print("✓ get_word_in_cache results unchanged!")
+
+
+def test_by_length_views():
+    print("\nTesting by-length views...")
+    lexicon = CompactLexicon.build(WORDS['en'])
+    by_length = lexicon.by_length()
+    assert sorted(by_length) == [2, 3, 4, 6]
+    assert list(by_length[3]) == ["ACT", "CAT"]
+    assert by_length[3][-1] == "CAT" and by_length[3][0:1] == ["ACT"]
+    assert len(by_length[6]) == 1
+    print("✓ By-length views passed!")
+
+
+def test_perfect_hash_is_near_minimal():
+    print("\nTesting perfect hash...")
+    keys = [f"W{i}".encode() for i in range(5000)]
+    disp, slots = build_perfect_hash(keys)
+    assert len(keys) <= len(slots) < len(keys) + 50, "table is the next prime size"
+    rows = sorted(row for row in slots if row != 0xFFFFFFFF)
+    assert rows == list(range(len(keys))), "every key has exactly one slot"
+
+    empty = CompactLexicon.build({})
+    assert len(empty) == 0 and "A" not in empty and empty.by_length() == {}
+    print("✓ Perfect hash passed!")
+
+
+def test_length_sampler():
+    print("\nTesting LengthSampler...")
+    import random
+    buckets = {2: ["AB", "CD"], 3: ["EFG"], 5: [], 7: ["HIJKLMN", "OPQRSTU", "VWXYZAB"]}
+    sampler = LengthSampler(buckets)
+    rng = random.Random(1)
+    assert sampler.sample(3, 3, rng) == "EFG"
+    assert sampler.sample(4, 6, rng) is None and sampler.sample(8, None, rng) is None
+    assert sampler.sample(5, 5, rng) is None, "empty buckets are skipped"
+
+    counts = {}
+    for _ in range(6000):
+        word = sampler.sample(2, 7, rng)
+        counts[word] = counts.get(word, 0) + 1
+    assert sorted(counts) == sorted(w for ws in buckets.values() for w in ws)
+    assert all(800 < c < 1200 for c in counts.values()), f"not uniform over words: {counts}"
+    print("✓ LengthSampler passed!")
+
+
+def test_get_random_word_bounds():
+    """Same eligibility rules as the list-building implementation."""
+    print("\nTesting get_random_word bounds...")
+    saved = words.word_cache, words.words_by_length
+    try:
+        table = {"AB": (2, 1), "ABCDEF": (6, 1), "ABCDEFGHIJ": (10, 1), "ABCDEFGHIJKL": (12, 1)}
+        lexicon = CompactLexicon.build(table)
+        words.word_cache = {'en': lexicon}
+        words.words_by_length = {'en': lexicon.by_length()}
+        for _ in range(50):
+            assert get_random_word(exact_length=10) == "ABCDEFGHIJ"
+            assert get_random_word(min_length=6, max_length=10) in ("ABCDEF", "ABCDEFGHIJ")
+            assert get_random_word(min_length=11) == "ABCDEFGHIJKL"
+            assert get_random_word() != "AB"
+        assert get_random_word(exact_length=9) is None
+        assert get_random_word(min_length=13) is None
+        assert get_random_word(lang='ko') is None
+
+        # Plain dict-of-lists indexes (as tests install them) work too
+        words.words_by_length = {'en': {4: ["WORD"]}}
+        assert get_random_word(min_length=3) == "WORD"
+    finally:
+        words.word_cache, words.words_by_length = saved
+    print("✓ get_random_word bounds passed!")
+
+
+def benchmark_lexicon():
+    """Resident memory and lookup latency: dict cache + length lists vs CompactLexicon."""
+    import random
+    from bench_words import load_words, timed, traced
+
+    print("\nBenchmarking CompactLexicon vs dict word_cache...")
+    for lang in ("en", "ko"):
+        source = load_words(lang)
+        rows = [(word.encode('utf-8'), length, score) for word, (length, score) in source.items()]
+
+        # Both sides decode fresh strings/tuples from row data, as load_words_to_memory does
+        def build_dict():
+            cache, by_length = {}, {}
+            for raw, length, score in rows:
+                word = raw.decode('utf-8')
+                cache[word] = (length, score)
+                by_length.setdefault(length, []).append(word)
+            return cache, by_length
+
+        def build_lexicon():
+            return CompactLexicon.build({raw.decode('utf-8'): (length, score) for raw, length, score in rows})
+
+        (cache, _), dict_bytes, _ = traced(build_dict)
+        lexicon, lexicon_bytes, _ = traced(build_lexicon)
+        _, build_s = timed(lambda: CompactLexicon.build(source))
+
+        rng = random.Random(0)
+        hits = rng.sample(list(source), 50000)
+        misses = [w[::-1] + w[0] for w in hits]
+        for name, queries in (("hit", hits), ("miss", misses)):
+            _, dict_s = timed(lambda: [cache.get(w) for w in queries])
+            _, lex_s = timed(lambda: [lexicon.get(w) for w in queries])
+            if name == "hit":
+                print(f"  {lang}: {len(source)} words | dict + lists {dict_bytes / 1e6:.1f} MB, "
+                      f"lexicon {lexicon_bytes / 1e6:.1f} MB ({dict_bytes / lexicon_bytes:.1f}x smaller), "
+                      f"build {build_s:.2f}s")
+            print(f"      {name}: dict {dict_s / len(queries) * 1e9:.0f} ns, "
+                  f"lexicon {lex_s / len(queries) * 1e9:.0f} ns per lookup")
+
+
+def benchmark_room_starts(rooms: int = 1000, players: int = 4):
+    """1,000 rooms starting at once: starting words + a 10-letter hand per player."""
+    import random
+    from unittest.mock import MagicMock
+    import core.game as game
+    from bench_words import load_words, timed
+
+    def list_get_random_word(min_length=6, max_length=None, exact_length=None, lang='en', snapshot=None):
+        # Previous implementation: materialise every eligible word per call
+        lang_words = words.words_by_length.get(lang, {})
+        if exact_length:
+            eligible_words = lang_words.get(exact_length, [])
+        else:
+            eligible_words = []
+            for l in lang_words:
+                if l >= min_length and (not max_length or l <= max_length):
+                    eligible_words.extend(lang_words[l])
+        return random.choice(eligible_words) if eligible_words else None
+
+    print(f"\nBenchmarking {rooms} rooms x {players} players starting at once...")
+    saved = words.word_cache, words.words_by_length
+    try:
+        for lang in ("en", "ko"):
+            table = load_words(lang)
+            lexicon = CompactLexicon.build(table)
+            words.word_cache = {lang: lexicon}
+            lists = {}
+            for word, (length, _) in table.items():
+                lists.setdefault(length, []).append(word)
+
+            def start_rooms():
+                for r in range(rooms):
+                    room = game.GameRoom(f"BENCH{r}")
+                    room.settings["lang"] = lang
+                    for p in range(players):
+                        room.add_player(game.Player(f"p{p}", f"P{p}", MagicMock()))
+                    room.start_match()
+
+            results = {}
+            for name, index, sampler_fn in (("old", lists, list_get_random_word),
+                                            ("new", lexicon.by_length(), get_random_word)):
+                spent = [0.0, 0]
+
+                def timed_sampler(*args, _fn=sampler_fn, **kwargs):
+                    word, seconds = timed(_fn, *args, **kwargs)
+                    spent[0] += seconds
+                    spent[1] += 1
+                    return word
+
+                words.words_by_length = {lang: index}
+                game.get_random_word = timed_sampler
+                _, total = timed(start_rooms)
+                results[name] = (total, spent[0], spent[1])
+            game.get_random_word = get_random_word
+
+            (old_total, old_s, calls), (new_total, new_s, _) = results["old"], results["new"]
+            print(f"  {lang}: {len(table)} words, {calls} get_random_word calls | "
+                  f"list-building {old_s * 1000:.0f} ms ({old_s / calls * 1e6:.0f} us/call), "
+                  f"sampler {new_s * 1000:.0f} ms ({new_s / calls * 1e6:.1f} us/call) | "
+                  f"start_match total {old_total:.2f}s -> {new_total:.2f}s")
+    finally:
+        words.word_cache, words.words_by_length = saved
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Compact Lexicon Test Suite")
+    print("=" * 50)
+
+    test_lexicon_matches_dict()
+    test_get_word_in_cache_unchanged()
+    test_by_length_views()
+    test_perfect_hash_is_near_minimal()
+    test_length_sampler()
+    test_get_random_word_bounds()
+
+    if "--bench" in sys.argv:
+        benchmark_lexicon()
+        benchmark_room_starts()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,237 @@
+"""
+Test wildcard pattern search over the trie engines
+"""
+import asyncio
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.double_array_trie import BidirectionalTrie
+from core.pattern_search import PatternSearch, walks_reversed
+
+WORDS = ["CAT", "CATS", "COT", "CUT", "CUTE", "ACT", "SCAT", "CAST", "C", "AT", "TACT", "CC"]
+PATTERNS = ["C?T*", "C*", "*T", "*A*", "?", "*", "C?T", "**T*S", "X*", "*C*C*", "CAT"]
+
+
+def _brute_force(word_list, pattern):
+    regex = re.compile(re.escape(pattern).replace(r'\?', '.').replace(r'\*', '.*') + '$')
+    return sorted(word for word in set(word_list) if regex.match(word))
+
+
+def _matches(search):
+    return [word for word in search.iter_words() if word is not None]
+
+
+def test_matches_linear_scan():
+    print("Testing pattern search against a linear scan...")
+    for engine in ("dict", "double_array", "dawg"):
+        trie = BidirectionalTrie(engine=engine)
+        trie.build(WORDS)
+        for pattern in PATTERNS:
+            expected = _brute_force(WORDS, pattern)
+            assert _matches(PatternSearch(trie.forward_trie, pattern)) == expected, (engine, pattern)
+
+            # after= resumes strictly after any word, listed or not
+            for after in expected + ["CA", "B", "CAZ"]:
+                got = _matches(PatternSearch(trie.forward_trie, pattern, after=after))
+                assert got == [word for word in expected if word > after], (engine, pattern, after)
+
+            # Reversed walk: same words, ordered (and resumed) by the reversed word
+            by_reverse = sorted(expected, key=lambda word: word[::-1])
+            reverse = PatternSearch(trie.reverse_trie, pattern[::-1], reverse=True)
+            assert _matches(reverse) == by_reverse, (engine, pattern)
+            for word in by_reverse:
+                got = _matches(PatternSearch(trie.reverse_trie, pattern[::-1], after=word[::-1], reverse=True))
+                assert got == [w for w in by_reverse if w[::-1] > word[::-1]], (engine, pattern, word)
+    print("✓ Pattern search matches the linear scan!")
+
+
+def test_korean_pattern():
+    print("\nTesting Korean patterns...")
+    saved = words.word_trie
+    trie = BidirectionalTrie(engine='double_array')
+    trie.build(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ", "ㅅㅏ", "ㅎㅏㄴㄱㅡㄹ"])
+    words.word_trie = {'ko': trie}
+    try:
+        # Syllables are decomposed; wildcards match single jamo
+        assert _matches(words.pattern_search("사*", 'ko')) == ["ㅅㅏ", "ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ"]
+        assert _matches(words.pattern_search("사??", 'ko')) == ["ㅅㅏㄱㅘ"]
+        assert _matches(words.pattern_search("*ㄱ*", 'ko')) == ["ㅅㅏㄱㅘ", "ㅎㅏㄴㄱㅡㄹ"]
+        assert _matches(words.pattern_search("*과", 'ko')) == ["ㅅㅏㄱㅘ"]
+        assert words.pattern_search("*", 'en') is None, "language not loaded"
+    finally:
+        words.word_trie = saved
+    print("✓ Korean patterns passed!")
+
+
+def test_limits_and_resume(budget: float = 0.02):
+    """Pages cut by the result limit or the time budget resume from their cursor."""
+    print("\nTesting result/time limits...")
+    from bench_words import load_words
+
+    trie = BidirectionalTrie(engine='double_array')
+    word_list = list(load_words('en'))[:30000]
+    trie.build(word_list)
+    expected = _brute_force(word_list, "*E?S")
+
+    async def collect(limit, time_budget):
+        found, pages, cursor, stops = [], 0, None, set()
+        while True:
+            search = PatternSearch(trie.forward_trie, "*E?S", after=cursor)
+            found += [word async for word in search.stream(limit, time_budget)]
+            pages += 1
+            stops.add(search.stopped)
+            if search.stopped is None:
+                return found, pages, stops
+            cursor = search.cursor
+
+    found, pages, stops = asyncio.run(collect(50, 10.0))
+    assert found == expected and 'limit' in stops and pages > 1
+    found, pages, stops = asyncio.run(collect(10 ** 6, budget))
+    assert found == expected and 'time' in stops, (pages, stops)
+    print(f"  {len(expected)} matches: resumed over {pages} time-limited pages")
+    print("✓ Limits and resume passed!")
+
+
+def test_event_loop_stays_responsive(bound: float = 0.05):
+    """A whole-dictionary query yields the loop between slices."""
+    print("\nTesting event loop responsiveness during a heavy query...")
+    from bench_words import load_words
+
+    trie = BidirectionalTrie(engine='double_array')
+    trie.build(list(load_words('en')))
+
+    async def scenario():
+        gaps = []
+        done = False
+
+        async def ticker():
+            last = time.perf_counter()
+            while not done:
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        task = asyncio.create_task(ticker())
+        search = PatternSearch(trie.forward_trie, "*Q*Z*")
+        found = [word async for word in search.stream(10 ** 6, 10.0)]
+        done = True
+        await task
+        return found, gaps, search
+
+    found, gaps, search = asyncio.run(scenario())
+    assert search.stopped is None and search.visited > 100000
+    worst = max(gaps)
+    print(f"  {search.visited} nodes, {len(found)} matches, worst loop gap {worst * 1000:.1f} ms")
+    assert worst < bound, f"loop blocked for {worst * 1000:.0f} ms"
+    print("✓ Event loop stayed responsive!")
+
+
+def _import_routes():
+    """api.routes with the real core modules, even if another test module stubbed some in sys.modules."""
+    stubs = {name: module for name, module in sys.modules.items()
+             if name.startswith('core.') and not getattr(module, '__file__', None)}
+    for name in stubs:
+        del sys.modules[name]
+    try:
+        import api.admin as admin
+        import api.routes as routes
+    finally:
+        sys.modules.update(stubs)
+    return admin, routes
+
+
+def test_search_words_route():
+    print("\nTesting /search_words...")
+    from fastapi import HTTPException
+
+    admin, routes = _import_routes()
+
+    saved = words.word_trie, admin.ADMIN_TOKEN
+    trie = BidirectionalTrie(engine='double_array')
+    trie.build(WORDS)
+    words.word_trie, admin.ADMIN_TOKEN = {'en': trie}, "secret"
+
+    async def call(**kwargs):
+        response = await routes.search_words(x_admin_token="secret", **kwargs)
+        return [json.loads(line) async for line in response.body_iterator]
+
+    try:
+        lines = asyncio.run(call(pattern="c*", limit=3))
+        assert [line["word"] for line in lines[:-1]] == ["C", "CAST", "CAT"]
+        assert lines[-1] == {"done": False, "stopped": "limit", "next": "CAT"}
+        lines = asyncio.run(call(pattern="c*", after="CAT"))
+        assert [line["word"] for line in lines[:-1]] == ["CATS", "CC", "COT", "CUT", "CUTE"]
+        assert lines[-1]["done"] and lines[-1]["next"] is None
+
+        # End-anchored: reverse trie order, cursor passed back unchanged
+        lines = asyncio.run(call(pattern="*t", limit=4))
+        assert [line["word"] for line in lines[:-1]] == ["AT", "CAT", "SCAT", "ACT"]
+        lines = asyncio.run(call(pattern="*t", after=lines[-1]["next"]))
+        assert [line["word"] for line in lines[:-1]] == ["TACT", "COT", "CAST", "CUT"]
+
+        for kwargs, status in (({"pattern": ""}, 400), ({"pattern": "*", "lang": "ko"}, 503)):
+            try:
+                asyncio.run(call(**kwargs))
+                assert False, "should fail"
+            except HTTPException as e:
+                assert e.status_code == status
+        try:
+            asyncio.run(routes.search_words(pattern="*", x_admin_token="wrong"))
+            assert False, "needs the admin token"
+        except HTTPException as e:
+            assert e.status_code == 403
+    finally:
+        words.word_trie, admin.ADMIN_TOKEN = saved
+    print("✓ /search_words passed!")
+
+
+def benchmark_pattern_search():
+    """Trie walk vs a linear regex scan over word_cache, on the real word lists."""
+    from bench_words import load_words, timed
+
+    print("\nBenchmarking pattern search...")
+    cases = {'en': ["C?T*", "QU*", "*ING", "??X??", "*Q*Z*", "S*S"],
+             'ko': ["ㅅㅏ*", "*ㄱㅘ", "ㅎ?ㄴ*", "??", "*ㅋ*ㅋ*"]}
+    for lang, patterns in cases.items():
+        word_list = list(load_words(lang))
+        trie = BidirectionalTrie(engine='double_array')
+        trie.build(word_list)
+        for pattern in patterns:
+            reverse = walks_reversed(pattern)
+            if reverse:
+                search = PatternSearch(trie.reverse_trie, pattern[::-1], reverse=True)
+            else:
+                search = PatternSearch(trie.forward_trie, pattern)
+            found, walk_s = timed(_matches, search)
+            expected, scan_s = timed(_brute_force, word_list, pattern)
+            assert sorted(found) == expected
+            print(f"  {lang} {pattern:<8} {len(found):>6} matches | trie {walk_s * 1000:7.1f} ms "
+                  f"({search.visited:>6} nodes{', reversed' if reverse else ''}) | "
+                  f"linear scan {scan_s * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Pattern Search Test Suite")
+    print("=" * 50)
+
+    test_matches_linear_scan()
+    test_korean_pattern()
+    test_limits_and_resume()
+    test_event_loop_stays_responsive()
+    test_search_words_route()
+
+    if "--bench" in sys.argv:
+        benchmark_pattern_search()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
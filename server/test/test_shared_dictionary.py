@@ -0,0 +1,174 @@
+"""
+Test sharing DB-built dictionaries across worker processes (SHARED_DICTIONARY_DIR)
+"""
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.words import load_language
+
+ROWS = {'en': {"CARING": (6, 8), "CARE": (4, 4), "SCARE": (5, 5), "TO": (2, 2)}}
+
+
+def _patch(shared_dir, rows):
+    """Serve rows from a fake DB, publish into shared_dir; returns (saved, build counter)."""
+    saved = {name: getattr(words, name) for name in
+             ('_fetch_rows_by_lang', '_run_build_worker', 'SHARED_DICTIONARY_DIR', 'DICTIONARY_BUILD_MODE')}
+    builds = []
+    real_worker = words._run_build_worker
+
+    async def fetch(lang=None):
+        return {l: r for l, r in rows.items() if lang in (None, l)}
+
+    def counting_worker(*args):
+        builds.append(args[0])
+        return real_worker(*args)
+
+    words._fetch_rows_by_lang = fetch
+    words._run_build_worker = counting_worker
+    words.SHARED_DICTIONARY_DIR = Path(shared_dir)
+    words.DICTIONARY_BUILD_MODE = 'process'
+    return saved, builds
+
+
+def _restore(saved):
+    for name, value in saved.items():
+        setattr(words, name, value)
+
+
+def test_workers_share_one_build():
+    print("Testing shared dictionary publication...")
+    with tempfile.TemporaryDirectory() as shared_dir:
+        saved, builds = _patch(shared_dir, ROWS)
+        fingerprint = {'en': [4, 1]}
+        try:
+            # Two loaders at once (as two workers would): one builds, the other waits and maps
+            async def two_workers():
+                return await asyncio.gather(load_language('en', fingerprint), load_language('en', fingerprint))
+
+            first, second = asyncio.run(two_workers())
+            assert builds == ['en'], builds
+            for parts in (first, second):
+                assert dict(parts['lexicon']) == ROWS['en']
+                assert parts['factors'].is_factor("ARIN") and not parts['factors'].is_factor("XA")
+                assert isinstance(parts['lexicon'].blob, memoryview)
+            assert (Path(shared_dir) / "yeet-dictionary-en.bin").exists()
+
+            # A later worker attaches without building
+            asyncio.run(load_language('en', fingerprint))
+            assert builds == ['en']
+
+            # The DB changed: the shared file is rebuilt once for the new fingerprint
+            ROWS['en']["SCARY"] = (5, 6)
+            parts = asyncio.run(load_language('en', {'en': [5, 2]}))
+            assert builds == ['en', 'en'] and parts['lexicon'].get("SCARY") == (5, 6)
+        finally:
+            ROWS['en'].pop("SCARY", None)
+            _restore(saved)
+    print("✓ Shared dictionary publication passed!")
+
+
+def test_private_build_without_fingerprint():
+    """Without a DB fingerprint the shared file cannot be validated, so nothing is published."""
+    print("\nTesting private build fallback...")
+    with tempfile.TemporaryDirectory() as shared_dir:
+        saved, builds = _patch(shared_dir, ROWS)
+        try:
+            parts = asyncio.run(load_language('en', None))
+            assert dict(parts['lexicon']) == ROWS['en']
+            assert builds == ['en'] and not any(Path(shared_dir).glob("*.bin"))
+        finally:
+            _restore(saved)
+    print("✓ Private build fallback passed!")
+
+
+def _smaps_rollup() -> dict:
+    with open('/proc/self/smaps_rollup') as f:
+        fields = dict(line.split(':', 1) for line in f if ':' in line and line[0].isupper())
+    return {key: int(fields[key].split()[0]) * 1024 for key in ('Rss', 'Pss')}
+
+
+def _bench_worker(mode, shared_dir, fingerprint, barrier, results):
+    """One worker process: load both languages, touch every page, report memory."""
+    import hashlib
+    from core.dictionary_artifact import DictionaryArtifact, open_artifact
+
+    words.SHARED_DICTIONARY_DIR = Path(shared_dir)
+    words.DICTIONARY_BUILD_MODE = 'process'
+    held = []
+    for lang in fingerprint:
+        path = Path(shared_dir) / f"yeet-dictionary-{lang}.bin"
+        if mode == 'shared':
+            # Same entry point as warm-up; the file is already published, so this only maps it
+            parts = asyncio.run(load_language(lang, fingerprint))
+        elif mode == 'private':
+            # What a per-worker build holds: the same arrays in process-private memory
+            mapped = open_artifact(path)
+            artifact = DictionaryArtifact(path, bytearray(mapped._mmap), mapped.manifest, mapped._payload_start)
+            mapped._view.release()
+            mapped._mmap.close()
+            parts = words._language_from_artifact(artifact, lang)
+        else:
+            continue
+        hashlib.sha256(parts['lexicon'].blob.obj)  # fault in every page of the backing buffer
+        held.append(parts)
+    barrier.wait()  # measure with every worker alive
+    results.put((mode, _smaps_rollup()))
+    barrier.wait()
+
+
+def benchmark_worker_memory(worker_counts=(1, 4, 16)):
+    """RSS/PSS per worker: private per-worker dictionaries vs one shared mapping."""
+    import multiprocessing
+    from bench_words import load_words
+
+    print("\nBenchmarking dictionary memory per worker...")
+    rows = {lang: load_words(lang) for lang in ("en", "ko")}
+    fingerprint = {lang: [len(r), 0] for lang, r in rows.items()}
+    ctx = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(dir=words.SHARED_DICTIONARY_DIR) as shared_dir:
+        saved, _ = _patch(shared_dir, rows)
+        try:
+            for lang in rows:
+                asyncio.run(load_language(lang, fingerprint))
+            size = sum(p.stat().st_size for p in Path(shared_dir).glob("*.bin"))
+            print(f"  shared artifacts: {size / 1e6:.1f} MB in {shared_dir}")
+
+            for count in worker_counts:
+                line = []
+                for mode in ('none', 'private', 'shared'):
+                    barrier, results = ctx.Barrier(count), ctx.Queue()
+                    procs = [ctx.Process(target=_bench_worker, args=(mode, shared_dir, fingerprint, barrier, results))
+                             for _ in range(count)]
+                    for proc in procs:
+                        proc.start()
+                    stats = [results.get()[1] for _ in procs]
+                    for proc in procs:
+                        proc.join()
+                    rss = sum(s['Rss'] for s in stats) / count / 1e6
+                    pss = sum(s['Pss'] for s in stats) / count / 1e6
+                    line.append(f"{mode} RSS {rss:.0f} / PSS {pss:.0f} MB")
+                print(f"  {count:2d} workers (per worker): " + " | ".join(line))
+        finally:
+            _restore(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Shared Dictionary Test Suite")
+    print("=" * 50)
+
+    test_workers_share_one_build()
+    test_private_build_without_fingerprint()
+
+    if "--bench" in sys.argv:
+        benchmark_worker_memory()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
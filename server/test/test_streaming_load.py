@@ -0,0 +1,191 @@
+"""
+Test streaming the dictionary table through a server-side cursor
+"""
+import asyncio
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+
+
+def _real_database():
+    """core.database, even if another test module swapped it for a mock in sys.modules."""
+    module = sys.modules.get('core.database')
+    if isinstance(module, types.ModuleType):
+        return module
+    spec = importlib.util.spec_from_file_location(
+        'core.database', Path(__file__).parent.parent / 'core' / 'database.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+database = _real_database()
+
+TABLE = [
+    ("CAT", "en", 3, 3), ("CATS", "en", 4, 4), ("AT", "en", 2, 2), ("ACT", "en", 3, 3),
+    ("ㅅㅏㄱㅘ", "ko", 4, 4), ("ㄱㅏ", "ko", 2, 2), ("ㅎㅏㄴㄱㅡㄹ", "ko", 6, 7),
+]
+
+
+class FakeRecord:
+    """Name-indexed row like asyncpg.Record; values are decoded fresh, as the driver does."""
+
+    __slots__ = ('_values',)
+    _INDEX = {'word': 0, 'lang': 1, 'length': 2, 'score': 3}
+
+    def __init__(self, raw):
+        word, lang, length, score = raw
+        self._values = (word.encode('utf-8').decode('utf-8'), lang, length, score)
+
+    def __getitem__(self, key):
+        return self._values[self._INDEX[key]]
+
+
+class FakeConnection:
+    """The slice of asyncpg.Connection the dictionary loaders use."""
+
+    def __init__(self, table):
+        self.table = table
+        self.prefetch = None
+        self.in_transaction = False
+
+    def _rows(self, args):
+        return (row for row in self.table if not args or row[1] == args[0])
+
+    async def fetch(self, query, *args):
+        return [FakeRecord(row) for row in self._rows(args)]
+
+    def transaction(self):
+        connection = self
+
+        class Transaction:
+            async def __aenter__(self):
+                connection.in_transaction = True
+
+            async def __aexit__(self, *exc):
+                connection.in_transaction = False
+
+        return Transaction()
+
+    def cursor(self, query, *args, prefetch=None):
+        assert self.in_transaction, "asyncpg cursors need a transaction"
+        self.prefetch = prefetch
+
+        async def stream():
+            for row in self._rows(args):
+                yield FakeRecord(row)
+
+        return stream()
+
+    async def close(self):
+        pass
+
+
+async def fetch_all_rows(conn, lang=None):
+    """The previous loader: conn.fetch() every Record, then build the dicts."""
+    if lang is None:
+        rows = await conn.fetch("SELECT word, lang, length, score FROM dictionary")
+    else:
+        rows = await conn.fetch("SELECT word, lang, length, score FROM dictionary WHERE lang = $1", lang)
+    rows_by_lang = {}
+    for row in rows:
+        rows_by_lang.setdefault(row['lang'], {})[row['word']] = (row['length'], row['score'])
+    return rows_by_lang
+
+
+def _use_table(table):
+    saved = database.get_db_connection, words.iter_dictionary_rows
+    connections = []
+
+    async def connect():
+        connections.append(FakeConnection(table))
+        return connections[-1]
+
+    database.get_db_connection = connect
+    words.iter_dictionary_rows = database.iter_dictionary_rows
+    return saved, connections
+
+
+def _restore(saved):
+    database.get_db_connection, words.iter_dictionary_rows = saved
+
+
+def test_streamed_rows_match_fetch():
+    print("Testing streamed dictionary load...")
+    saved, connections = _use_table(TABLE)
+    try:
+        for lang in (None, 'en', 'ko', 'fr'):
+            expected = asyncio.run(fetch_all_rows(FakeConnection(TABLE), lang))
+            streamed = asyncio.run(words._fetch_rows_by_lang(lang))
+            assert streamed == expected, (lang, streamed, expected)
+            assert connections[-1].prefetch and not connections[-1].in_transaction
+        assert list(asyncio.run(words._fetch_rows_by_lang('en'))['en']) == ["CAT", "CATS", "AT", "ACT"], \
+            "row order is kept"
+    finally:
+        _restore(saved)
+    print("✓ Streamed dictionary load passed!")
+
+
+def test_streamed_load_builds_same_snapshot():
+    print("\nTesting snapshot built from streamed rows...")
+    saved, _ = _use_table(TABLE)
+    try:
+        old = words.build_snapshot(asyncio.run(fetch_all_rows(FakeConnection(TABLE))), 1)
+        new = words.build_snapshot(asyncio.run(words._fetch_rows_by_lang()), 1)
+    finally:
+        _restore(saved)
+    for lang in ('en', 'ko'):
+        assert dict(new.word_cache[lang]) == dict(old.word_cache[lang])
+        assert {l: list(b) for l, b in new.words_by_length[lang].items()} == \
+               {l: list(b) for l, b in old.words_by_length[lang].items()}
+        assert new.word_cache[lang].to_buffers()[1]['blob'] == old.word_cache[lang].to_buffers()[1]['blob']
+    print("✓ Streamed snapshot matches!")
+
+
+def benchmark_load_peak_memory():
+    """Peak traced memory of reading the table: fetch() of all Records vs the cursor stream."""
+    from bench_words import load_words, traced
+
+    print("\nBenchmarking dictionary table load memory...")
+    table = [(word, lang, length, score)
+             for lang in ("en", "ko")
+             for word, (length, score) in load_words(lang).items()]
+    saved, _ = _use_table(table)
+    try:
+        old, old_kept, old_peak = traced(lambda: asyncio.run(fetch_all_rows(FakeConnection(table))))
+        new, new_kept, new_peak = traced(lambda: asyncio.run(words._fetch_rows_by_lang()))
+        assert new == old
+        print(f"  {len(table)} rows | fetch(): peak {old_peak / 1e6:.1f} MB, result {old_kept / 1e6:.1f} MB | "
+              f"cursor stream: peak {new_peak / 1e6:.1f} MB, result {new_kept / 1e6:.1f} MB "
+              f"({old_peak / new_peak:.1f}x lower peak)")
+        del old, new
+
+        # Whole load for one language: reading plus building every structure
+        en_table = [row for row in table if row[1] == 'en']
+        _, _, old_total = traced(lambda: words.build_snapshot(asyncio.run(fetch_all_rows(FakeConnection(en_table))), 1))
+        _, _, new_total = traced(lambda: words.build_snapshot(asyncio.run(words._fetch_rows_by_lang('en')), 1))
+        print(f"  en load + build: peak {old_total / 1e6:.1f} MB -> {new_total / 1e6:.1f} MB")
+    finally:
+        _restore(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Streaming Dictionary Load Test Suite")
+    print("=" * 50)
+
+    test_streamed_rows_match_fetch()
+    test_streamed_load_builds_same_snapshot()
+
+    if "--bench" in sys.argv:
+        benchmark_load_peak_memory()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
@@ -0,0 +1,185 @@
+"""
+Test per-room word list overlays (allow/deny) on top of the shared dictionary
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.words import FactorCursor, build_language_index, get_word_in_cache, has_valid_prefix, validate_words
+from core.word_overlay import WordOverlay
+import core.game as game
+from core.game import GameRoom, Player
+from word_fixtures import install_words, restore_words
+
+WORDS = ["CARING", "CARE", "SCARE", "RACING", "TO", "AT", "CAT"]
+
+
+def test_allow_overlay():
+    print("Testing allow-list overlay...")
+    saved = install_words(WORDS)
+    try:
+        overlay = WordOverlay(["pikachu", " Zubat ", ""], mode='allow')
+        assert overlay.words == {"PIKACHU", "ZUBAT"}
+
+        assert get_word_in_cache("pikachu", overlay=overlay) == {"is_valid": True, "word": "PIKACHU",
+                                                                 "length": 7, "score": 7}
+        assert not get_word_in_cache("pikachu")["is_valid"], "base lexicon is untouched"
+        assert get_word_in_cache("care", overlay=overlay)["is_valid"], "base words stay valid"
+        assert validate_words(["zubat", "CAT", "ZUBA"], overlay=overlay) == [(5, 5), (3, 3), None]
+
+        # Runs inside added words pass the early check, directly and through cursors
+        for run, expected in [("KAC", True), ("ZUB", True), ("ACI", True), ("QZ", False)]:
+            assert has_valid_prefix(run, overlay=overlay) == expected, run
+            cursor = FactorCursor(run[0], overlay=overlay)
+            for char in run[1:]:
+                cursor = cursor.appended(char)
+            assert cursor.is_valid == expected, run
+        assert not has_valid_prefix("KAC"), "base check unchanged without the overlay"
+        assert has_valid_prefix("UB?T", overlay=overlay), "blanks work in the delta automaton too"
+
+        pending = WordOverlay(["zubat"], build=False)
+        assert pending.is_factor("QZ"), "permissive until the delta automaton is built"
+        pending.build_factors()
+        assert not pending.is_factor("QZ") and pending.is_factor("UBA")
+    finally:
+        restore_words(saved)
+    print("✓ Allow-list overlay passed!")
+
+
+def test_deny_overlay():
+    print("\nTesting deny-list overlay...")
+    saved = install_words(WORDS)
+    try:
+        overlay = WordOverlay(["care", "at"], mode='deny')
+        assert not get_word_in_cache("CARE", overlay=overlay)["is_valid"]
+        assert get_word_in_cache("SCARE", overlay=overlay)["is_valid"]
+        assert validate_words(["care", "cat", "at"], overlay=overlay) == [None, (3, 3), None]
+        assert has_valid_prefix("CAR", overlay=overlay), "substrings of other words still pass"
+        try:
+            WordOverlay(["x"], mode='only')
+            assert False, "unknown mode"
+        except ValueError:
+            pass
+    finally:
+        restore_words(saved)
+
+    saved = install_words(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ"], lang='ko')
+    try:
+        overlay = WordOverlay(["사과"], mode='deny', lang='ko')
+        assert overlay.words == {"ㅅㅏㄱㅘ"}, "Korean words are stored as jamo"
+        assert validate_words(["ㅅㅏㄱㅘ", "ㅅㅏㄹㅏㅁ"], 'ko', overlay=overlay) == [None, (5, 5)]
+    finally:
+        restore_words(saved)
+    print("✓ Deny-list overlay passed!")
+
+
+def test_room_word_list_setting():
+    """UPDATE_SETTINGS attaches the overlay; the room's validation goes through it."""
+    print("\nTesting the room word_list setting...")
+    saved = install_words(WORDS)
+
+    async def scenario():
+        room = GameRoom("TEST_OVERLAY")
+        room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+        room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+        player = Player("p1", "TestPlayer", MagicMock())
+        room.add_player(player)
+        player.hand = list("ZUBATC")
+
+        room.update_settings({"mode": "blitz", "word_list": {"mode": "allow", "words": ["zubat"]}})
+        assert room.settings["word_list"] == {"mode": "allow", "count": 1}
+        assert room.settings["mode"] == "blitz" and room.word_overlay is not None
+        await room.word_list_build  # delta automaton builds off the loop
+        assert room.word_overlay.is_factor("UBA") and not room.word_overlay.is_factor("QZ")
+
+        try:
+            for x, letter in enumerate("ZUBAT"):
+                ok, err = await room.handle_place_tile(x, 0, letter, "p1")
+                assert ok, err
+                assert any(t['x'] == x for t in room.pending_tiles) or (x, 0) in room.board, \
+                    f"'{letter}' exploded: overlay runs must pass the early check"
+            assert (4, 0) in room.board, "ZUBAT completes through the overlay"
+        finally:
+            for task in room.group_timers.values():
+                task.cancel()
+
+        room.update_settings({"word_list": {"mode": "deny", "words": ["cat", "at"]}})
+        assert room.word_overlay.mode == "deny" and room.settings["word_list"]["count"] == 2
+        room.update_settings({"word_list": {"mode": "bogus", "words": ["x"]}})
+        assert room.word_overlay.mode == "deny", "invalid lists are ignored"
+        room.update_settings({"lang": "ko"})
+        assert room.word_overlay is None and "word_list" not in room.settings, "dropped on language change"
+        room.update_settings({"word_list": {"mode": "deny", "words": ["사과"]}})
+        room.update_settings({"word_list": None})
+        assert room.word_overlay is None
+
+        # A failed build is logged, not left as an unretrieved future exception
+        with patch.object(WordOverlay, "build_factors", side_effect=MemoryError), \
+                patch.object(game.logger, "error") as error:
+            room.update_settings({"lang": "en", "word_list": {"mode": "allow", "words": ["zubat"]}})
+            try:
+                await room.word_list_build
+            except MemoryError:
+                pass
+            await asyncio.sleep(0)  # done callbacks run on the next loop iteration
+        assert error.call_count == 1 and "build failed" in error.call_args.args[0], error.call_args_list
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        restore_words(saved)
+    print("✓ Room word_list setting passed!")
+
+
+def benchmark_overlay_memory():
+    """Per-room memory of allow/deny overlays of 100, 10k and 100k words vs the shared base."""
+    import random
+    from bench_words import load_words, timed, traced
+
+    print("\nBenchmarking per-room overlay memory...")
+    for lang in ("en", "ko"):
+        word_list = list(load_words(lang))
+        saved = install_words(word_list, lang)
+        try:
+            base = build_language_index(lang, word_list, engine='double_array')
+            base_bytes = base['trie'].memory_usage() + base['factors'].memory_usage() + \
+                base['reverse_factors'].memory_usage()
+            rng = random.Random(0)
+            # Themed lists: words the base does not have (reversed base words)
+            extra = [w[::-1] for w in word_list if w[::-1] not in words.word_cache[lang]]
+            for size in (100, 10000, 100000):
+                for mode, source in (("allow", extra), ("deny", word_list)):
+                    picked = rng.sample(source, min(size, len(source)))
+                    overlay, build_s = timed(WordOverlay, picked, mode, lang)
+                    _, retained, _ = traced(WordOverlay, picked, mode, lang)
+                    probes = picked[:1000]
+                    _, lookup_s = timed(validate_words, probes, lang, overlay=overlay)
+                    print(f"  {lang} {mode:<5} {len(picked):>6} words | build {build_s * 1000:7.1f} ms | "
+                          f"{overlay.memory_usage() / 1e6:6.2f} MB ({retained / 1e6:6.2f} MB traced) | "
+                          f"{overlay.memory_usage() / base_bytes:6.1%} of shared arrays | "
+                          f"validate_words {lookup_s / len(probes) * 1e6:.2f} us/word")
+            print(f"  {lang} shared base arrays: {base_bytes / 1e6:.1f} MB ({len(word_list)} words)")
+        finally:
+            restore_words(saved)
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Word Overlay Test Suite")
+    print("=" * 50)
+
+    test_allow_overlay()
+    test_deny_overlay()
+    test_room_word_list_setting()
+
+    if "--bench" in sys.argv:
+        benchmark_overlay_memory()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
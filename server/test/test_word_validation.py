@@ -0,0 +1,173 @@
+"""
+Test batch word validation (validate_words) and its use when finalizing groups
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+import core.game as game
+from core.game import GameRoom, Player
+from core.lexicon import CompactLexicon
+from core.words import validate_words, get_word_in_cache
+
+WORDS = {
+    'en': {"CAT": (3, 3), "AT": (2, 2), "TA": (2, 2), "CATS": (4, 4), "ACT": (3, 3)},
+    'ko': {"ㅅㅏㄱㅘ": (4, 4), "ㄱㅏ": (2, 2)},
+}
+
+
+def _install(table):
+    saved = words.word_cache
+    words.word_cache = {lang: CompactLexicon.build(t) for lang, t in table.items()}
+    return saved
+
+
+def test_validate_words_matches_get_word_in_cache():
+    print("Testing validate_words...")
+    saved = _install(WORDS)
+    try:
+        batch = ["cat", "CAT", "dog", "at", "cat", "", "Cats"]
+        results = validate_words(batch, 'en')
+        assert len(results) == len(batch)
+        for word, entry in zip(batch, results):
+            expected = get_word_in_cache(word, 'en')
+            assert (entry is not None) == expected["is_valid"], word
+            if entry is not None:
+                assert entry == (expected["length"], expected["score"])
+
+        assert validate_words(["ㅅㅏㄱㅘ", "ㅅㅏㄱ", "ㅅㅏㄱㅘ"], 'ko') == [(4, 4), None, (4, 4)]
+        # Syllable input is keyed by its jamo, like get_word_in_cache; order follows the input
+        batch = ["사과", "ㄱㅏ", "사", "가", "사ㄱㅘ"]
+        assert validate_words(batch, 'ko') == [(4, 4), (2, 2), None, (2, 2), (4, 4)]
+        for word, entry in zip(batch, validate_words(batch, 'ko')):
+            assert (entry is not None) == get_word_in_cache(word, 'ko')["is_valid"], word
+        assert validate_words(["CAT"], 'fr') == [None]
+        assert validate_words([], 'en') == []
+    finally:
+        words.word_cache = saved
+    print("✓ validate_words passed!")
+
+
+def _room_with_crossings(lang='en'):
+    """Pending 'CAT' on row 0, one vertical group per tile."""
+    room = GameRoom("TEST_VALIDATE")
+    room.settings["lang"] = lang
+    room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+    room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+    player = Player("p1", "TestPlayer", MagicMock())
+    room.add_player(player)
+    player.hand = [None] * 10
+    for x, letter in enumerate("CAT"):
+        room.pending_tiles.append({'x': x, 'y': 0, 'letter': letter, 'player_id': 'p1', 'color': '#fff',
+                                   'h_group_id': 'g', 'v_group_id': f'v{x}', 'hand_index': None})
+    return room
+
+
+def test_finalize_checks_cross_words_in_batch():
+    print("\nTesting finalize with cross words...")
+    saved = _install(WORDS)
+
+    async def scenario():
+        # Valid: 'CAT' with 'TA' crossing at A (T above A) -> finalized
+        room = _room_with_crossings()
+        room.board[(1, -1)] = {'x': 1, 'y': -1, 'letter': 'T', 'color': '#000'}
+        await room.finalize_pending_group('g', 'h')
+        assert all((x, 0) in room.board for x in range(3)), "CAT + TA should finalize"
+        assert room.pending_tiles == []
+
+        # Invalid cross word: 'CAT' with 'XA' crossing at A -> rejected, tiles removed
+        room = _room_with_crossings()
+        room.board[(1, -1)] = {'x': 1, 'y': -1, 'letter': 'X', 'color': '#000'}
+        await room.finalize_pending_group('g', 'h')
+        assert not any((x, 0) in room.board for x in range(3)), "XA is not a word"
+        assert room.pending_tiles == []
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        words.word_cache = saved
+    print("✓ Finalize cross word tests passed!")
+
+
+def benchmark_validations_per_second(iterations: int = 2000, length: int = 12):
+    """finalize_pending_group on a pending word crossing a board word at every tile."""
+    import time
+    from bench_words import load_words
+
+    def per_word_lookups(batch, lang='en', snapshot=None, overlay=None):
+        # Previous behaviour: one get_word_in_cache call (dict + debug log) per string
+        results = []
+        for word in batch:
+            result = get_word_in_cache(word, lang=lang, snapshot=snapshot, overlay=overlay)
+            results.append((result["length"], result["score"]) if result["is_valid"] else None)
+        return results
+
+    print(f"\nBenchmarking finalize with {length} crossings per word...")
+    table = dict(load_words('en'))
+    main = ("AT" * length)[:length]
+    table[main] = (length, length)
+    table.update({"XA": (2, 2), "XT": (2, 2)})
+    saved = _install({'en': table})
+
+    def make_room():
+        room = GameRoom("BENCH")
+        room.broadcast = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+        room.broadcast_state = MagicMock(side_effect=lambda: asyncio.sleep(0))
+        for x, letter in enumerate(main):
+            room.board[(x, -1)] = {'x': x, 'y': -1, 'letter': 'X', 'color': '#000'}
+            room.pending_tiles.append({'x': x, 'y': 0, 'letter': letter, 'player_id': 'nobody',
+                                       'color': '#fff', 'h_group_id': 'g', 'v_group_id': f'v{x}'})
+        return room
+
+    async def run(validator):
+        spent = [0.0]
+
+        def timed_validator(batch, lang='en', snapshot=None, overlay=None):
+            start = time.perf_counter()
+            result = validator(batch, lang, snapshot=snapshot, overlay=overlay)
+            spent[0] += time.perf_counter() - start
+            return result
+
+        game.validate_words = timed_validator
+        rooms = [make_room() for _ in range(iterations)]
+        start = time.perf_counter()
+        for room in rooms:
+            await room.finalize_pending_group('g', 'h')
+        elapsed = time.perf_counter() - start
+        assert all((0, 0) in room.board for room in rooms)
+        return elapsed, spent[0]
+
+    try:
+        results = {
+            "per-word get_word_in_cache": asyncio.run(run(per_word_lookups)),
+            "validate_words batch": asyncio.run(run(validate_words)),
+        }
+    finally:
+        game.validate_words = validate_words
+        words.word_cache = saved
+
+    checks = iterations * (1 + length)
+    for name, (total, lookups) in results.items():
+        print(f"  {name:27s}: {checks / lookups / 1e3:.0f}k validations/s in lookups, "
+              f"{total / iterations * 1e6:.0f} us per finalize")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Word Validation Test Suite")
+    print("=" * 50)
+
+    test_validate_words_matches_get_word_in_cache()
+    test_finalize_checks_cross_words_in_batch()
+
+    if "--bench" in sys.argv:
+        benchmark_validations_per_second()
+
+    print("\n" + "=" * 50)
+    print("✨ All tests passed!")
+    print("=" * 50)
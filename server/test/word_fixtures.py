@@ -0,0 +1,34 @@
+"""
+Test helpers: install a small word list as the current dictionary.
+
+install_words() replaces the validation globals of core.words with
+structures built from the given list, and restore_words() puts the
+previous ones back, so every global a test touches is restored even if
+the test only set some of them.
+"""
+import sys
+from pathlib import Path
+
+# Add server directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.words as words
+from core.words import build_language_index
+
+_GLOBALS = ('word_cache', 'word_trie', 'word_factors', 'word_factors_reverse')
+
+
+def install_words(word_list, lang='en'):
+    """Install validation structures for lang; returns the previous globals."""
+    saved = tuple(getattr(words, name) for name in _GLOBALS)
+    index = build_language_index(lang, word_list, engine='double_array')
+    words.word_cache = {lang: {w: (len(w), len(w)) for w in word_list}}
+    words.word_trie = {lang: index['trie']}
+    words.word_factors = {lang: index['factors']}
+    words.word_factors_reverse = {lang: index['reverse_factors']}
+    return saved
+
+
+def restore_words(saved):
+    for name, value in zip(_GLOBALS, saved):
+        setattr(words, name, value)
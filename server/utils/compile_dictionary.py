@@ -0,0 +1,53 @@
+"""
+Compile the `dictionary` table into a memory-mappable artifact.
+
+Run after utils/seed.py (or any other change to the dictionary table):
+
+    python -m utils.compile_dictionary [--output PATH]
+
+The server mmaps the artifact at startup instead of building word caches
+and tries from the DB; it falls back to the DB when the artifact is
+missing, corrupt, or its fingerprint no longer matches the table.
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from core.config import DICTIONARY_ARTIFACT_PATH, TRIE_ENGINES
+from core.database import get_dictionary_fingerprint, iter_dictionary_rows
+from core.dictionary_artifact import SERIALIZABLE_ENGINES, write_artifact
+from core.logging_config import get_logger
+from core.words import build_language_index, collect_rows_by_lang
+
+logger = get_logger(__name__)
+
+
+async def compile_dictionary(output: Path = DICTIONARY_ARTIFACT_PATH) -> int:
+    start = time.perf_counter()
+    fingerprint = await get_dictionary_fingerprint()
+    if fingerprint is None:
+        raise RuntimeError("Could not fingerprint the dictionary table")
+
+    words = await collect_rows_by_lang(iter_dictionary_rows())
+
+    languages = {}
+    for lang, lang_words in words.items():
+        # The configured engine if it can be written, else the double array
+        engine = TRIE_ENGINES.get(lang)
+        if engine not in SERIALIZABLE_ENGINES:
+            engine = 'double_array'
+        languages[lang] = build_language_index(lang, list(lang_words.keys()), engine=engine)
+        languages[lang]['words'] = lang_words
+
+    size = write_artifact(output, languages, fingerprint)
+    logger.info(f"Compiled {sum(len(w) for w in words.values())} words into {output} "
+                f"({size / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+    return size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the dictionary table into an mmap artifact")
+    parser.add_argument("--output", type=Path, default=DICTIONARY_ARTIFACT_PATH,
+                        help=f"artifact path (default: {DICTIONARY_ARTIFACT_PATH})")
+    args = parser.parse_args()
+    asyncio.run(compile_dictionary(args.output))
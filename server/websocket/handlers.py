@@ -58,7 +58,8 @@ async def handle_websocket(ws: WebSocket):
                         "type": "GAME_START_COUNTDOWN", 
                         "seconds": countdown_seconds
                     })
-                    await asyncio.sleep(countdown_seconds + 0.5)
+                    # Countdown doubles as warm-up time if the room's language is still loading
+                    await asyncio.gather(asyncio.sleep(countdown_seconds + 0.5), room.wait_for_dictionary())
                     room.start_match()
                     await room.broadcast({"type": "GAME_STARTED"})
                     room.start_global_timer(room.DURATION_MAP.get(room.settings["mode"], 300))
@@ -121,7 +122,7 @@ async def handle_websocket(ws: WebSocket):
                 # Broadcast new settings to all players in lobby
                 await room.broadcast({
                     "type": "SETTINGS_UPDATED",
-                    "settings": data["settings"]
+                    "settings": room.settings  # word lists are summarised, not echoed back
                 })
                     
             elif data["type"] == "END_GAME":